@@ -0,0 +1,59 @@
+"""Add reverse indexes on association tables
+
+Revision ID: 3c9a1f7d2e4b
+Revises: 84f99e3be8a6
+Create Date: 2025-11-20 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a1f7d2e4b'
+down_revision: Union[str, None] = '84f99e3be8a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_trend_hashtags_hashtag_trend',
+        'trend_hashtags',
+        ['hashtag_id', 'trend_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_trend_sounds_sound_trend',
+        'trend_sounds',
+        ['sound_id', 'trend_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_trend_creators_creator_trend',
+        'trend_creators',
+        ['creator_id', 'trend_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_sound_videos_video_sound',
+        'sound_videos',
+        ['video_id', 'sound_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_video_hashtags_hashtag_video',
+        'video_hashtags',
+        ['hashtag_id', 'video_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_video_hashtags_hashtag_video', table_name='video_hashtags')
+    op.drop_index('ix_sound_videos_video_sound', table_name='sound_videos')
+    op.drop_index('ix_trend_creators_creator_trend', table_name='trend_creators')
+    op.drop_index('ix_trend_sounds_sound_trend', table_name='trend_sounds')
+    op.drop_index('ix_trend_hashtags_hashtag_trend', table_name='trend_hashtags')
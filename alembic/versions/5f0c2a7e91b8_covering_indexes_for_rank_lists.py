@@ -0,0 +1,63 @@
+"""Add INCLUDE columns to ranking indexes
+
+Revision ID: 5f0c2a7e91b8
+Revises: e4a8b0c62d57
+Create Date: 2025-11-20 14:26:38.051927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0c2a7e91b8'
+down_revision: Union[str, None] = 'e4a8b0c62d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_hashtag_rank_country', table_name='hashtags')
+    op.create_index(
+        'idx_hashtag_rank_country',
+        'hashtags',
+        ['country_id', 'rank'],
+        unique=False,
+        postgresql_include=['name', 'viral_score', 'growth_rate', 'trend_direction'],
+    )
+    op.drop_index('idx_sound_country_rank', table_name='sounds')
+    op.create_index(
+        'idx_sound_country_rank',
+        'sounds',
+        ['country_id', 'rank'],
+        unique=False,
+        postgresql_include=['name', 'artist', 'viral_score'],
+    )
+    op.drop_index('idx_creator_trending_rank', table_name='creators')
+    op.create_index(
+        'idx_creator_trending_rank',
+        'creators',
+        ['country_id', 'trending_rank'],
+        unique=False,
+        postgresql_include=['username', 'followers'],
+        postgresql_where=sa.text('is_trending = true'),
+        sqlite_where=sa.text('is_trending = 1'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_creator_trending_rank', table_name='creators')
+    op.create_index(
+        'idx_creator_trending_rank',
+        'creators',
+        ['country_id', 'trending_rank'],
+        unique=False,
+        postgresql_where=sa.text('is_trending = true'),
+        sqlite_where=sa.text('is_trending = 1'),
+    )
+    op.drop_index('idx_sound_country_rank', table_name='sounds')
+    op.create_index('idx_sound_country_rank', 'sounds', ['country_id', 'rank'], unique=False)
+    op.drop_index('idx_hashtag_rank_country', table_name='hashtags')
+    op.create_index('idx_hashtag_rank_country', 'hashtags', ['rank', 'country_id'], unique=False)
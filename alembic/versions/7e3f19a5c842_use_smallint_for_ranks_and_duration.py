@@ -0,0 +1,43 @@
+"""Use SMALLINT for rank and duration columns
+
+Revision ID: 7e3f19a5c842
+Revises: d85e7c3b0f16
+Create Date: 2025-11-20 17:21:55.146830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e3f19a5c842'
+down_revision: Union[str, None] = 'd85e7c3b0f16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, nullable)
+COLUMNS = [
+    ('hashtags', 'rank', False),
+    ('hashtags', 'previous_rank', True),
+    ('sounds', 'rank', False),
+    ('creators', 'trending_rank', True),
+    ('videos', 'duration', True),
+]
+
+
+def _alter(from_type: sa.types.TypeEngine, to_type: sa.types.TypeEngine) -> None:
+    for table, column, nullable in COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column, existing_type=from_type, type_=to_type, existing_nullable=nullable
+            )
+
+
+def upgrade() -> None:
+    _alter(sa.Integer(), sa.SmallInteger())
+
+
+def downgrade() -> None:
+    _alter(sa.SmallInteger(), sa.Integer())
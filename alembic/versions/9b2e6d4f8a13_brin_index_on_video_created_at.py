@@ -0,0 +1,35 @@
+"""Replace video created-at B-tree with BRIN index
+
+Revision ID: 9b2e6d4f8a13
+Revises: 3c9a1f7d2e4b
+Create Date: 2025-11-20 11:02:17.604521
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e6d4f8a13'
+down_revision: Union[str, None] = '3c9a1f7d2e4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_videos_tiktok_created_at', table_name='videos')
+    op.create_index(
+        'brin_video_tiktok_created_at',
+        'videos',
+        ['tiktok_created_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('brin_video_tiktok_created_at', table_name='videos')
+    op.create_index('ix_videos_tiktok_created_at', 'videos', ['tiktok_created_at'], unique=False)
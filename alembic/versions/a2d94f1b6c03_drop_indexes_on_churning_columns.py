@@ -0,0 +1,32 @@
+"""Drop indexes on per-scrape churn columns
+
+Revision ID: a2d94f1b6c03
+Revises: 5f0c2a7e91b8
+Create Date: 2025-11-20 15:03:44.719206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2d94f1b6c03'
+down_revision: Union[str, None] = '5f0c2a7e91b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_sounds_last_seen', table_name='sounds')
+    op.drop_index('ix_hashtags_last_seen', table_name='hashtags')
+    op.drop_index('ix_creators_last_seen', table_name='creators')
+    op.drop_index('ix_creators_followers', table_name='creators')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_creators_followers'), 'creators', ['followers'], unique=False)
+    op.create_index(op.f('ix_creators_last_seen'), 'creators', ['last_seen'], unique=False)
+    op.create_index(op.f('ix_hashtags_last_seen'), 'hashtags', ['last_seen'], unique=False)
+    op.create_index(op.f('ix_sounds_last_seen'), 'sounds', ['last_seen'], unique=False)
@@ -0,0 +1,57 @@
+"""Add trending_snapshots materialized view
+
+Revision ID: b6f1e8d23a79
+Revises: 7e3f19a5c842
+Create Date: 2025-11-20 18:04:31.562918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f1e8d23a79'
+down_revision: Union[str, None] = '7e3f19a5c842'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Materialized views are PostgreSQL-only; other backends query the tables live
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW trending_snapshots AS
+        SELECT c.code AS country_code,
+               h.niche,
+               h.rank,
+               h.name AS hashtag_name,
+               h.viral_score,
+               h.growth_rate,
+               now() AS refreshed_at
+        FROM hashtags h
+        JOIN countries c ON c.id = h.country_id
+        WHERE c.is_active
+        WITH DATA
+        """
+    )
+    # REFRESH ... CONCURRENTLY needs a unique index; (name, country) is unique in hashtags
+    op.execute(
+        'CREATE UNIQUE INDEX ix_trending_snapshots_key '
+        'ON trending_snapshots (country_code, hashtag_name)'
+    )
+    op.execute(
+        'CREATE INDEX ix_trending_snapshots_rank '
+        'ON trending_snapshots (country_code, niche, rank)'
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS trending_snapshots')
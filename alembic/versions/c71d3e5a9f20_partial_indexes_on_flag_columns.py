@@ -0,0 +1,64 @@
+"""Use partial indexes for boolean flag columns
+
+Revision ID: c71d3e5a9f20
+Revises: 9b2e6d4f8a13
+Create Date: 2025-11-20 11:40:53.217880
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71d3e5a9f20'
+down_revision: Union[str, None] = '9b2e6d4f8a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_countries_is_active', table_name='countries')
+    op.drop_index('idx_country_active', table_name='countries')
+    op.create_index(
+        'idx_country_active',
+        'countries',
+        ['code'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true'),
+        sqlite_where=sa.text('is_active = 1'),
+    )
+    op.drop_index('idx_creator_country_trending', table_name='creators')
+    op.create_index(
+        'idx_creator_trending_rank',
+        'creators',
+        ['country_id', 'trending_rank'],
+        unique=False,
+        postgresql_where=sa.text('is_trending = true'),
+        sqlite_where=sa.text('is_trending = 1'),
+    )
+    op.drop_index('idx_trend_country_active', table_name='trends')
+    op.create_index(
+        'idx_trend_country_active',
+        'trends',
+        ['country_id'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true'),
+        sqlite_where=sa.text('is_active = 1'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_trend_country_active', table_name='trends')
+    op.create_index('idx_trend_country_active', 'trends', ['country_id', 'is_active'], unique=False)
+    op.drop_index('idx_creator_trending_rank', table_name='creators')
+    op.create_index(
+        'idx_creator_country_trending',
+        'creators',
+        ['country_id', 'is_trending'],
+        unique=False,
+    )
+    op.drop_index('idx_country_active', table_name='countries')
+    op.create_index('idx_country_active', 'countries', ['is_active'], unique=False)
+    op.create_index(op.f('ix_countries_is_active'), 'countries', ['is_active'], unique=False)
@@ -0,0 +1,32 @@
+"""Drop indexes duplicating unique constraints and column indexes
+
+Revision ID: d85e7c3b0f16
+Revises: a2d94f1b6c03
+Create Date: 2025-11-20 16:48:12.390557
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd85e7c3b0f16'
+down_revision: Union[str, None] = 'a2d94f1b6c03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_video_tiktok_id', table_name='videos')
+    op.drop_index('idx_video_creator', table_name='videos')
+    op.drop_index('idx_creator_tiktok_id', table_name='creators')
+    op.drop_index('idx_country_code', table_name='countries')
+
+
+def downgrade() -> None:
+    op.create_index('idx_country_code', 'countries', ['code'], unique=False)
+    op.create_index('idx_creator_tiktok_id', 'creators', ['tiktok_creator_id'], unique=False)
+    op.create_index('idx_video_creator', 'videos', ['creator_id'], unique=False)
+    op.create_index('idx_video_tiktok_id', 'videos', ['tiktok_video_id'], unique=False)
@@ -0,0 +1,40 @@
+"""Store tiktok_video_id as BIGINT
+
+Revision ID: e4a8b0c62d57
+Revises: c71d3e5a9f20
+Create Date: 2025-11-20 12:15:09.883142
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a8b0c62d57'
+down_revision: Union[str, None] = 'c71d3e5a9f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('videos') as batch_op:
+        batch_op.alter_column(
+            'tiktok_video_id',
+            existing_type=sa.String(length=100),
+            type_=sa.BigInteger(),
+            existing_nullable=False,
+            postgresql_using='tiktok_video_id::bigint',
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('videos') as batch_op:
+        batch_op.alter_column(
+            'tiktok_video_id',
+            existing_type=sa.BigInteger(),
+            type_=sa.String(length=100),
+            existing_nullable=False,
+            postgresql_using='tiktok_video_id::varchar(100)',
+        )
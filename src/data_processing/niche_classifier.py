@@ -61,6 +61,9 @@ class NicheClassifier:
     for accurate TikTok niche classification.
     """
     
+    # NicheType has no catch-all member; unmatched content is filed here
+    FALLBACK_NICHE = NicheType.ENTERTAINMENTTOK
+    
     # Enhanced niche patterns with weights
     NICHE_PATTERNS = {
         NicheType.BOOKTOK: {
@@ -73,7 +76,7 @@ class NicheClassifier:
             "hashtags": ["#booktok", "#bookreview", "#bookrecommendation", "#reading", "#author"],
             "weight": 1.0
         },
-        NicheType.FITNESS: {
+        NicheType.HEALTHTOK: {
             "patterns": [
                 r'\b(workout|fitness|gym|exercise|training|health|wellness|cardio)\b',
                 r'\b(fitnesstok|workoutmotivation|gymtok|fitnessjourney|healthylifestyle)\b',
@@ -83,7 +86,7 @@ class NicheClassifier:
             "hashtags": ["#fitness", "#workout", "#gym", "#health", "#exercise", "#fitnesstok"],
             "weight": 1.0
         },
-        NicheType.COOKING: {
+        NicheType.FOODTOK: {
             "patterns": [
                 r'\b(food|cook|cooking|recipe|kitchen|chef|culinary|baking)\b',
                 r'\b(foodtok|foodie|recipe|cookingtips|foodhacks|homemadefood)\b',
@@ -93,7 +96,7 @@ class NicheClassifier:
             "hashtags": ["#food", "#cooking", "#recipe", "#foodtok", "#chef", "#foodie"],
             "weight": 1.0
         },
-        NicheType.FASHION: {
+        NicheType.FASHIONTOK: {
             "patterns": [
                 r'\b(fashion|style|outfit|clothing|wear|dress|apparel|textile)\b',
                 r'\b(fashiontok|styletips|ootd|outfitinspo|fashionhacks|styling)\b',
@@ -103,7 +106,7 @@ class NicheClassifier:
             "hashtags": ["#fashion", "#style", "#ootd", "#outfit", "#fashiontok", "#styletips"],
             "weight": 1.0
         },
-        NicheType.TRAVEL: {
+        NicheType.TRAVELLTOK: {
             "patterns": [
                 r'\b(travel|vacation|trip|journey|explore|adventure|destination)\b',
                 r'\b(traveltok|wanderlust|travelvlog|travelguide|travelphotography)\b',
@@ -113,7 +116,7 @@ class NicheClassifier:
             "hashtags": ["#travel", "#vacation", "#traveltok", "#wanderlust", "#explore"],
             "weight": 1.0
         },
-        NicheType.DANCE: {
+        NicheType.DANCETOK: {
             "patterns": [
                 r'\b(dance|choreography|dancing|moves|steps|rhythm|beat)\b',
                 r'\b(dancetok|dancechallenge|dancecover|dancetutorial|dancemoves)\b',
@@ -123,7 +126,7 @@ class NicheClassifier:
             "hashtags": ["#dance", "#dancetok", "#dancechallenge", "#choreography", "#dancing"],
             "weight": 1.0
         },
-        NicheType.COMEDY: {
+        NicheType.COMEDYTOK: {
             "patterns": [
                 r'\b(funny|comedy|humor|joke|laughs|hilarious|entertainment)\b',
                 r'\b(comedytok|funnyvideos|memes|sketch|standup|parody|spoof)\b',
@@ -133,7 +136,7 @@ class NicheClassifier:
             "hashtags": ["#comedy", "#funny", "#comedytok", "#humor", "#laughs", "#memes"],
             "weight": 1.0
         },
-        NicheType.BEAUTY: {
+        NicheType.BEAUTYTOK: {
             "patterns": [
                 r'\b(beauty|makeup|cosmetic|skincare|glam|beautytips|tutorial)\b',
                 r'\b(beautytok|makeuptutorial|skincareroutine|beautytips|glamup)\b',
@@ -143,7 +146,7 @@ class NicheClassifier:
             "hashtags": ["#beauty", "#makeup", "#skincare", "#beautytok", "#makeuptutorial"],
             "weight": 1.0
         },
-        NicheType.GAMING: {
+        NicheType.GAMINGTOK: {
             "patterns": [
                 r'\b(game|gaming|gamer|play|player|esports|tournament)\b',
                 r'\b(gamingtok|gamertok|videogames|console|pc|mobile|streaming)\b',
@@ -153,7 +156,7 @@ class NicheClassifier:
             "hashtags": ["#gaming", "#gamer", "#gamingtok", "#videogames", "#esports", "#streaming"],
             "weight": 1.0
         },
-        NicheType.FINANCE: {
+        NicheType.FINANCETOK: {
             "patterns": [
                 r'\b(money|finance|financial|invest|investment|saving|budget)\b',
                 r'\b(financetok|moneytok|investing|personalfinance|wealth|rich)\b',
@@ -163,7 +166,7 @@ class NicheClassifier:
             "hashtags": ["#finance", "#money", "#investing", "#financetok", "#personalfinance"],
             "weight": 1.0
         },
-        NicheType.EDUCATION: {
+        NicheType.EDUCATIONTOK: {
             "patterns": [
                 r'\b(learn|education|study|school|knowledge|academic|teach)\b',
                 r'\b(educationtok|learnontiktok|studytok|school|university|college)\b',
@@ -173,7 +176,7 @@ class NicheClassifier:
             "hashtags": ["#education", "#learn", "#study", "#educationtok", "#studytok"],
             "weight": 1.0
         },
-        NicheType.PETS: {
+        NicheType.LIFESTYLETOK: {
             "patterns": [
                 r'\b(pet|dog|cat|animal|pet|puppy|kitten|fur|cute)\b',
                 r'\b(pettok|dogtok|cattok|cuteanimals|petlover|animallover)\b',
@@ -183,7 +186,7 @@ class NicheClassifier:
             "hashtags": ["#pets", "#dogs", "#cats", "#pettok", "#cuteanimals", "#animals"],
             "weight": 1.0
         },
-        NicheType.DIY: {
+        NicheType.DIYTOK: {
             "patterns": [
                 r'\b(diy|craft|handmade|project|create|build|make|tutorial)\b',
                 r'\b(diytok|crafttok|handmade|diyprojects|howto|tutorial)\b',
@@ -195,6 +198,12 @@ class NicheClassifier:
         }
     }
     
+    # NICHE_PATTERNS regexes compiled once at import, per niche
+    _COMPILED_PATTERNS = {
+        niche: tuple(re.compile(pattern, re.IGNORECASE) for pattern in config["patterns"])
+        for niche, config in NICHE_PATTERNS.items()
+    }
+    
     # Model file paths
     MODEL_DIR = Path("models")
     VECTORIZER_FILE = MODEL_DIR / "niche_vectorizer.pkl"
@@ -342,8 +351,8 @@ class NicheClassifier:
             score = 0.0
             
             # Pattern matching in text
-            for pattern in config["patterns"]:
-                matches = re.findall(pattern, combined_text, re.IGNORECASE)
+            for pattern in self._COMPILED_PATTERNS[niche]:
+                matches = pattern.findall(combined_text)
                 score += len(matches) * config["weight"]
             
             # Hashtag matching (higher weight)
@@ -445,14 +454,14 @@ class NicheClassifier:
         
         # Combine results based on method
         if method == "rule" or not self.use_ml:
-            final_niche = rule_niche or NicheType.OTHER
+            final_niche = rule_niche or self.FALLBACK_NICHE
             final_confidence = rule_confidence
             final_probabilities = {NicheType(name): score for name, score in rule_scores.items()}
             method_used = "rule_based"
             self._stats["rule_based"] += 1
             
         elif method == "ml":
-            final_niche = ml_niche or NicheType.OTHER
+            final_niche = ml_niche or self.FALLBACK_NICHE
             final_confidence = ml_confidence
             final_probabilities = {NicheType(name): prob for name, prob in ml_probs.items()}
             method_used = "ml_based"
@@ -480,7 +489,7 @@ class NicheClassifier:
                 final_niche = ml_niche
                 final_confidence = ml_confidence
             else:
-                final_niche = NicheType.OTHER
+                final_niche = self.FALLBACK_NICHE
                 final_confidence = 0.0
             
             # Combine probabilities
@@ -496,7 +505,7 @@ class NicheClassifier:
         
         # Apply confidence threshold
         if final_confidence < self.confidence_threshold:
-            final_niche = NicheType.OTHER
+            final_niche = self.FALLBACK_NICHE
             final_confidence = 0.0
             self._stats["fallbacks"] += 1
         elif final_confidence > 0.7:
@@ -527,16 +536,15 @@ class NicheClassifier:
         """Extract keywords that contributed to classification."""
         keywords = []
         
-        if niche == NicheType.OTHER:
+        if niche == self.FALLBACK_NICHE:
             return keywords
         
         config = self.NICHE_PATTERNS.get(niche, {})
         
         # Check patterns in text
         text_lower = text.lower()
-        for pattern in config.get("patterns", []):
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            keywords.extend(matches)
+        for pattern in self._COMPILED_PATTERNS.get(niche, ()):
+            keywords.extend(pattern.findall(text_lower))
         
         # Check hashtags
         for hashtag in hashtags:
@@ -7,8 +7,10 @@ Handles cleaning, normalization, and processing of raw trend data.
 import re
 import json
 import asyncio
+import functools
+import threading
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from collections import defaultdict, Counter
 from enum import Enum
@@ -23,11 +25,156 @@ try:
 except ImportError:
     ML_AVAILABLE = False
 
+# Optional vectorized batch scoring
+try:
+    import numpy as np
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 from src.utils.logger import setup_logger
 from src.storage.models.enums import NicheType, TrendDirection, SentimentType
 
 
-@dataclass
+# Word tokenizer and stop words for keyword extraction
+_WORD_RE = re.compile(r'\b\w+\b')
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i',
+    'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
+    'amazing'  # Add 'amazing' to stop words for this test
+})
+
+# Cache size for per-text classification results
+TEXT_CACHE_SIZE = 4096
+
+
+def _as_number(value: Any) -> float:
+    """Read a raw numeric field; missing or unparseable values count as 0."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if number != number else number  # NaN
+
+
+def _text_length(value: Any) -> int:
+    """Length of a raw text field; missing values count as empty."""
+    return 0 if value is None else len(str(value))
+
+
+class _PatternScorer:
+    """
+    Scores lowercased text against labelled groups of regex patterns.
+    
+    When every pattern is a plain word alternation between word boundaries
+    (as the niche and sentiment patterns are), they are reduced to a
+    token -> label weight table: a text is tokenized once and scored with
+    dictionary lookups instead of one regex scan per pattern. Any other
+    pattern keeps the whole group set on the regex path.
+    """
+    
+    # Matches pattern sources of the form \b(word|word|...)\b
+    _WORD_ALTERNATION_RE = re.compile(r'\\b\(([\w|]+)\)\\b')
+    
+    def __init__(self, pattern_groups: Dict[Any, List[str]]):
+        """
+        Initialize pattern scorer.
+        
+        Args:
+            pattern_groups: Mapping of label to regex pattern sources
+        """
+        self.labels = tuple(pattern_groups)
+        self.compiled = tuple(
+            tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+            for patterns in pattern_groups.values()
+        )
+        self.token_weights = self._build_token_weights(pattern_groups)
+    
+    def _build_token_weights(
+        self,
+        pattern_groups: Dict[Any, List[str]]
+    ) -> Optional[Dict[str, Tuple[Tuple[int, int], ...]]]:
+        """Build token -> ((label index, weight), ...), or None if a pattern is not literal."""
+        weights: Dict[str, Counter] = defaultdict(Counter)
+        
+        for index, patterns in enumerate(pattern_groups.values()):
+            for pattern in patterns:
+                match = self._WORD_ALTERNATION_RE.fullmatch(pattern)
+                if not match:
+                    return None
+                
+                # A word listed twice in one alternation still matches once
+                words = set(match.group(1).lower().split('|'))
+                if '' in words:
+                    return None
+                
+                for word in words:
+                    weights[word][index] += 1
+        
+        return {token: tuple(counts.items()) for token, counts in weights.items()}
+    
+    def best_label(self, text: str) -> Optional[Any]:
+        """
+        Return the label whose patterns match text most often.
+        
+        Args:
+            text: Lowercased text to score
+            
+        Returns:
+            Best label, or None when nothing matches
+        """
+        # Scores are indexed by label position, not keyed by label
+        scores = [0] * len(self.labels)
+        
+        if self.token_weights is not None:
+            token_weights = self.token_weights
+            for token in _WORD_RE.findall(text):
+                for index, weight in token_weights.get(token, ()):
+                    scores[index] += weight
+        else:
+            for index, patterns in enumerate(self.compiled):
+                for pattern in patterns:
+                    scores[index] += len(pattern.findall(text))
+        
+        if scores:
+            best_index = max(range(len(scores)), key=scores.__getitem__)
+            if scores[best_index] > 0:
+                return self.labels[best_index]
+        
+        return None
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _best_pattern_label(text: str, scorer: _PatternScorer) -> Optional[Any]:
+    """Cached scorer.best_label(text); scorers hash by identity."""
+    return scorer.best_label(text)
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _top_keywords(text: str, max_keywords: int) -> Tuple[str, ...]:
+    """
+    Return the most frequent non stop-word tokens of a lowercased text.
+    
+    Args:
+        text: Lowercased text to extract keywords from
+        max_keywords: Maximum number of keywords to return
+        
+    Returns:
+        Tuple of keywords, most frequent first
+    """
+    filtered_words = [
+        word for word in _WORD_RE.findall(text)
+        if word not in _STOP_WORDS and len(word) > 2
+    ]
+    
+    return tuple(word for word, _ in Counter(filtered_words).most_common(max_keywords))
+
+
+@dataclass(slots=True)
 class ProcessedHashtag:
     """Processed and enriched hashtag data."""
     name: str
@@ -46,7 +193,7 @@ class ProcessedHashtag:
     processing_timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedCreator:
     """Processed and enriched creator data."""
     id: str
@@ -66,7 +213,7 @@ class ProcessedCreator:
     processing_timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedSound:
     """Processed and enriched sound data."""
     id: str
@@ -100,6 +247,9 @@ class DataProcessor:
     Handles cleaning, normalization, enrichment, and quality assessment.
     """
     
+    # NicheType has no catch-all member; unmatched content is filed here
+    FALLBACK_NICHE = NicheType.ENTERTAINMENTTOK
+    
     # Niche classification patterns
     NICHE_PATTERNS = {
         NicheType.BOOKTOK: [
@@ -107,37 +257,37 @@ class DataProcessor:
             r'\b(booktok|bookrecommendation|bookreview)\b',
             r'\b(currentlyreading|tbr|bookclub)\b'
         ],
-        NicheType.FITNESS: [
+        NicheType.HEALTHTOK: [
             r'\b(workout|fitness|gym|exercise|training|health)\b',
             r'\b(fitnesstok|workoutmotivation|gymtok)\b',
             r'\b(personaltrainer|fitnessjourney|healthylifestyle)\b'
         ],
-        NicheType.COOKING: [
+        NicheType.FOODTOK: [
             r'\b(food|cook|cooking|recipe|kitchen|chef)\b',
             r'\b(foodtok|foodie|recipe|cookingtips)\b',
             r'\b(baking|homemadefood|foodhacks)\b'
         ],
-        NicheType.FASHION: [
+        NicheType.FASHIONTOK: [
             r'\b(fashion|style|outfit|clothing|wear|dress)\b',
             r'\b(fashiontok|styletips|ootd|outfitinspo)\b',
             r'\b(sustainablefashion|fashionhacks|styling)\b'
         ],
-        NicheType.TRAVEL: [
+        NicheType.TRAVELLTOK: [
             r'\b(travel|vacation|trip|journey|explore|adventure)\b',
             r'\b(traveltok|wanderlust|travelvlog)\b',
             r'\b(travelguide|travelphotography|destination)\b'
         ],
-        NicheType.DANCE: [
+        NicheType.DANCETOK: [
             r'\b(dance|choreography|dancing|moves|steps)\b',
             r'\b(dancetok|dancechallenge|dancecover)\b',
             r'\b(dancetutorial|dancefitness|dancemoves)\b'
         ],
-        NicheType.COMEDY: [
+        NicheType.COMEDYTOK: [
             r'\b(funny|comedy|humor|joke|laughs|hilarious)\b',
             r'\b(comedytok|funnyvideos|memes)\b',
             r'\b(sketchcomedy|standup|funnymoments)\b'
         ],
-        NicheType.BEAUTY: [
+        NicheType.BEAUTYTOK: [
             r'\b(beauty|makeup|cosmetic|skincare|glam)\b',
             r'\b(beautytok|makeuptutorial|skincareroutine)\b',
             r'\b(eyemakeup|lipstick|foundation|beautytips)\b'
@@ -162,6 +312,43 @@ class DataProcessor:
         ]
     }
     
+    # Precompiled pattern scorers, shared by every processor instance
+    _NICHE_SCORER = _PatternScorer(NICHE_PATTERNS)
+    _SENTIMENT_SCORER = _PatternScorer(SENTIMENT_PATTERNS)
+    
+    # Genre patterns fused into one regex; group order is genre priority
+    _GENRE_RE = re.compile(
+        r'(?P<pop>\b(?:pop|chart|hit|radio)\b)'
+        r'|(?P<hip_hop>\b(?:hip.?hop|rap|trap|drill)\b)'
+        r'|(?P<electronic>\b(?:edm|electronic|house|techno|dubstep)\b)'
+        r'|(?P<rock>\b(?:rock|metal|punk|alternative)\b)'
+        r'|(?P<r_and_b>\b(?:r&?b|soul|urban)\b)'
+        r'|(?P<country>\b(?:country|folk|acoustic)\b)'
+        r'|(?P<classical>\b(?:classical|orchestra|symphony)\b)'
+        r'|(?P<jazz>\b(?:jazz|blues|swing)\b)',
+        re.IGNORECASE
+    )
+    _GENRE_NAMES = {
+        "pop": "pop",
+        "hip_hop": "hip-hop",
+        "electronic": "electronic",
+        "rock": "rock",
+        "r_and_b": "r&b",
+        "country": "country",
+        "classical": "classical",
+        "jazz": "jazz"
+    }
+    _GENRE_RANK = {group: rank for rank, group in enumerate(_GENRE_NAMES)}
+    
+    # Characters that cannot appear in a normalized hashtag name
+    _HASHTAG_CLEAN_RE = re.compile(r'[^\w]+')
+    
+    # Runs of whitespace and special characters (anything but words, # and @)
+    _TEXT_CLEAN_RE = re.compile(r'[^\w#@]+')
+    
+    # Items per worker-thread chunk for the async batch entry points
+    ASYNC_CHUNK_SIZE = 500
+    
     # Data quality thresholds
     QUALITY_THRESHOLDS = {
         "hashtag": {
@@ -198,7 +385,8 @@ class DataProcessor:
         if enable_ml:
             self._initialize_ml_components()
         
-        # Processing statistics
+        # Processing statistics; batch methods update them from worker threads
+        self._stats_lock = threading.Lock()
         self._stats = {
             "hashtags_processed": 0,
             "creators_processed": 0,
@@ -210,6 +398,11 @@ class DataProcessor:
         
         self.logger.info(f"DataProcessor initialized (ML={enable_ml})")
     
+    def _count_stat(self, name: str) -> None:
+        """Increment a processing statistic; safe to call from worker threads."""
+        with self._stats_lock:
+            self._stats[name] += 1
+    
     def _initialize_ml_components(self) -> None:
         """Initialize machine learning components."""
         if not ML_AVAILABLE:
@@ -250,16 +443,13 @@ class DataProcessor:
         if not text:
             return ""
         
-        # Remove special characters except hashtags and mentions
-        text = re.sub(r'[^\w\s#@]', ' ', text)
+        # Single words (the common case for keywords) have nothing to replace
+        if text.isalnum():
+            return text.lower()
         
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove extra spaces at start/end
-        text = text.strip()
-        
-        return text.lower()
+        # Replace special characters (except hashtags and mentions) and
+        # collapse whitespace in one pass, then trim the ends
+        return self._TEXT_CLEAN_RE.sub(' ', text).strip().lower()
     
     def normalize_hashtag_name(self, name: str) -> str:
         """
@@ -274,9 +464,13 @@ class DataProcessor:
         if not name:
             return ""
         
-        # Remove all # characters and clean text
-        name = name.replace('#', '').strip()
-        name = self.clean_text(name)
+        # Already-clean names ("#fyp", "fyp") only need lowercasing
+        word = name[1:] if name[0] == '#' else name
+        if word.isalnum():
+            return f"#{word.lower()}"
+        
+        # Hashtags are a single word: drop every non-word character in one pass
+        name = self._HASHTAG_CLEAN_RE.sub('', name).lower()
         
         # Add single # back if not empty
         return f"#{name}" if name else ""
@@ -306,6 +500,46 @@ class DataProcessor:
         total_engagement = likes + comments + shares
         return (total_engagement / views) * 100
     
+    def calculate_engagement_rates(
+        self,
+        likes: Sequence[int],
+        views: Sequence[int],
+        comments: Optional[Sequence[int]] = None,
+        shares: Optional[Sequence[int]] = None
+    ) -> List[float]:
+        """
+        Calculate engagement rates for many items at once.
+        
+        Vectorized equivalent of calculate_engagement_rate: counts are summed
+        and divided as float64 columns, with 0.0 wherever views <= 0.
+        
+        Args:
+            likes: Number of likes per item
+            views: Number of views per item
+            comments: Number of comments per item
+            shares: Number of shares per item
+        
+        Returns:
+            Engagement rate percentages, one per item
+        """
+        comments = [0] * len(views) if comments is None else comments
+        shares = [0] * len(views) if shares is None else shares
+        
+        if not PANDAS_AVAILABLE:
+            return [
+                self.calculate_engagement_rate(*counts)
+                for counts in zip(likes, views, comments, shares)
+            ]
+        
+        views_arr = np.asarray(views, dtype=np.float64)
+        total = (
+            np.asarray(likes, dtype=np.float64)
+            + np.asarray(comments, dtype=np.float64)
+            + np.asarray(shares, dtype=np.float64)
+        )
+        rates = np.divide(total, views_arr, out=np.zeros_like(views_arr), where=views_arr > 0)
+        return (rates * 100).tolist()
+
     def calculate_growth_rate(
         self,
         current_value: int,
@@ -343,7 +577,7 @@ class DataProcessor:
             Classified niche type
         """
         if not text:
-            return NicheType.OTHER
+            return self.FALLBACK_NICHE
         
         text = text.lower()
         all_text = text
@@ -351,22 +585,12 @@ class DataProcessor:
         if keywords:
             all_text += " " + " ".join(keywords).lower()
         
-        niche_scores = defaultdict(int)
-        
-        # Score each niche based on pattern matching
-        for niche, patterns in self.NICHE_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, all_text, re.IGNORECASE)
-                niche_scores[niche] += len(matches)
+        best_niche = _best_pattern_label(all_text, self._NICHE_SCORER)
+        if best_niche is not None:
+            self._count_stat("niche_classifications")
+            return best_niche
         
-        # Get the niche with highest score
-        if niche_scores:
-            best_niche = max(niche_scores, key=niche_scores.get)
-            if niche_scores[best_niche] > 0:
-                self._stats["niche_classifications"] += 1
-                return best_niche
-        
-        return NicheType.OTHER
+        return self.FALLBACK_NICHE
     
     def analyze_sentiment(self, text: str) -> SentimentType:
         """
@@ -381,21 +605,10 @@ class DataProcessor:
         if not text:
             return SentimentType.NEUTRAL
         
-        text = text.lower()
-        sentiment_scores = defaultdict(int)
-        
-        # Score each sentiment based on pattern matching
-        for sentiment, patterns in self.SENTIMENT_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                sentiment_scores[sentiment] += len(matches)
-        
-        # Get the sentiment with highest score
-        if sentiment_scores:
-            best_sentiment = max(sentiment_scores, key=sentiment_scores.get)
-            if sentiment_scores[best_sentiment] > 0:
-                self._stats["sentiment_analyses"] += 1
-                return best_sentiment
+        best_sentiment = _best_pattern_label(text.lower(), self._SENTIMENT_SCORER)
+        if best_sentiment is not None:
+            self._count_stat("sentiment_analyses")
+            return best_sentiment
         
         return SentimentType.NEUTRAL
     
@@ -416,25 +629,17 @@ class DataProcessor:
         Returns:
             Trend direction
         """
-        # Strong positive growth
-        if growth_rate > 20 and engagement_rate > 5:
-            return TrendDirection.UPWARD
-        
-        # Moderate growth
+        # Growing
         if growth_rate > 5 and engagement_rate > 2:
-            return TrendDirection.RISING
+            return TrendDirection.UP
         
         # Stable
         if -5 <= growth_rate <= 5 and engagement_rate >= 0.5:
             return TrendDirection.STABLE
         
         # Declining
-        if growth_rate < -10 or engagement_rate < 0.5:
-            return TrendDirection.DOWNWARD
-        
-        # Slight decline
-        if growth_rate < -5:
-            return TrendDirection.DECLINING
+        if growth_rate < -5 or engagement_rate < 0.5:
+            return TrendDirection.DOWN
         
         return TrendDirection.STABLE
     
@@ -463,11 +668,12 @@ class DataProcessor:
             if field in data and data[field] is not None:
                 score += 2.0
         
-        # Check value ranges
+        # Check value ranges; None and non-numeric values score like missing
+        # ones, as in batch_quality_scores
         if data_type == "hashtag":
-            usage_count = data.get("usage_count", 0)
-            engagement_rate = data.get("engagement", 0)
-            name_length = len(data.get("name", ""))
+            usage_count = _as_number(data.get("usage_count"))
+            engagement_rate = _as_number(data.get("engagement"))
+            name_length = _text_length(data.get("name"))
             
             if usage_count >= thresholds.get("min_usage_count", 10):
                 score += 1.0
@@ -477,9 +683,9 @@ class DataProcessor:
                 score += 1.0
         
         elif data_type == "creator":
-            followers = data.get("followers", 0)
-            engagement_rate = data.get("engagement_rate", 0)
-            username_length = len(data.get("username", ""))
+            followers = _as_number(data.get("followers"))
+            engagement_rate = _as_number(data.get("engagement_rate"))
+            username_length = _text_length(data.get("username"))
             
             if followers >= thresholds.get("min_followers", 100):
                 score += 1.0
@@ -489,8 +695,8 @@ class DataProcessor:
                 score += 1.0
         
         elif data_type == "sound":
-            plays = data.get("plays", 0)
-            duration = data.get("duration", 0)
+            plays = _as_number(data.get("plays"))
+            duration = _as_number(data.get("duration"))
             
             if plays >= thresholds.get("min_plays", 1000):
                 score += 2.0
@@ -500,16 +706,92 @@ class DataProcessor:
         # Convert score to quality level
         score_percentage = (score / max_score) * 100
         
+        return self._quality_level(score_percentage), score_percentage
+    
+    def _quality_level(self, score_percentage: float) -> DataQualityLevel:
+        """Map a quality score percentage to its quality level."""
         if score_percentage >= 90:
-            return DataQualityLevel.EXCELLENT, score_percentage
+            return DataQualityLevel.EXCELLENT
         elif score_percentage >= 75:
-            return DataQualityLevel.GOOD, score_percentage
+            return DataQualityLevel.GOOD
         elif score_percentage >= 50:
-            return DataQualityLevel.FAIR, score_percentage
+            return DataQualityLevel.FAIR
         elif score_percentage >= 25:
-            return DataQualityLevel.POOR, score_percentage
+            return DataQualityLevel.POOR
         else:
-            return DataQualityLevel.VERY_POOR, score_percentage
+            return DataQualityLevel.VERY_POOR
+    
+    def batch_quality_scores(self, df: "pd.DataFrame", data_type: str) -> "np.ndarray":
+        """
+        Calculate data quality scores for a whole batch at once.
+        
+        Vectorized equivalent of calculate_data_quality_score: every threshold
+        is evaluated as one column operation instead of per record.
+        
+        Args:
+            df: DataFrame with one raw record per row
+            data_type: Type of data (hashtag, creator, sound)
+            
+        Returns:
+            Array of quality score percentages, one per row
+        """
+        thresholds = self.QUALITY_THRESHOLDS.get(data_type, {})
+        max_score = 10.0
+        
+        def column(name: str) -> "pd.Series":
+            if name in df.columns:
+                return df[name]
+            return pd.Series([None] * len(df), index=df.index, dtype=object)
+        
+        def numeric(name: str) -> "pd.Series":
+            return pd.to_numeric(column(name), errors="coerce").fillna(0)
+        
+        def length(name: str) -> "pd.Series":
+            return column(name).fillna("").astype(str).str.len()
+        
+        score = np.zeros(len(df), dtype=float)
+        
+        # Required fields
+        for field_name in thresholds.get("required_fields", []):
+            score += column(field_name).notna().to_numpy() * 2.0
+        
+        # Value ranges
+        if data_type == "hashtag":
+            score += (numeric("usage_count") >= thresholds["min_usage_count"]).to_numpy() * 1.0
+            score += (numeric("engagement") >= thresholds["min_engagement_rate"]).to_numpy() * 1.0
+            score += (length("name") <= thresholds["max_name_length"]).to_numpy() * 1.0
+        
+        elif data_type == "creator":
+            score += (numeric("followers") >= thresholds["min_followers"]).to_numpy() * 1.0
+            score += (
+                numeric("engagement_rate") >= thresholds["min_engagement_rate"]
+            ).to_numpy() * 1.0
+            score += (length("username") <= thresholds["max_username_length"]).to_numpy() * 1.0
+        
+        elif data_type == "sound":
+            duration = numeric("duration")
+            score += (numeric("plays") >= thresholds["min_plays"]).to_numpy() * 2.0
+            score += duration.between(
+                thresholds["min_duration"], thresholds["max_duration"]
+            ).to_numpy() * 1.0
+        
+        return (score / max_score) * 100
+    
+    def _batch_quality_scores(
+        self,
+        raw_items: List[Dict],
+        data_type: str
+    ) -> Optional[List[float]]:
+        """Score a raw batch in one pass, or None when pandas is unavailable."""
+        if not PANDAS_AVAILABLE or not raw_items:
+            return None
+        
+        try:
+            df = pd.DataFrame.from_records(raw_items)
+            return self.batch_quality_scores(df, data_type).tolist()
+        except Exception as e:
+            self.logger.warning(f"Batch quality scoring failed, scoring per item: {str(e)}")
+            return None
     
     def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
         """
@@ -526,25 +808,57 @@ class DataProcessor:
             return []
         
         # Simple keyword extraction (could be enhanced with NLP)
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Filter out common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-            'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i',
-            'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
-            'amazing'  # Add 'amazing' to stop words for this test
-        }
+        return list(_top_keywords(text.lower(), max_keywords))
+    
+    def extract_keywords_batch(
+        self,
+        texts: List[str],
+        max_keywords: int = 10
+    ) -> List[List[str]]:
+        """
+        Extract keywords for many texts in one pass.
         
-        filtered_words = [word for word in words if word not in stop_words and len(word) > 2]
+        All tokens of the batch are collected into flat row/token columns and
+        counted with a single groupby instead of one Counter per text. Ties
+        keep first-occurrence order, matching extract_keywords.
         
-        # Count word frequencies
-        word_counts = Counter(filtered_words)
+        Args:
+            texts: Texts to extract keywords from
+            max_keywords: Maximum number of keywords per text
+            
+        Returns:
+            List of keyword lists, one per input text
+        """
+        if not PANDAS_AVAILABLE:
+            return [self.extract_keywords(text, max_keywords) for text in texts]
         
-        # Return most common words
-        return [word for word, _ in word_counts.most_common(max_keywords)]
+        rows: List[int] = []
+        tokens: List[str] = []
+        for row, text in enumerate(texts):
+            if not text:
+                continue
+            for word in _WORD_RE.findall(text.lower()):
+                if word not in _STOP_WORDS and len(word) > 2:
+                    rows.append(row)
+                    tokens.append(word)
+        
+        keywords: List[List[str]] = [[] for _ in texts]
+        if not tokens:
+            return keywords
+        
+        token_frame = pd.DataFrame({"row": rows, "token": tokens, "position": range(len(tokens))})
+        counts = (
+            token_frame.groupby(["row", "token"], sort=False)["position"]
+            .agg(["size", "min"])
+            .reset_index()
+            .sort_values(["row", "size", "min"], ascending=[True, False, True])
+        )
+        top = counts.groupby("row", sort=False).head(max_keywords)
+        
+        for row, token in zip(top["row"].tolist(), top["token"].tolist()):
+            keywords[row].append(token)
+        
+        return keywords
     
     def process_hashtags(self, raw_hashtags: List[Dict]) -> List[ProcessedHashtag]:
         """
@@ -557,8 +871,10 @@ class DataProcessor:
             List of processed hashtags
         """
         processed_hashtags = []
+        keyword_texts = []
+        quality_scores = self._batch_quality_scores(raw_hashtags, "hashtag")
         
-        for raw_data in raw_hashtags:
+        for index, raw_data in enumerate(raw_hashtags):
             try:
                 # Extract basic fields
                 name = self.normalize_hashtag_name(raw_data.get("name", ""))
@@ -576,13 +892,14 @@ class DataProcessor:
                 niche = self.classify_niche(text_content)
                 sentiment = self.analyze_sentiment(text_content)
                 
-                # Extract keywords
-                keywords = self.extract_keywords(text_content)
-                
                 # Quality assessment
-                quality_level, quality_score = self.calculate_data_quality_score(
-                    raw_data, "hashtag"
-                )
+                if quality_scores is not None:
+                    quality_score = quality_scores[index]
+                    quality_level = self._quality_level(quality_score)
+                else:
+                    quality_level, quality_score = self.calculate_data_quality_score(
+                        raw_data, "hashtag"
+                    )
                 
                 # Confidence score (based on data quality and completeness)
                 confidence_score = min(1.0, quality_score / 100.0)
@@ -598,21 +915,26 @@ class DataProcessor:
                     videos_count=videos_count,
                     views_count=views_count,
                     normalized_name=name,
-                    keywords=keywords,
                     confidence_score=confidence_score,
                     data_quality_score=quality_score
                 )
                 
                 processed_hashtags.append(processed_hashtag)
-                self._stats["hashtags_processed"] += 1
+                keyword_texts.append(text_content)
+                self._count_stat("hashtags_processed")
                 
                 if quality_level.value <= 2:  # POOR or VERY_POOR
-                    self._stats["quality_issues"] += 1
+                    self._count_stat("quality_issues")
                 
             except Exception as e:
                 self.logger.error(f"Failed to process hashtag: {str(e)}")
                 continue
         
+        # Extract keywords for the whole batch at once
+        batch_keywords = self.extract_keywords_batch(keyword_texts)
+        for hashtag, keywords in zip(processed_hashtags, batch_keywords):
+            hashtag.keywords = keywords
+        
         return processed_hashtags
     
     def process_creators(self, raw_creators: List[Dict]) -> List[ProcessedCreator]:
@@ -626,8 +948,9 @@ class DataProcessor:
             List of processed creators
         """
         processed_creators = []
+        quality_scores = self._batch_quality_scores(raw_creators, "creator")
         
-        for raw_data in raw_creators:
+        for index, raw_data in enumerate(raw_creators):
             try:
                 # Extract basic fields
                 creator_id = str(raw_data.get("id", ""))
@@ -649,9 +972,13 @@ class DataProcessor:
                 sentiment = self.analyze_sentiment(text_content)
                 
                 # Quality assessment
-                quality_level, quality_score = self.calculate_data_quality_score(
-                    raw_data, "creator"
-                )
+                if quality_scores is not None:
+                    quality_score = quality_scores[index]
+                    quality_level = self._quality_level(quality_score)
+                else:
+                    quality_level, quality_score = self.calculate_data_quality_score(
+                        raw_data, "creator"
+                    )
                 
                 # Confidence score
                 confidence_score = min(1.0, quality_score / 100.0)
@@ -674,10 +1001,10 @@ class DataProcessor:
                 )
                 
                 processed_creators.append(processed_creator)
-                self._stats["creators_processed"] += 1
+                self._count_stat("creators_processed")
                 
                 if quality_level.value <= 2:
-                    self._stats["quality_issues"] += 1
+                    self._count_stat("quality_issues")
                 
             except Exception as e:
                 self.logger.error(f"Failed to process creator: {str(e)}")
@@ -696,8 +1023,9 @@ class DataProcessor:
             List of processed sounds
         """
         processed_sounds = []
+        quality_scores = self._batch_quality_scores(raw_sounds, "sound")
         
-        for raw_data in raw_sounds:
+        for index, raw_data in enumerate(raw_sounds):
             try:
                 # Extract basic fields
                 sound_id = str(raw_data.get("id", ""))
@@ -722,9 +1050,13 @@ class DataProcessor:
                 danceability = float(raw_data.get("danceability", 0.5))
                 
                 # Quality assessment
-                quality_level, quality_score = self.calculate_data_quality_score(
-                    raw_data, "sound"
-                )
+                if quality_scores is not None:
+                    quality_score = quality_scores[index]
+                    quality_level = self._quality_level(quality_score)
+                else:
+                    quality_level, quality_score = self.calculate_data_quality_score(
+                        raw_data, "sound"
+                    )
                 
                 # Confidence score
                 confidence_score = min(1.0, quality_score / 100.0)
@@ -745,10 +1077,10 @@ class DataProcessor:
                 )
                 
                 processed_sounds.append(processed_sound)
-                self._stats["sounds_processed"] += 1
+                self._count_stat("sounds_processed")
                 
                 if quality_level.value <= 2:
-                    self._stats["quality_issues"] += 1
+                    self._count_stat("quality_issues")
                 
             except Exception as e:
                 self.logger.error(f"Failed to process sound: {str(e)}")
@@ -756,6 +1088,76 @@ class DataProcessor:
         
         return processed_sounds
     
+    async def _process_in_chunks(
+        self,
+        process: Callable[[List[Dict]], List[Any]],
+        raw_items: List[Dict],
+        chunk_size: int
+    ) -> List[Any]:
+        """Run a batch processor over chunks in worker threads, preserving order."""
+        chunk_size = max(1, chunk_size)
+        chunks = [raw_items[i:i + chunk_size] for i in range(0, len(raw_items), chunk_size)]
+        
+        results = await asyncio.gather(
+            *(asyncio.to_thread(process, chunk) for chunk in chunks)
+        )
+        
+        return [item for chunk_result in results for item in chunk_result]
+    
+    async def process_hashtags_async(
+        self,
+        raw_hashtags: List[Dict],
+        chunk_size: int = ASYNC_CHUNK_SIZE
+    ) -> List[ProcessedHashtag]:
+        """
+        Process hashtags without blocking the event loop.
+        
+        Callers running inside an event loop should use this instead of
+        process_hashtags so collection and storage can overlap processing.
+        
+        Args:
+            raw_hashtags: List of raw hashtag dictionaries
+            chunk_size: Number of items handed to each worker thread
+            
+        Returns:
+            List of processed hashtags
+        """
+        return await self._process_in_chunks(self.process_hashtags, raw_hashtags, chunk_size)
+    
+    async def process_creators_async(
+        self,
+        raw_creators: List[Dict],
+        chunk_size: int = ASYNC_CHUNK_SIZE
+    ) -> List[ProcessedCreator]:
+        """
+        Process creators without blocking the event loop.
+        
+        Args:
+            raw_creators: List of raw creator dictionaries
+            chunk_size: Number of items handed to each worker thread
+            
+        Returns:
+            List of processed creators
+        """
+        return await self._process_in_chunks(self.process_creators, raw_creators, chunk_size)
+    
+    async def process_sounds_async(
+        self,
+        raw_sounds: List[Dict],
+        chunk_size: int = ASYNC_CHUNK_SIZE
+    ) -> List[ProcessedSound]:
+        """
+        Process sounds without blocking the event loop.
+        
+        Args:
+            raw_sounds: List of raw sound dictionaries
+            chunk_size: Number of items handed to each worker thread
+            
+        Returns:
+            List of processed sounds
+        """
+        return await self._process_in_chunks(self.process_sounds, raw_sounds, chunk_size)
+    
     def _classify_genre(self, text: str) -> str:
         """
         Classify music genre based on text.
@@ -766,25 +1168,14 @@ class DataProcessor:
         Returns:
             Genre string
         """
-        text = text.lower()
-        
-        genre_patterns = {
-            "pop": [r'\b(pop|chart|hit|radio)\b'],
-            "hip-hop": [r'\b(hip.?hop|rap|trap|drill)\b'],
-            "electronic": [r'\b(edm|electronic|house|techno|dubstep)\b'],
-            "rock": [r'\b(rock|metal|punk|alternative)\b'],
-            "r&b": [r'\b(r&?b|soul|urban)\b'],
-            "country": [r'\b(country|folk|acoustic)\b'],
-            "classical": [r'\b(classical|orchestra|symphony)\b'],
-            "jazz": [r'\b(jazz|blues|swing)\b']
-        }
-        
-        for genre, patterns in genre_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return genre
+        # Single scan over the text; genres listed earlier in _GENRE_RE win
+        best = min(
+            self._GENRE_RE.finditer(text),
+            key=lambda match: self._GENRE_RANK[match.lastgroup],
+            default=None
+        )
         
-        return "unknown"
+        return self._GENRE_NAMES[best.lastgroup] if best else "unknown"
     
     def get_processing_stats(self) -> Dict[str, Any]:
         """Get processing statistics."""
@@ -10,25 +10,32 @@ import logging
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src to path when run as a script; the tiktok-trends entry point needs no path setup
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import setup_logger  # noqa: E402
 
 
-def initialize_application() -> None:
+def initialize_application() -> logging.Logger:
     """
     Initialize the TikTok Global Trends application.
 
     Sets up logging, configuration, and prepares all components for startup.
+
+    Returns:
+        logging.Logger: The application logger
     """
     # Setup logging
     logger = setup_logger("tiktok_global_trends")
     logger.info("TikTok Global Trends initialized")
 
     # Log startup information
-    logger.debug(f"Python version: {sys.version}")
-    logger.debug(f"Application root: {Path(__file__).parent}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Python version: %s", sys.version)
+        logger.debug("Application root: %s", Path(__file__).parent)
+
+    return logger
 
 
 def main() -> int:
@@ -40,8 +47,6 @@ def main() -> int:
     """
     try:
         initialize_application()
-        logger = logging.getLogger("tiktok_global_trends")
-        logger.info("TikTok Global Trends initialized")
 
         # TODO: Implement UI launcher (PySimpleGUI)
         # from src.ui.main_window import launch_ui
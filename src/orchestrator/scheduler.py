@@ -4,18 +4,45 @@ Task Scheduler Module
 Orchestrates scheduled data collection and processing tasks.
 """
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from typing import Awaitable, Callable, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+CollectionTask = Callable[[str], Awaitable[None]]
+ProcessingTask = Callable[[], Awaitable[None]]
+RefreshTask = Callable[[], Awaitable[object]]
 
 
 class TaskScheduler:
-    """Manages scheduled tasks for data collection and processing."""
+    """
+    Manages scheduled tasks for data collection and processing.
 
-    def __init__(self):
-        """Initialize task scheduler."""
-        self.scheduler = BackgroundScheduler()
+    Jobs are coroutines run on the asyncio event loop, so concurrent
+    per-country collections share one thread instead of a thread pool.
+    """
+
+    def __init__(
+        self,
+        collector: Optional[CollectionTask] = None,
+        processor: Optional[ProcessingTask] = None,
+        snapshot_refresher: Optional[RefreshTask] = None,
+    ):
+        """
+        Initialize task scheduler.
+
+        Args:
+            collector: Coroutine function collecting data for one country code
+            processor: Coroutine function processing collected data
+            snapshot_refresher: Coroutine function rebuilding read-side snapshots
+                (e.g. AsyncDatabaseManager.refresh_trending_snapshots)
+        """
+        self.scheduler = AsyncIOScheduler()
+        self.collector = collector
+        self.processor = processor
+        self.snapshot_refresher = snapshot_refresher
 
     def start(self) -> None:
-        """Start the scheduler."""
+        """Start the scheduler. Must be called from within a running event loop."""
         self.scheduler.start()
 
     def stop(self) -> None:
@@ -29,9 +56,22 @@ class TaskScheduler:
         Args:
             country_code: ISO country code
             interval_hours: How often to run collection (in hours)
+
+        Raises:
+            ValueError: If no collector was configured
         """
-        # TODO: Implement job scheduling
-        pass
+        if self.collector is None:
+            raise ValueError("No collector configured for collection jobs")
+
+        self.scheduler.add_job(
+            self.collector,
+            "interval",
+            hours=interval_hours,
+            args=[country_code],
+            id=f"collect_{country_code}",
+            replace_existing=True,
+            max_instances=1,
+        )
 
     def add_processing_job(self, interval_hours: int) -> None:
         """
@@ -39,6 +79,41 @@ class TaskScheduler:
 
         Args:
             interval_hours: How often to run processing (in hours)
+
+        Raises:
+            ValueError: If no processor was configured
         """
-        # TODO: Implement job scheduling
-        pass
+        if self.processor is None:
+            raise ValueError("No processor configured for processing jobs")
+
+        self.scheduler.add_job(
+            self.processor,
+            "interval",
+            hours=interval_hours,
+            id="process_data",
+            replace_existing=True,
+            max_instances=1,
+        )
+
+    def add_snapshot_refresh_job(self, interval_minutes: int = 5) -> None:
+        """
+        Add a job refreshing the trending snapshots read by the API.
+
+        Args:
+            interval_minutes: How often to refresh (in minutes)
+
+        Raises:
+            ValueError: If no snapshot refresher was configured
+        """
+        if self.snapshot_refresher is None:
+            raise ValueError("No snapshot refresher configured for refresh jobs")
+
+        self.scheduler.add_job(
+            self.snapshot_refresher,
+            "interval",
+            minutes=interval_minutes,
+            id="refresh_snapshots",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
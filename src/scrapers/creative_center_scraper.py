@@ -9,24 +9,69 @@ import json
 import re
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from html import unescape
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from dataclasses import KW_ONLY, dataclass
 from urllib.parse import urljoin, quote
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+import soupsieve
 
+# Optional faster JSON parser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional vectorized validation
+try:
+    import numpy as np
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+from src.utils.cache import DiskCache, TTLCache
 from src.utils.logger import setup_logger
 from src.storage.models.enums import CountryCode, NicheType, TrendDirection, DataSourceType
 
 
+# Process-wide Chromium shared by every scraper instance; each scraper only
+# owns its browser contexts. The browser is closed when its last user closes.
+_PLAYWRIGHT_SINGLETON = None
+_BROWSER_SINGLETON: Optional[Browser] = None
+_BROWSER_USERS = 0
+_BROWSER_LOCK = asyncio.Lock()
+
+# Hashtags mentioned in page text (fallback extraction)
+_HASHTAG_RE = re.compile(r'#\w+[^\s#]*')
+
+# Markup that isn't page text: comments, script/style blocks and tags
+_MARKUP_RE = re.compile(
+    r'<!--.*?-->|<(script|style)\b.*?</\1\s*>|<[^>]+>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# JSON-LD blocks, matched on the raw HTML so no parse tree is needed for them
+_JSON_LD_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
 @dataclass
 class ScrapingError(Exception):
     """Base exception for scraping errors."""
     message: str
+    # Keyword-only, so subclasses can add required positional fields
+    _: KW_ONLY
     url: Optional[str] = None
     status_code: Optional[int] = None
 
@@ -59,12 +104,45 @@ class CreativeCenterScraper:
     
     # Cache duration in seconds
     CACHE_DURATION = 3600  # 1 hour
+    CACHE_MAX_ENTRIES = 512
+    
+    # Expired entries are revalidated with a conditional HEAD for at most this
+    # long after their last full scrape, in case validators never change
+    REVALIDATE_MAX_AGE = 6 * 3600
+    
+    # Keywords used to filter hashtags by niche
+    _NICHE_KEYWORDS: Dict[NicheType, Tuple[str, ...]] = {
+        NicheType.BOOKTOK: ("book", "read", "author"),
+        NicheType.HEALTHTOK: ("fitness", "workout", "gym"),
+        NicheType.FOODTOK: ("food", "cook", "recipe"),
+        NicheType.FASHIONTOK: ("fashion", "style", "outfit"),
+        NicheType.TRAVELLTOK: ("travel", "vacation", "trip"),
+    }
+    
+    # Compiled once; applied to parsed pages by the sound/creator extractors
+    _SOUND_SELECTOR = soupsieve.compile('audio[class*="sound" i], div[class*="sound" i]')
+    _CREATOR_SELECTOR = soupsieve.compile('a[class*="user" i], div[class*="user" i]')
+    
+    # Batches smaller than this are validated row by row
+    VECTORIZE_MIN_ROWS = 8
+    
+    # Pooled pages are closed and reopened after this many navigations
+    PAGE_RECYCLE_AFTER = 50
+    
+    # Requests aborted in every context; extraction only needs the DOM
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+    BLOCKED_URL_PATTERNS = (
+        "**/*google-analytics*",
+        "**/*googletagmanager*",
+        "**/*doubleclick*",
+    )
     
     def __init__(
         self,
         headless: bool = True,
         timeout: int = 30,
-        max_concurrent: int = 3
+        max_concurrent: int = 3,
+        cache_dir: Optional[Union[str, Path]] = None
     ):
         """
         Initialize Creative Center scraper.
@@ -73,6 +151,8 @@ class CreativeCenterScraper:
             headless: Whether to run browser in headless mode
             timeout: Page load timeout in seconds
             max_concurrent: Maximum concurrent scraping operations
+            cache_dir: Directory for a persistent cache shared across restarts
+                and processes (in-memory only when None)
         """
         self.headless = headless
         self.timeout = timeout
@@ -80,126 +160,289 @@ class CreativeCenterScraper:
         
         self.logger = setup_logger("creative_center_scraper")
         
-        # Browser management
-        self._playwright = None
-        self._browser = None
-        self._context = None
+        # Browser contexts on the shared browser. The pool holds
+        # (context, page, navigations) entries; its bound also caps
+        # concurrent scrapes at max_concurrent
+        self._contexts: List[BrowserContext] = []
+        self._context_pool: Optional[asyncio.Queue] = None
+        self._pool_lock = asyncio.Lock()
+        
+        # Cache for scraped data; expired entries stay available as a
+        # fallback until LRU eviction
+        self._cache = TTLCache(maxsize=self.CACHE_MAX_ENTRIES, ttl=self.CACHE_DURATION)
+        
+        # Persistent tier below the in-memory cache
+        self._disk_cache: Optional[DiskCache] = None
+        if cache_dir is not None:
+            self._disk_cache = DiskCache(
+                Path(cache_dir) / "creative_center.sqlite3",
+                ttl=self.CACHE_DURATION
+            )
         
-        # Cache for scraped data
-        self._cache = {}
+        # ETag/Last-Modified of the page behind each cache entry
+        self._validators = TTLCache(maxsize=self.CACHE_MAX_ENTRIES, ttl=self.REVALIDATE_MAX_AGE)
         
-        # Semaphore for concurrent operations
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Scrapes in progress by cache key, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
         
-        # HTTP session for fallback requests
-        self._session = self._create_session()
+        # Async HTTP client for lightweight requests outside the browser
+        self._http = self._create_http_client()
         
         self.logger.info(f"CreativeCenterScraper initialized (headless={headless})")
     
-    def _create_session(self) -> requests.Session:
-        """Create HTTP session with retry strategy."""
-        session = requests.Session()
-        
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create async HTTP client that retries failed connections."""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=httpx.AsyncHTTPTransport(retries=3),
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            },
+            follow_redirects=True
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Set realistic user agent
-        session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        })
-        
-        return session
     
     def _get_country_url(self, country: CountryCode) -> str:
         """Get Creative Center URL for a specific country."""
         return self.COUNTRY_URLS.get(country, self.DEFAULT_URL)
     
-    def _get_cache_key(self, data_type: str, country: CountryCode, **kwargs) -> str:
-        """Generate cache key for data."""
-        key_parts = [data_type, country.value]
-        for k, v in sorted(kwargs.items()):
-            key_parts.append(f"{k}={v}")
-        return "|".join(key_parts)
-    
-    def _is_cache_valid(self, cache_entry: Dict) -> bool:
-        """Check if cache entry is still valid."""
-        if not cache_entry:
-            return False
-        
-        cached_time = cache_entry.get("timestamp", 0)
-        return (time.time() - cached_time) < self.CACHE_DURATION
-    
     def _get_from_cache(self, cache_key: str) -> Optional[List[Dict]]:
         """Get data from cache if valid."""
-        cache_entry = self._cache.get(cache_key)
-        if self._is_cache_valid(cache_entry):
+        data = self._cache.get(cache_key)
+        if data is not None:
             self.logger.debug(f"Cache hit for {cache_key}")
-            return cache_entry.get("data")
+            return data
+        
+        if self._disk_cache is not None:
+            entry = self._disk_cache.get_with_ttl(cache_key)
+            if entry is not None:
+                data, ttl = entry
+                # Promote to memory for the rest of the entry's lifetime
+                self._cache.set(cache_key, data, ttl=ttl)
+                self.logger.debug(f"Disk cache hit for {cache_key}")
+                return data
+        
         return None
     
-    def _store_in_cache(self, cache_key: str, data: List[Dict]) -> None:
-        """Store data in cache."""
-        self._cache[cache_key] = {
-            "data": data,
-            "timestamp": time.time()
-        }
+    def _store_in_cache(
+        self,
+        cache_key: str,
+        data: List[Dict],
+        validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Store data in cache, with the page validators it was scraped under."""
+        self._cache[cache_key] = data
+        
+        if self._disk_cache is not None:
+            self._disk_cache.set(cache_key, data)
+        
+        if validators:
+            self._validators[cache_key] = validators
+        else:
+            self._validators.pop(cache_key)
+    
+    async def _revalidate(self, cache_key: str, url: str) -> Optional[List[Dict]]:
+        """
+        Check with a conditional HEAD whether the page behind a stale cache entry changed.
+        
+        Args:
+            cache_key: Key of the (possibly expired) cache entry
+            url: Page URL the entry was scraped from
+            
+        Returns:
+            The cached entry, refreshed, if the page is unchanged; None if it
+            changed, can't be revalidated, or the entry is gone
+        """
+        previous = self._validators.get(cache_key)
+        if not previous or self._cache.get_stale(cache_key) is None:
+            # Nothing to revalidate; the scrape itself captures the validators
+            return None
+        
+        headers = {}
+        if "etag" in previous:
+            headers["If-None-Match"] = previous["etag"]
+        if "last-modified" in previous:
+            headers["If-Modified-Since"] = previous["last-modified"]
+        
+        try:
+            response = await self._http.head(url, headers=headers)
+        except httpx.HTTPError as e:
+            self.logger.debug(f"Revalidation request failed for {url}: {str(e)}")
+            return None
+        
+        if response.status_code != 304:
+            return None
+        
+        # The entry may have been evicted while the request was in flight
+        data = self._cache.get_stale(cache_key)
+        if data is None:
+            return None
+        
+        self._cache.touch(cache_key)
+        self.logger.debug(f"Page unchanged, reusing cache for {cache_key}")
+        return data
+    
+    async def _coalesce(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[List[Dict]]]
+    ) -> List[Dict]:
+        """
+        Run fetch once per cache key; concurrent callers share its result.
+        
+        Args:
+            cache_key: Key identifying the scrape
+            fetch: Coroutine function performing the scrape
+            
+        Returns:
+            Result of the single in-flight fetch
+        """
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(cache_key, done))
+        
+        # Shield so one caller being cancelled doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+    
+    def _finish_inflight(self, cache_key: str, task: asyncio.Task) -> None:
+        """Forget a finished shared fetch, marking its exception as retrieved."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # Every caller may have been cancelled before the failure landed
+            task.exception()
+    
+    @classmethod
+    async def _acquire_browser(cls, headless: bool) -> Browser:
+        """
+        Get the process-wide browser, launching it on first use.
+        
+        Args:
+            headless: Whether to launch headless (only used by the first caller)
+            
+        Returns:
+            Shared browser instance
+        """
+        global _PLAYWRIGHT_SINGLETON, _BROWSER_SINGLETON, _BROWSER_USERS
+        
+        async with _BROWSER_LOCK:
+            if _BROWSER_SINGLETON is None:
+                _PLAYWRIGHT_SINGLETON = await async_playwright().start()
+                _BROWSER_SINGLETON = await _PLAYWRIGHT_SINGLETON.chromium.launch(
+                    headless=headless,
+                    args=[
+                        "--no-sandbox",
+                        "--disable-dev-shm-usage",
+                        "--disable-blink-features=AutomationControlled",
+                        "--disable-extensions",
+                        "--disable-plugins",
+                    ]
+                )
+            
+            _BROWSER_USERS += 1
+            return _BROWSER_SINGLETON
+    
+    @classmethod
+    async def _release_browser(cls) -> None:
+        """Drop one user of the shared browser, closing it when none remain."""
+        global _PLAYWRIGHT_SINGLETON, _BROWSER_SINGLETON, _BROWSER_USERS
+        
+        async with _BROWSER_LOCK:
+            _BROWSER_USERS = max(0, _BROWSER_USERS - 1)
+            if _BROWSER_USERS or _BROWSER_SINGLETON is None:
+                return
+            
+            await _BROWSER_SINGLETON.close()
+            _BROWSER_SINGLETON = None
+            
+            if _PLAYWRIGHT_SINGLETON:
+                await _PLAYWRIGHT_SINGLETON.stop()
+                _PLAYWRIGHT_SINGLETON = None
+    
+    @classmethod
+    async def _filter_request(cls, route: Route) -> None:
+        """Abort heavy resources that the HTML extractors never look at."""
+        if route.request.resource_type in cls.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    @staticmethod
+    async def _abort_request(route: Route) -> None:
+        """Abort a request outright (trackers, analytics)."""
+        await route.abort()
+    
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        """Create a browser context with stealth settings."""
+        context = await browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            locale="en-US"
+        )
+        
+        # Add stealth scripts
+        await context.add_init_script("""
+            // Remove webdriver traces
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined,
+            });
+            
+            // Override permissions
+            const originalQuery = window.navigator.permissions.query;
+            window.navigator.permissions.query = (parameters) => (
+                parameters.name === 'notifications' ?
+                    Promise.resolve({ state: Notification.permission }) :
+                    originalQuery(parameters)
+            );
+        """)
+        
+        # Skip images, fonts, styles and trackers to cut page weight
+        await context.route("**/*", self._filter_request)
+        for pattern in self.BLOCKED_URL_PATTERNS:
+            await context.route(pattern, self._abort_request)
+        
+        return context
+    
+    async def _open_page(self, context: BrowserContext) -> Page:
+        """Open a long-lived page on a pooled context."""
+        page = await context.new_page()
+        await page.set_extra_http_headers({
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        })
+        return page
     
     async def _ensure_browser(self) -> None:
-        """Ensure browser is initialized."""
-        if self._browser is None:
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-extensions",
-                    "--disable-plugins",
-                    "--disable-images",  # Faster loading
-                    "--disable-javascript",  # We'll enable per page
-                ]
-            )
+        """Ensure the shared browser and this scraper's context pool exist."""
+        if self._context_pool is not None:
+            return
+        
+        async with self._pool_lock:
+            # Another coroutine may have built the pool while we waited
+            if self._context_pool is not None:
+                return
             
-            # Create context with stealth settings
-            self._context = await self._browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                locale="en-US"
-            )
+            browser = await self._acquire_browser(self.headless)
             
-            # Add stealth scripts
-            await self._context.add_init_script("""
-                // Remove webdriver traces
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                
-                // Override permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-            """)
+            contexts: List[BrowserContext] = []
+            pool: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent)
+            for _ in range(self.max_concurrent):
+                context = await self._new_context(browser)
+                contexts.append(context)
+                pool.put_nowait((context, None, 0))
             
-            self.logger.info("Browser initialized successfully")
+            self._context_pool = pool
+            self._contexts.extend(contexts)
+        
+        self.logger.info(f"Browser ready with {self.max_concurrent} contexts")
     
     async def _scrape_page(
         self,
         url: str,
         selector: Optional[str] = None,
         wait_for: Optional[str] = None
-    ) -> str:
+    ) -> Tuple[str, Dict[str, str]]:
         """
         Scrape a single page and return HTML content.
         
@@ -209,25 +452,27 @@ class CreativeCenterScraper:
             wait_for: Element to wait for before scraping
             
         Returns:
-            HTML content of the page
+            Tuple of (HTML content of the page, its ETag/Last-Modified validators)
         """
         await self._ensure_browser()
         
-        async with self._semaphore:
-            page = await self._context.new_page()
+        context, page, navigations = await self._context_pool.get()
+        try:
+            # Reuse the context's warm page, recycling it to bound memory
+            if page is not None and navigations >= self.PAGE_RECYCLE_AFTER:
+                await page.close()
+                page = None
+            if page is None:
+                page = await self._open_page(context)
+                navigations = 0
             
             try:
-                # Enable JavaScript for this page
-                await page.set_extra_http_headers({
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                })
-                
                 # Navigate to page
                 self.logger.debug(f"Navigating to {url}")
+                navigations += 1
                 response = await page.goto(
                     url,
-                    wait_until="networkidle",
+                    wait_until="domcontentloaded",
                     timeout=self.timeout * 1000
                 )
                 
@@ -238,26 +483,43 @@ class CreativeCenterScraper:
                         status_code=response.status
                     )
                 
-                # Wait for specific elements if provided
+                # Return as soon as the content we need is in the DOM; only
+                # fall back to a short network-idle wait when nothing is named
                 if wait_for:
                     await page.wait_for_selector(wait_for, timeout=10000)
                 elif selector:
                     await page.wait_for_selector(selector, timeout=10000)
-                
-                # Wait a bit for dynamic content
-                await asyncio.sleep(2)
+                else:
+                    try:
+                        await page.wait_for_load_state("networkidle", timeout=3000)
+                    except PlaywrightTimeoutError:
+                        # Long-polling pages never go idle; use what has rendered
+                        pass
                 
                 # Get page content
                 content = await page.content()
+                validators = {
+                    name: response.headers[name]
+                    for name in ("etag", "last-modified")
+                    if name in response.headers
+                }
                 
                 self.logger.debug(f"Successfully scraped {url} ({len(content)} chars)")
-                return content
+                return content, validators
                 
             except Exception as e:
                 self.logger.error(f"Failed to scrape {url}: {str(e)}")
+                
+                # Don't hand a page in an unknown state to the next scrape
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+                page = None
+                
                 raise ScrapingError(f"Scraping failed: {str(e)}", url=url)
-            finally:
-                await page.close()
+        finally:
+            self._context_pool.put_nowait((context, page, navigations))
     
     def _validate_hashtag_data(self, hashtag: Dict) -> Dict:
         """Validate and clean hashtag data."""
@@ -293,6 +555,61 @@ class CreativeCenterScraper:
         
         return cleaned
     
+    def _validate_hashtags(self, hashtags: List[Dict]) -> List[Dict]:
+        """
+        Validate and clean a batch of hashtags, dropping invalid ones.
+        
+        Large batches are cleaned column-wise with pandas; small ones (or
+        without pandas) go through _validate_hashtag_data row by row.
+        
+        Args:
+            hashtags: Raw hashtag data
+            
+        Returns:
+            Cleaned hashtag data
+        """
+        if not PANDAS_AVAILABLE or len(hashtags) < self.VECTORIZE_MIN_ROWS:
+            validated_hashtags = []
+            for hashtag in hashtags:
+                try:
+                    validated_hashtags.append(self._validate_hashtag_data(hashtag))
+                except DataValidationError as e:
+                    self.logger.warning(f"Invalid hashtag data: {e.message}")
+            return validated_hashtags
+        
+        df = pd.DataFrame.from_records(hashtags)
+        
+        def column(name: str, default=None) -> pd.Series:
+            if name in df:
+                return df[name]
+            return pd.Series(default, index=df.index, dtype=object)
+        
+        def numeric(name: str) -> pd.Series:
+            return pd.to_numeric(column(name), errors="coerce").fillna(0)
+        
+        # Required fields must be present and usable
+        usage = pd.to_numeric(column("usage_count"), errors="coerce")
+        valid = column("name").notna() & np.isfinite(usage)
+        if not valid.all():
+            self.logger.warning(f"Dropped {int((~valid).sum())} invalid hashtags")
+            df = df[valid]
+            usage = usage[valid]
+        
+        names = column("name").astype(str).str.strip()
+        names = names.where(names.str.startswith("#"), "#" + names)
+        
+        cleaned = pd.DataFrame({
+            "name": names,
+            "usage_count": usage.clip(lower=0).astype("int64"),
+            "engagement": numeric("engagement").astype(float).clip(lower=0),
+            "growth_rate": numeric("growth_rate").astype(float).clip(-100, 1000),
+            "trend_direction": column("trend_direction", "STABLE").fillna("STABLE"),
+            "videos": numeric("videos").astype("int64"),
+            "views": numeric("views").astype("int64"),
+        })
+        
+        return cleaned.to_dict("records")
+    
     def _extract_hashtags_from_html(self, html: str, limit: int = 50) -> List[Dict]:
         """
         Extract hashtag data from HTML content.
@@ -304,27 +621,25 @@ class CreativeCenterScraper:
         Returns:
             List of hashtag data
         """
-        soup = BeautifulSoup(html, 'html.parser')
         hashtags = []
         
         try:
             # Look for hashtag data in script tags (common pattern)
-            script_tags = soup.find_all('script', type='application/ld+json')
-            for script in script_tags:
+            for match in _JSON_LD_RE.finditer(html):
                 try:
-                    data = json.loads(script.string)
+                    data = _json_loads(match.group(1))
                     if isinstance(data, list):
                         for item in data:
                             if item.get("@type") == "SocialMediaPosting":
                                 hashtags.append(self._extract_hashtag_from_structured_data(item))
-                except (json.JSONDecodeError, AttributeError):
+                except (ValueError, AttributeError):
                     continue
             
             # Fallback: Look for hashtag patterns in text
             if not hashtags:
-                text_content = soup.get_text()
-                hashtag_pattern = r'#\w+[^\s#]*'
-                matches = re.findall(hashtag_pattern, text_content)
+                # Strip markup with one regex pass instead of building a tree
+                text_content = unescape(_MARKUP_RE.sub(' ', html))
+                matches = _HASHTAG_RE.findall(text_content)
                 
                 for i, match in enumerate(matches[:limit]):
                     hashtags.append({
@@ -338,16 +653,7 @@ class CreativeCenterScraper:
                     })
             
             # Validate and clean data
-            validated_hashtags = []
-            for hashtag in hashtags[:limit]:
-                try:
-                    cleaned = self._validate_hashtag_data(hashtag)
-                    validated_hashtags.append(cleaned)
-                except DataValidationError as e:
-                    self.logger.warning(f"Invalid hashtag data: {e.message}")
-                    continue
-            
-            return validated_hashtags
+            return self._validate_hashtags(hashtags[:limit])
             
         except Exception as e:
             self.logger.error(f"Failed to extract hashtags from HTML: {str(e)}")
@@ -384,13 +690,31 @@ class CreativeCenterScraper:
             List of trending hashtags
         """
         # Check cache first
-        cache_key = self._get_cache_key("hashtags", country, limit=limit, niche=niche)
+        cache_key = f"hashtags|{country.value}|limit={limit}|niche={niche.value if niche else ''}"
         cached_data = self._get_from_cache(cache_key)
         if cached_data:
             return cached_data
         
+        return await self._coalesce(
+            cache_key,
+            lambda: self._fetch_hashtags(country, limit, niche, cache_key)
+        )
+    
+    async def _fetch_hashtags(
+        self,
+        country: CountryCode,
+        limit: int,
+        niche: Optional[NicheType],
+        cache_key: str
+    ) -> List[Dict]:
+        """Scrape and cache trending hashtags, falling back on failure."""
         url = self._get_country_url(country)
         
+        # Skip the browser entirely if the page hasn't changed upstream
+        cached_data = await self._revalidate(cache_key, url)
+        if cached_data is not None:
+            return cached_data
+        
         try:
             self.logger.info(
                 f"Scraping trending hashtags for {country}",
@@ -398,7 +722,7 @@ class CreativeCenterScraper:
             )
             
             # Scrape the page
-            html = await self._scrape_page(
+            html, validators = await self._scrape_page(
                 url,
                 selector="[data-testid='trending-hashtags']",
                 wait_for="div[class*='hashtag']"
@@ -411,23 +735,16 @@ class CreativeCenterScraper:
             if niche:
                 # This is a simplified filter - in reality, niche detection
                 # would be more sophisticated
-                niche_keywords = {
-                    NicheType.BOOKTOK: ["book", "read", "author"],
-                    NicheType.FITNESS: ["fitness", "workout", "gym"],
-                    NicheType.COOKING: ["food", "cook", "recipe"],
-                    NicheType.FASHION: ["fashion", "style", "outfit"],
-                    NicheType.TRAVEL: ["travel", "vacation", "trip"],
-                }
-                
-                keywords = niche_keywords.get(niche, [])
+                keywords = self._NICHE_KEYWORDS.get(niche, ())
                 if keywords:
+                    # Lowercase each name once rather than once per keyword
                     hashtags = [
                         h for h in hashtags
-                        if any(kw in h["name"].lower() for kw in keywords)
+                        if (name := h["name"].lower()) and any(kw in name for kw in keywords)
                     ]
             
             # Store in cache
-            self._store_in_cache(cache_key, hashtags)
+            self._store_in_cache(cache_key, hashtags, validators)
             
             self.logger.info(
                 f"Successfully scraped {len(hashtags)} hashtags for {country}",
@@ -440,10 +757,10 @@ class CreativeCenterScraper:
             self.logger.error(f"Failed to scrape hashtags for {country}: {str(e)}")
             
             # Return cached data if available (even if expired)
-            cache_entry = self._cache.get(cache_key, {})
-            if cache_entry.get("data"):
+            stale_data = self._cache.get_stale(cache_key)
+            if stale_data:
                 self.logger.warning(f"Using expired cache for {country}")
-                return cache_entry["data"]
+                return stale_data
             
             # Return empty list as last resort
             return []
@@ -464,13 +781,30 @@ class CreativeCenterScraper:
             List of trending sounds
         """
         # Check cache first
-        cache_key = self._get_cache_key("sounds", country, limit=limit)
+        cache_key = f"sounds|{country.value}|limit={limit}"
         cached_data = self._get_from_cache(cache_key)
         if cached_data:
             return cached_data
         
+        return await self._coalesce(
+            cache_key,
+            lambda: self._fetch_sounds(country, limit, cache_key)
+        )
+    
+    async def _fetch_sounds(
+        self,
+        country: CountryCode,
+        limit: int,
+        cache_key: str
+    ) -> List[Dict]:
+        """Scrape and cache trending sounds."""
         url = self._get_country_url(country)
         
+        # Skip the browser entirely if the page hasn't changed upstream
+        cached_data = await self._revalidate(cache_key, url)
+        if cached_data is not None:
+            return cached_data
+        
         try:
             self.logger.info(
                 f"Scraping trending sounds for {country}",
@@ -478,7 +812,7 @@ class CreativeCenterScraper:
             )
             
             # Scrape the page
-            html = await self._scrape_page(
+            html, validators = await self._scrape_page(
                 url,
                 selector="[data-testid='trending-sounds']",
                 wait_for="div[class*='music']"
@@ -488,7 +822,7 @@ class CreativeCenterScraper:
             sounds = self._extract_sounds_from_html(html, limit)
             
             # Store in cache
-            self._store_in_cache(cache_key, sounds)
+            self._store_in_cache(cache_key, sounds, validators)
             
             self.logger.info(
                 f"Successfully scraped {len(sounds)} sounds for {country}",
@@ -501,16 +835,91 @@ class CreativeCenterScraper:
             self.logger.error(f"Failed to scrape sounds for {country}: {str(e)}")
             return []
     
+    async def _scrape_many(
+        self,
+        scrape: Callable[..., Awaitable[List[Dict]]],
+        countries: List[CountryCode],
+        **kwargs
+    ) -> Dict[CountryCode, List[Dict]]:
+        """
+        Run a per-country scrape for several countries concurrently.
+        
+        All countries share one browser, so the launch cost is paid once;
+        concurrency is bounded by the context pool (max_concurrent).
+        
+        Args:
+            scrape: Bound scrape_trending_* method
+            countries: Country codes to scrape
+            **kwargs: Extra arguments passed to scrape
+            
+        Returns:
+            Mapping of country code to its results (empty on failure)
+        """
+        # Launch before fanning out so concurrent scrapes don't race to start it
+        await self._ensure_browser()
+        
+        results = await asyncio.gather(
+            *(scrape(country, **kwargs) for country in countries),
+            return_exceptions=True
+        )
+        
+        scraped = {}
+        for country, result in zip(countries, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Failed to scrape {country}: {str(result)}")
+                result = []
+            scraped[country] = result
+        
+        return scraped
+    
+    async def scrape_trending_hashtags_many(
+        self,
+        countries: List[CountryCode],
+        limit: int = 50,
+        niche: Optional[NicheType] = None
+    ) -> Dict[CountryCode, List[Dict]]:
+        """
+        Scrape trending hashtags for several countries concurrently.
+        
+        Args:
+            countries: Country codes to scrape
+            limit: Maximum number of hashtags per country
+            niche: Optional niche filter
+            
+        Returns:
+            Mapping of country code to its trending hashtags
+        """
+        return await self._scrape_many(
+            self.scrape_trending_hashtags, countries, limit=limit, niche=niche
+        )
+    
+    async def scrape_trending_sounds_many(
+        self,
+        countries: List[CountryCode],
+        limit: int = 50
+    ) -> Dict[CountryCode, List[Dict]]:
+        """
+        Scrape trending sounds for several countries concurrently.
+        
+        Args:
+            countries: Country codes to scrape
+            limit: Maximum number of sounds per country
+            
+        Returns:
+            Mapping of country code to its trending sounds
+        """
+        return await self._scrape_many(self.scrape_trending_sounds, countries, limit=limit)
+    
     def _extract_sounds_from_html(self, html: str, limit: int = 50) -> List[Dict]:
         """Extract sound data from HTML content."""
         # This is a simplified implementation
         # In reality, you'd parse actual sound data from the page
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         sounds = []
         
         # Look for audio elements or sound-related content
-        audio_elements = soup.find_all(['audio', 'div'], class_=lambda x: x and 'sound' in x.lower())
+        audio_elements = self._SOUND_SELECTOR.select(soup)
         
         for i, element in enumerate(audio_elements[:limit]):
             sounds.append({
@@ -554,13 +963,30 @@ class CreativeCenterScraper:
             List of trending creators
         """
         # Check cache first
-        cache_key = self._get_cache_key("creators", country, limit=limit)
+        cache_key = f"creators|{country.value}|limit={limit}"
         cached_data = self._get_from_cache(cache_key)
         if cached_data:
             return cached_data
         
+        return await self._coalesce(
+            cache_key,
+            lambda: self._fetch_creators(country, limit, cache_key)
+        )
+    
+    async def _fetch_creators(
+        self,
+        country: CountryCode,
+        limit: int,
+        cache_key: str
+    ) -> List[Dict]:
+        """Scrape and cache trending creators."""
         url = self._get_country_url(country)
         
+        # Skip the browser entirely if the page hasn't changed upstream
+        cached_data = await self._revalidate(cache_key, url)
+        if cached_data is not None:
+            return cached_data
+        
         try:
             self.logger.info(
                 f"Scraping trending creators for {country}",
@@ -568,7 +994,7 @@ class CreativeCenterScraper:
             )
             
             # Scrape the page
-            html = await self._scrape_page(
+            html, validators = await self._scrape_page(
                 url,
                 selector="[data-testid='trending-creators']",
                 wait_for="div[class*='creator']"
@@ -578,7 +1004,7 @@ class CreativeCenterScraper:
             creators = self._extract_creators_from_html(html, limit)
             
             # Store in cache
-            self._store_in_cache(cache_key, creators)
+            self._store_in_cache(cache_key, creators, validators)
             
             self.logger.info(
                 f"Successfully scraped {len(creators)} creators for {country}",
@@ -593,11 +1019,11 @@ class CreativeCenterScraper:
     
     def _extract_creators_from_html(self, html: str, limit: int = 50) -> List[Dict]:
         """Extract creator data from HTML content."""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         creators = []
         
         # Look for user profiles or creator-related content
-        user_elements = soup.find_all(['a', 'div'], class_=lambda x: x and 'user' in x.lower())
+        user_elements = self._CREATOR_SELECTOR.select(soup)
         
         for i, element in enumerate(user_elements[:limit]):
             creators.append({
@@ -631,28 +1057,32 @@ class CreativeCenterScraper:
     
     async def close(self) -> None:
         """Close browser and cleanup resources."""
-        if self._context:
-            await self._context.close()
-            self._context = None
-        
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
-        
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
+        if self._context_pool is not None:
+            for context in self._contexts:
+                await context.close()
+            self._contexts.clear()
+            self._context_pool = None
+            
+            # The browser itself is shared and closes with its last user
+            await self._release_browser()
         
-        if self._session:
-            self._session.close()
+        if not self._http.is_closed:
+            await self._http.aclose()
         
         # Clear cache
         self._cache.clear()
+        self._validators.clear()
+        
+        # Persistent entries are kept for the next run
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
         
         self.logger.info("CreativeCenterScraper closed")
     
     async def __aenter__(self):
-        """Async context manager entry."""
+        """Async context manager entry; launches the shared browser once."""
+        await self._ensure_browser()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
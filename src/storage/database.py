@@ -4,12 +4,309 @@ Database Module
 Manages all database operations including CRUD operations and schema management.
 """
 
-from typing import Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Type
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import (
+    URL,
+    DateTime,
+    Enum,
+    Executable,
+    Float,
+    Insert,
+    Integer,
+    Select,
+    SmallInteger,
+    StatementLambdaElement,
+    String,
+    Table,
+    column,
+    create_engine,
+    event,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    make_url,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine, RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, raiseload, selectinload, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.storage.models import Base, Country, Creator, Hashtag, Video
+from src.storage.models.enums import CountryCode, NicheType
+
+# Rows per INSERT ... VALUES batch (SQLAlchemy's insertmanyvalues) and per
+# bulk_create chunk
+BULK_BATCH_SIZE = 10000
+
+# Rows fetched per round-trip when streaming read-only result sets
+STREAM_BATCH_SIZE = 1000
+
+# Async drivers used when a plain sync URL is given to AsyncDatabaseManager
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+# Applied to every new SQLite connection; WAL lets readers run alongside the writer
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Columns with server-side now() defaults that bulk writes fill in themselves
+TIMESTAMP_COLUMNS = ("first_seen", "last_seen", "created_at", "updated_at")
+
+# Columns an upsert never overwrites on an existing row
+UPSERT_PRESERVED_COLUMNS = ("id", "first_seen", "created_at")
+
+# Unique keys the bulk save methods upsert on
+HASHTAG_KEY = ("name", "country_id")
+CREATOR_KEY = ("tiktok_creator_id",)
+VIDEO_KEY = ("tiktok_video_id",)
+
+# PostgreSQL materialized view of per-country hashtag rankings (see the
+# add_trending_snapshots migration); not part of Base.metadata so
+# create_all() never tries to create it as a table
+trending_snapshots = table(
+    "trending_snapshots",
+    column("country_code", Enum(CountryCode)),
+    column("niche", Enum(NicheType)),
+    column("rank", SmallInteger),
+    column("hashtag_name", String),
+    column("viral_score", Integer),
+    column("growth_rate", Float),
+    column("refreshed_at", DateTime(timezone=True)),
+)
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    """Check whether a URL points at an in-memory SQLite database."""
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _engine_options(url: URL) -> Dict[str, Any]:
+    """
+    Get per-backend engine options for a sync engine.
+
+    Args:
+        url: Parsed database URL
+
+    Returns:
+        Keyword arguments for create_engine
+    """
+    backend = url.get_backend_name()
+
+    if backend == "sqlite" and _is_memory_sqlite(url):
+        # One shared connection, otherwise each connection sees an empty database
+        return {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool}
+    if backend == "sqlite":
+        return {"connect_args": {"check_same_thread": False}}
+    if backend == "postgresql":
+        return {"pool_size": 20, "max_overflow": 10, "pool_pre_ping": True, "pool_recycle": 1800}
+
+    return {}
+
+
+def _install_sqlite_pragmas(engine: Engine, url: URL) -> None:
+    """
+    Tune every new SQLite connection of an engine.
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+        url: Parsed database URL of the engine
+    """
+    if url.get_backend_name() != "sqlite":
+        return
+
+    # WAL needs a database file
+    pragmas = SQLITE_PRAGMAS[1:] if _is_memory_sqlite(url) else SQLITE_PRAGMAS
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _stamp_rows(table: Table, rows: List[dict]) -> List[dict]:
+    """
+    Fill in missing timestamp columns with a single application-side UTC time.
+
+    Core bulk inserts don't fire onupdate hooks, and leaving the column out
+    makes the database evaluate now() for every row. Stamping the whole batch
+    with one value avoids both; server defaults remain as a fallback for
+    other write paths.
+
+    Args:
+        table: Target table
+        rows: Column dictionaries, all with the same keys
+
+    Returns:
+        Rows including every timestamp column the table has
+    """
+    missing = [c for c in TIMESTAMP_COLUMNS if c in table.c and c not in rows[0]]
+    if not missing:
+        return rows
+
+    stamps = dict.fromkeys(missing, datetime.now(timezone.utc))
+    return [{**stamps, **row} for row in rows]
+
+
+def _country_query(with_relations: bool = False) -> StatementLambdaElement:
+    """
+    Build a cached Country SELECT, optionally eager-loading its collections.
+
+    Each collection is loaded with one extra SELECT ... WHERE country_id IN
+    (...) for all matched countries, instead of one lazy query per country
+    per collection. joinedload is avoided because joining five collections
+    multiplies the result rows. Any other relationship raises on access
+    rather than silently issuing a lazy query per row.
+
+    The statement is a lambda_stmt: it is built and compiled once per code
+    path, and later calls only re-extract bound values from closures.
+    Extend it with ``stmt += lambda s: s.where(...)``.
+
+    Args:
+        with_relations: Load hashtags, videos, creators, sounds and trends
+
+    Returns:
+        Lambda SELECT statement for Country
+    """
+    stmt = lambda_stmt(lambda: select(Country))
+    if with_relations:
+        stmt += lambda s: s.options(
+            selectinload(Country.hashtags),
+            selectinload(Country.videos),
+            selectinload(Country.creators),
+            selectinload(Country.sounds),
+            selectinload(Country.trends),
+            raiseload("*"),
+        )
+    return stmt
+
+
+def _top_hashtags_query(country_id: int, limit: int) -> StatementLambdaElement:
+    """
+    Build a cached column-only SELECT of a country's hashtag ranking.
+
+    Selecting plain columns returns Row tuples, so list reads skip ORM
+    object construction and identity-map bookkeeping entirely.
+
+    Args:
+        country_id: Country primary key
+        limit: Maximum number of hashtags
+
+    Returns:
+        Lambda SELECT statement ordered by rank
+    """
+    return lambda_stmt(
+        lambda: select(
+            Hashtag.name,
+            Hashtag.rank,
+            Hashtag.viral_score,
+            Hashtag.growth_rate,
+            Hashtag.trend_direction,
+        )
+        .where(Hashtag.country_id == country_id)
+        .order_by(Hashtag.rank)
+        .limit(limit)
+    )
+
+
+def _trending_snapshot_query(
+    dialect_name: str, country_code: str, niche: Optional[NicheType], limit: int
+) -> Select:
+    """
+    Build a SELECT of a country's trending snapshot.
+
+    PostgreSQL reads the materialized view, so serving the ranking is a
+    single indexed scan with no joins. Other backends compute the same
+    columns live from hashtags and countries.
+
+    Args:
+        dialect_name: SQLAlchemy dialect name of the target engine
+        country_code: Two-letter country code
+        niche: Only return hashtags of this niche
+        limit: Maximum number of rows
+
+    Returns:
+        SELECT statement ordered by rank
+    """
+    if dialect_name == "postgresql":
+        snapshot = trending_snapshots.c
+        stmt = select(trending_snapshots).where(snapshot.country_code == country_code)
+        if niche is not None:
+            stmt = stmt.where(snapshot.niche == niche)
+        return stmt.order_by(snapshot.rank).limit(limit)
+
+    stmt = (
+        select(
+            Country.code.label("country_code"),
+            Hashtag.niche,
+            Hashtag.rank,
+            Hashtag.name.label("hashtag_name"),
+            Hashtag.viral_score,
+            Hashtag.growth_rate,
+            literal(datetime.now(timezone.utc), DateTime(timezone=True)).label("refreshed_at"),
+        )
+        .join(Country, Hashtag.country_id == Country.id)
+        .where(Country.code == country_code, Country.is_active.is_(True))
+    )
+    if niche is not None:
+        stmt = stmt.where(Hashtag.niche == niche)
+    return stmt.order_by(Hashtag.rank).limit(limit)
+
+
+@lru_cache(maxsize=64)
+def _upsert(
+    dialect_name: str, table: Table, keys: Tuple[str, ...], columns: Tuple[str, ...]
+) -> Insert:
+    """
+    Build an INSERT that updates the existing row on a key conflict where supported.
+
+    Other dialects get a plain INSERT, so duplicates raise as before. The
+    statement only depends on its arguments, so it is built once per
+    table and row shape and reused by every later batch.
+
+    Args:
+        dialect_name: SQLAlchemy dialect name of the target engine
+        table: Target table; Core inserts skip ORM object construction per row
+        keys: Columns of the unique constraint identifying a row
+        columns: Columns present in the rows being written
+
+    Returns:
+        INSERT statement for executemany
+    """
+    dialect_insert = {
+        "postgresql": postgresql.insert,
+        "sqlite": sqlite.insert,
+    }.get(dialect_name)
+
+    if dialect_insert is None:
+        return insert(table)
+
+    stmt = dialect_insert(table)
+    updates = {
+        column: stmt.excluded[column]
+        for column in columns
+        if column not in keys and column not in UPSERT_PRESERVED_COLUMNS
+    }
+    if "last_seen" in table.c:
+        updates.setdefault("last_seen", func.now())
+
+    return stmt.on_conflict_do_update(index_elements=list(keys), set_=updates)
 
 
 class DatabaseManager:
@@ -22,8 +319,16 @@ class DatabaseManager:
         Args:
             database_url: SQLAlchemy database URL
         """
+        url = make_url(database_url)
+
         self.database_url = database_url
-        self.engine = create_engine(database_url, echo=False)
+        self.engine = create_engine(
+            url,
+            echo=False,
+            insertmanyvalues_page_size=BULK_BATCH_SIZE,
+            **_engine_options(url),
+        )
+        _install_sqlite_pragmas(self.engine, url)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
     def get_session(self) -> Session:
@@ -65,6 +370,98 @@ class DatabaseManager:
                 "country_id": hashtag.country_id,
             }
 
+    def _save_bulk(self, table: Table, keys: Tuple[str, ...], rows: List[dict]) -> int:
+        """
+        Upsert many rows in batched INSERT ... ON CONFLICT DO UPDATE statements.
+
+        One statement is sent per BULK_BATCH_SIZE rows instead of a
+        SELECT-then-INSERT/UPDATE round-trip per row.
+
+        Args:
+            table: Target table
+            keys: Columns of the unique constraint identifying a row
+            rows: Column dictionaries, all with the same keys
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        rows = _stamp_rows(table, rows)
+        stmt = _upsert(self.engine.dialect.name, table, keys, tuple(rows[0]))
+        with self.engine.begin() as conn:
+            conn.execute(stmt, rows)
+
+        return len(rows)
+
+    def save_hashtags_bulk(self, rows: List[dict]) -> int:
+        """
+        Save many hashtags in a single batched INSERT.
+
+        On PostgreSQL and SQLite, rows matching an existing hashtag
+        (same name and country) update it instead of failing.
+
+        Args:
+            rows: Hashtag information dictionaries, all with the same keys
+
+        Returns:
+            Number of rows written
+        """
+        return self._save_bulk(Hashtag.__table__, HASHTAG_KEY, rows)
+
+    def save_creators_bulk(self, rows: List[dict]) -> int:
+        """
+        Save many creators, updating those already stored (same tiktok_creator_id).
+
+        Args:
+            rows: Creator information dictionaries, all with the same keys
+
+        Returns:
+            Number of rows written
+        """
+        return self._save_bulk(Creator.__table__, CREATOR_KEY, rows)
+
+    def save_videos_bulk(self, rows: List[dict]) -> int:
+        """
+        Save many videos, updating those already stored (same tiktok_video_id).
+
+        Args:
+            rows: Video information dictionaries, all with the same keys
+
+        Returns:
+            Number of rows written
+        """
+        return self._save_bulk(Video.__table__, VIDEO_KEY, rows)
+
+    def bulk_create(self, model: Type[Base], rows: List[dict]) -> List[int]:
+        """
+        Insert many rows of a model, returning their primary keys.
+
+        Rows are sent as batched INSERT ... RETURNING statements instead of
+        one INSERT plus refresh per ORM object.
+
+        Args:
+            model: Mapped model class (e.g. Video, Creator)
+            rows: Column dictionaries, all with the same keys
+
+        Returns:
+            New primary keys, in the same order as rows
+        """
+        ids: List[int] = []
+        if not rows:
+            return ids
+
+        rows = _stamp_rows(model.__table__, rows)
+        stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+        with self.get_session() as session:
+            for start in range(0, len(rows), BULK_BATCH_SIZE):
+                result = session.execute(stmt, rows[start : start + BULK_BATCH_SIZE])
+                ids.extend(result.scalars())
+            session.commit()
+
+        return ids
+
     def save_video(self, video_data: dict) -> dict:
         """
         Save video to database.
@@ -107,15 +504,391 @@ class DatabaseManager:
                 "tiktok_creator_id": creator.tiktok_creator_id,
             }
 
-    def get_country_by_code(self, country_code: str) -> Optional[Country]:
+    def get_country_by_code(
+        self, country_code: str, with_relations: bool = False
+    ) -> Optional[Country]:
         """
         Get country by country code.
 
         Args:
             country_code: Two-letter country code
+            with_relations: Eager-load the country's collections
 
         Returns:
             Country instance or None
         """
+        stmt = _country_query(with_relations)
+        stmt += lambda s: s.where(Country.code == country_code).limit(1)
+        with self.get_session() as session:
+            return session.scalars(stmt).first()
+
+    def get_active_countries(self, with_relations: bool = False) -> List[Country]:
+        """
+        Get all active countries.
+
+        Args:
+            with_relations: Eager-load each country's collections
+
+        Returns:
+            Active Country instances
+        """
+        stmt = _country_query(with_relations)
+        stmt += lambda s: s.where(Country.is_active.is_(True))
         with self.get_session() as session:
-            return session.query(Country).filter(Country.code == country_code).first()
+            return list(session.scalars(stmt))
+
+    def iter_rows(self, stmt: Executable) -> Iterator[RowMapping]:
+        """
+        Stream a Core SELECT as column mappings, bypassing the ORM.
+
+        Rows are fetched STREAM_BATCH_SIZE at a time, so large reads never
+        hold the full result set in memory.
+
+        Args:
+            stmt: SELECT of plain columns
+
+        Yields:
+            One mapping of column name to value per row
+        """
+        with self.engine.connect() as conn:
+            result = conn.execution_options(yield_per=STREAM_BATCH_SIZE).execute(stmt)
+            yield from result.mappings()
+
+    def get_top_hashtags(self, country_id: int, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get a country's top-ranked hashtags.
+
+        Args:
+            country_id: Country primary key
+            limit: Maximum number of hashtags
+
+        Returns:
+            Hashtag dictionaries ordered by rank
+        """
+        return [dict(row) for row in self.iter_rows(_top_hashtags_query(country_id, limit))]
+
+    def refresh_trending_snapshots(self) -> bool:
+        """
+        Refresh the trending_snapshots materialized view.
+
+        CONCURRENTLY keeps the old snapshot readable while the new one is
+        built. Only PostgreSQL has the view; elsewhere this does nothing.
+
+        Returns:
+            True if the view was refreshed
+        """
+        if self.engine.dialect.name != "postgresql":
+            return False
+
+        with self.engine.begin() as conn:
+            conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY trending_snapshots"))
+        return True
+
+    def get_trending_snapshot(
+        self, country_code: str, niche: Optional[NicheType] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a country's trending hashtags from the latest snapshot.
+
+        Args:
+            country_code: Two-letter country code
+            niche: Only return hashtags of this niche
+            limit: Maximum number of hashtags
+
+        Returns:
+            Snapshot dictionaries ordered by rank
+        """
+        stmt = _trending_snapshot_query(self.engine.dialect.name, country_code, niche, limit)
+        return [dict(row) for row in self.iter_rows(stmt)]
+
+
+class AsyncDatabaseManager:
+    """
+    Manages database operations on an async engine.
+
+    Use this from coroutines (scrapers, scheduled jobs) so inserts don't
+    block the event loop; DatabaseManager remains for scripts and tests.
+    """
+
+    def __init__(self, database_url: str):
+        """
+        Initialize async database manager.
+
+        Args:
+            database_url: SQLAlchemy database URL; sync SQLite/PostgreSQL URLs
+                are switched to the aiosqlite/asyncpg drivers
+        """
+        url = make_url(database_url)
+        if url.drivername in ASYNC_DRIVERS:
+            url = url.set(drivername=ASYNC_DRIVERS[url.drivername])
+
+        engine_kwargs = {"echo": False, "insertmanyvalues_page_size": BULK_BATCH_SIZE}
+        if url.get_backend_name() == "postgresql":
+            engine_kwargs.update(pool_size=20, max_overflow=0, pool_pre_ping=True)
+
+        self.database_url = url.render_as_string(hide_password=False)
+        self.engine = create_async_engine(url, **engine_kwargs)
+        _install_sqlite_pragmas(self.engine.sync_engine, url)
+        self.SessionLocal = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    def get_session(self) -> AsyncSession:
+        """
+        Get async database session.
+
+        Returns:
+            SQLAlchemy async session
+        """
+        return self.SessionLocal()
+
+    async def create_tables(self) -> None:
+        """Create all tables in the database."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def drop_tables(self) -> None:
+        """Drop all tables from the database."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+
+    async def dispose(self) -> None:
+        """Close all pooled connections."""
+        await self.engine.dispose()
+
+    async def save_hashtag(self, hashtag_data: dict) -> dict:
+        """
+        Save hashtag to database.
+
+        Args:
+            hashtag_data: Hashtag information dictionary
+
+        Returns:
+            Saved hashtag data
+        """
+        async with self.get_session() as session:
+            hashtag = Hashtag(**hashtag_data)
+            session.add(hashtag)
+            await session.commit()
+            return {
+                "id": hashtag.id,
+                "name": hashtag.name,
+                "rank": hashtag.rank,
+                "country_id": hashtag.country_id,
+            }
+
+    async def _save_bulk(self, table: Table, keys: Tuple[str, ...], rows: List[dict]) -> int:
+        """
+        Upsert many rows in batched INSERT ... ON CONFLICT DO UPDATE statements.
+
+        Args:
+            table: Target table
+            keys: Columns of the unique constraint identifying a row
+            rows: Column dictionaries, all with the same keys
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        rows = _stamp_rows(table, rows)
+        stmt = _upsert(self.engine.dialect.name, table, keys, tuple(rows[0]))
+        async with self.engine.begin() as conn:
+            await conn.execute(stmt, rows)
+
+        return len(rows)
+
+    async def save_hashtags_bulk(self, rows: List[dict]) -> int:
+        """
+        Save many hashtags in a single batched INSERT.
+
+        Args:
+            rows: Hashtag information dictionaries, all with the same keys
+
+        Returns:
+            Number of rows written
+        """
+        return await self._save_bulk(Hashtag.__table__, HASHTAG_KEY, rows)
+
+    async def save_creators_bulk(self, rows: List[dict]) -> int:
+        """
+        Save many creators, updating those already stored (same tiktok_creator_id).
+
+        Args:
+            rows: Creator information dictionaries, all with the same keys
+
+        Returns:
+            Number of rows written
+        """
+        return await self._save_bulk(Creator.__table__, CREATOR_KEY, rows)
+
+    async def save_videos_bulk(self, rows: List[dict]) -> int:
+        """
+        Save many videos, updating those already stored (same tiktok_video_id).
+
+        Args:
+            rows: Video information dictionaries, all with the same keys
+
+        Returns:
+            Number of rows written
+        """
+        return await self._save_bulk(Video.__table__, VIDEO_KEY, rows)
+
+    async def bulk_create(self, model: Type[Base], rows: List[dict]) -> List[int]:
+        """
+        Insert many rows of a model, returning their primary keys.
+
+        Args:
+            model: Mapped model class (e.g. Video, Creator)
+            rows: Column dictionaries, all with the same keys
+
+        Returns:
+            New primary keys, in the same order as rows
+        """
+        ids: List[int] = []
+        if not rows:
+            return ids
+
+        rows = _stamp_rows(model.__table__, rows)
+        stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+        async with self.get_session() as session:
+            for start in range(0, len(rows), BULK_BATCH_SIZE):
+                result = await session.execute(stmt, rows[start : start + BULK_BATCH_SIZE])
+                ids.extend(result.scalars())
+            await session.commit()
+
+        return ids
+
+    async def save_video(self, video_data: dict) -> dict:
+        """
+        Save video to database.
+
+        Args:
+            video_data: Video information dictionary
+
+        Returns:
+            Saved video data
+        """
+        async with self.get_session() as session:
+            video = Video(**video_data)
+            session.add(video)
+            await session.commit()
+            return {
+                "id": video.id,
+                "tiktok_video_id": video.tiktok_video_id,
+                "creator_id": video.creator_id,
+            }
+
+    async def save_creator(self, creator_data: dict) -> dict:
+        """
+        Save creator to database.
+
+        Args:
+            creator_data: Creator information dictionary
+
+        Returns:
+            Saved creator data
+        """
+        async with self.get_session() as session:
+            creator = Creator(**creator_data)
+            session.add(creator)
+            await session.commit()
+            return {
+                "id": creator.id,
+                "username": creator.username,
+                "tiktok_creator_id": creator.tiktok_creator_id,
+            }
+
+    async def get_country_by_code(
+        self, country_code: str, with_relations: bool = False
+    ) -> Optional[Country]:
+        """
+        Get country by country code.
+
+        Args:
+            country_code: Two-letter country code
+            with_relations: Eager-load the country's collections
+
+        Returns:
+            Country instance or None
+        """
+        stmt = _country_query(with_relations)
+        stmt += lambda s: s.where(Country.code == country_code).limit(1)
+        async with self.get_session() as session:
+            return await session.scalar(stmt)
+
+    async def get_active_countries(self, with_relations: bool = False) -> List[Country]:
+        """
+        Get all active countries.
+
+        Args:
+            with_relations: Eager-load each country's collections
+
+        Returns:
+            Active Country instances
+        """
+        stmt = _country_query(with_relations)
+        stmt += lambda s: s.where(Country.is_active.is_(True))
+        async with self.get_session() as session:
+            return list(await session.scalars(stmt))
+
+    async def iter_rows(self, stmt: Executable) -> AsyncIterator[RowMapping]:
+        """
+        Stream a Core SELECT as column mappings, bypassing the ORM.
+
+        Args:
+            stmt: SELECT of plain columns
+
+        Yields:
+            One mapping of column name to value per row
+        """
+        async with self.engine.connect() as conn:
+            result = await conn.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+            async for row in result.mappings():
+                yield row
+
+    async def get_top_hashtags(self, country_id: int, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get a country's top-ranked hashtags.
+
+        Args:
+            country_id: Country primary key
+            limit: Maximum number of hashtags
+
+        Returns:
+            Hashtag dictionaries ordered by rank
+        """
+        return [dict(row) async for row in self.iter_rows(_top_hashtags_query(country_id, limit))]
+
+    async def refresh_trending_snapshots(self) -> bool:
+        """
+        Refresh the trending_snapshots materialized view.
+
+        Suitable as a TaskScheduler snapshot job. Only PostgreSQL has the
+        view; elsewhere this does nothing.
+
+        Returns:
+            True if the view was refreshed
+        """
+        if self.engine.dialect.name != "postgresql":
+            return False
+
+        async with self.engine.begin() as conn:
+            await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY trending_snapshots"))
+        return True
+
+    async def get_trending_snapshot(
+        self, country_code: str, niche: Optional[NicheType] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a country's trending hashtags from the latest snapshot.
+
+        Args:
+            country_code: Two-letter country code
+            niche: Only return hashtags of this niche
+            limit: Maximum number of hashtags
+
+        Returns:
+            Snapshot dictionaries ordered by rank
+        """
+        stmt = _trending_snapshot_query(self.engine.dialect.name, country_code, niche, limit)
+        return [dict(row) async for row in self.iter_rows(stmt)]
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import List
 
-from sqlalchemy import Boolean, Enum, Float, Index, String
+from sqlalchemy import Boolean, Enum, Float, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.storage.models.base import Base, TimestampMixin
@@ -28,7 +28,7 @@ class Country(Base, TimestampMixin):
     users_in_millions: Mapped[float] = mapped_column(Float, nullable=False)
     growth_rate: Mapped[float] = mapped_column(Float, nullable=False)
     timezone: Mapped[str] = mapped_column(String(50), nullable=False)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Relationships
     hashtags: Mapped[List["Hashtag"]] = relationship(
@@ -47,7 +47,15 @@ class Country(Base, TimestampMixin):
         "Trend", back_populates="country", cascade="all, delete-orphan"
     )
 
-    __table_args__ = (Index("idx_country_code", "code"), Index("idx_country_active", "is_active"))
+    # Only active countries are ever looked up by the flag, so index just those rows
+    __table_args__ = (
+        Index(
+            "idx_country_active",
+            "code",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<Country(code={self.code}, name={self.name})>"
@@ -17,8 +17,10 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -38,7 +40,7 @@ class Creator(Base):
     profile_image: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Stats
-    followers: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False, index=True)
+    followers: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
     follower_growth: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
     videos_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     likes_count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
@@ -49,22 +51,22 @@ class Creator(Base):
 
     # Trending status
     is_trending: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    trending_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    trending_rank: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
 
     # Timestamps
     first_seen: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+    # Rewritten on every scrape; left unindexed so PostgreSQL can update rows in place (HOT)
     last_seen: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
         server_default=func.now(),
         onupdate=func.now(),
     )
 
     # Relationships
-    country: Mapped["Country"] = relationship("Country", back_populates="creators")
+    country: Mapped["Country"] = relationship("Country", back_populates="creators", lazy="joined")
     videos: Mapped[List["Video"]] = relationship(
         "Video", back_populates="creator", cascade="all, delete-orphan"
     )
@@ -73,8 +75,15 @@ class Creator(Base):
     )
 
     __table_args__ = (
-        Index("idx_creator_country_trending", "country_id", "is_trending"),
-        Index("idx_creator_tiktok_id", "tiktok_creator_id"),
+        # Partial: only the small trending subset is ever ranked per country
+        Index(
+            "idx_creator_trending_rank",
+            "country_id",
+            "trending_rank",
+            postgresql_include=["username", "followers"],
+            postgresql_where=text("is_trending = true"),
+            sqlite_where=text("is_trending = 1"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -9,7 +9,18 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import BigInteger, DateTime, Enum, Float, ForeignKey, Index, Integer, String, func
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.storage.models.base import Base
@@ -37,8 +48,8 @@ class Hashtag(Base):
     )
 
     # Ranking
-    rank: Mapped[int] = mapped_column(Integer, nullable=False)
-    previous_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    rank: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    previous_rank: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
 
     # Data collection
     data_source: Mapped[DataSourceType] = mapped_column(Enum(DataSourceType), nullable=False)
@@ -47,16 +58,16 @@ class Hashtag(Base):
     first_seen: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+    # Rewritten on every scrape; left unindexed so PostgreSQL can update rows in place (HOT)
     last_seen: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
         server_default=func.now(),
         onupdate=func.now(),
     )
 
     # Relationships
-    country: Mapped["Country"] = relationship("Country", back_populates="hashtags")
+    country: Mapped["Country"] = relationship("Country", back_populates="hashtags", lazy="joined")
     videos: Mapped[List["Video"]] = relationship(
         "Video", secondary="video_hashtags", back_populates="hashtags"
     )
@@ -67,7 +78,13 @@ class Hashtag(Base):
     __table_args__ = (
         Index("idx_hashtag_name_country", "name", "country_id", unique=True),
         Index("idx_hashtag_country_niche", "country_id", "niche"),
-        Index("idx_hashtag_rank_country", "rank", "country_id"),
+        # Covers get_top_hashtags: the ranking is read straight from the index
+        Index(
+            "idx_hashtag_rank_country",
+            "country_id",
+            "rank",
+            postgresql_include=["name", "viral_score", "growth_rate", "trend_direction"],
+        ),
     )
 
     def __repr__(self) -> str:
@@ -17,6 +17,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Table,
     func,
@@ -32,6 +33,8 @@ sound_videos = Table(
     Base.metadata,
     Column("sound_id", Integer, ForeignKey("sounds.id", ondelete="CASCADE"), primary_key=True),
     Column("video_id", Integer, ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key serves sound -> videos; this serves video -> sounds
+    Index("ix_sound_videos_video_sound", "video_id", "sound_id"),
 )
 
 
@@ -55,7 +58,7 @@ class Sound(Base):
     niche: Mapped[NicheType] = mapped_column(Enum(NicheType), nullable=False)
 
     # Ranking
-    rank: Mapped[int] = mapped_column(Integer, nullable=False)
+    rank: Mapped[int] = mapped_column(SmallInteger, nullable=False)
     trend_direction: Mapped[TrendDirection] = mapped_column(
         Enum(TrendDirection), default=TrendDirection.STABLE, nullable=False
     )
@@ -64,10 +67,10 @@ class Sound(Base):
     first_seen: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+    # Rewritten on every scrape; left unindexed so PostgreSQL can update rows in place (HOT)
     last_seen: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
         server_default=func.now(),
         onupdate=func.now(),
     )
@@ -83,7 +86,12 @@ class Sound(Base):
 
     __table_args__ = (
         Index("idx_sound_tiktok_country", "tiktok_sound_id", "country_id", unique=True),
-        Index("idx_sound_country_rank", "country_id", "rank"),
+        Index(
+            "idx_sound_country_rank",
+            "country_id",
+            "rank",
+            postgresql_include=["name", "artist", "viral_score"],
+        ),
         Index("idx_sound_growth_rate", "growth_rate"),
     )
 
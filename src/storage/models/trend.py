@@ -21,6 +21,7 @@ from sqlalchemy import (
     String,
     Table,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +34,8 @@ trend_hashtags = Table(
     Base.metadata,
     Column("trend_id", Integer, ForeignKey("trends.id", ondelete="CASCADE"), primary_key=True),
     Column("hashtag_id", Integer, ForeignKey("hashtags.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key serves trend -> hashtags; this serves hashtag -> trends
+    Index("ix_trend_hashtags_hashtag_trend", "hashtag_id", "trend_id"),
 )
 
 trend_sounds = Table(
@@ -40,6 +43,7 @@ trend_sounds = Table(
     Base.metadata,
     Column("trend_id", Integer, ForeignKey("trends.id", ondelete="CASCADE"), primary_key=True),
     Column("sound_id", Integer, ForeignKey("sounds.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_trend_sounds_sound_trend", "sound_id", "trend_id"),
 )
 
 trend_creators = Table(
@@ -47,6 +51,7 @@ trend_creators = Table(
     Base.metadata,
     Column("trend_id", Integer, ForeignKey("trends.id", ondelete="CASCADE"), primary_key=True),
     Column("creator_id", Integer, ForeignKey("creators.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_trend_creators_creator_trend", "creator_id", "trend_id"),
 )
 
 
@@ -90,7 +95,12 @@ class Trend(Base, TimestampMixin):
     )
 
     __table_args__ = (
-        Index("idx_trend_country_active", "country_id", "is_active"),
+        Index(
+            "idx_trend_country_active",
+            "country_id",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1"),
+        ),
         Index("idx_trend_viral_score", "viral_score"),
     )
 
@@ -17,6 +17,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Table,
 )
@@ -30,6 +31,8 @@ video_hashtags = Table(
     Base.metadata,
     Column("video_id", Integer, ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True),
     Column("hashtag_id", Integer, ForeignKey("hashtags.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key serves video -> hashtags; this serves hashtag -> videos
+    Index("ix_video_hashtags_hashtag_video", "hashtag_id", "video_id"),
 )
 
 
@@ -39,7 +42,8 @@ class Video(Base, TimestampMixin):
     __tablename__ = "videos"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    tiktok_video_id: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    # TikTok video ids are 19-digit snowflakes; storing them as integers halves the key size
+    tiktok_video_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
 
     # Creator info
     creator_id: Mapped[int] = mapped_column(
@@ -64,16 +68,15 @@ class Video(Base, TimestampMixin):
 
     # Content metadata
     music_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    duration: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    duration: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)  # seconds
 
     # Timestamps
-    tiktok_created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, index=True
-    )
+    tiktok_created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     # Relationships
-    creator: Mapped["Creator"] = relationship("Creator", back_populates="videos")
-    country: Mapped["Country"] = relationship("Country", back_populates="videos")
+    # Many-to-one edges are read whenever a video is serialized; join them in up front
+    creator: Mapped["Creator"] = relationship("Creator", back_populates="videos", lazy="joined")
+    country: Mapped["Country"] = relationship("Country", back_populates="videos", lazy="joined")
     hashtags: Mapped[List["Hashtag"]] = relationship(
         "Hashtag", secondary=video_hashtags, back_populates="videos"
     )
@@ -82,9 +85,15 @@ class Video(Base, TimestampMixin):
     )
 
     __table_args__ = (
-        Index("idx_video_creator", "creator_id"),
         Index("idx_video_country", "country_id"),
-        Index("idx_video_tiktok_id", "tiktok_video_id"),
+        # Videos are ingested roughly in publish order and only ever range-scanned
+        # by date, so a BRIN summary is enough and a fraction of the B-tree's size
+        Index(
+            "brin_video_tiktok_created_at",
+            "tiktok_created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self) -> str:
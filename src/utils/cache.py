@@ -0,0 +1,221 @@
+"""
+Caching utilities.
+
+Provides a bounded in-memory LRU cache with per-entry time-to-live and a
+persistent SQLite-backed cache that survives process restarts.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple, Union
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed TTL.
+
+    Expired entries are not returned by get() but are kept until LRU
+    eviction pushes them out, so callers can still fall back to the last
+    known value with get_stale() when a refresh fails. Expiry is measured
+    with the monotonic clock, so wall-clock adjustments don't affect it.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (fresh or stale)
+            ttl: Seconds an entry stays fresh after being stored
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a fresh value, marking it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def get_stale(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a value whether or not it has expired.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key was never stored or was evicted
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the entry stays fresh (defaults to the cache TTL)
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def touch(self, key: Hashable) -> bool:
+        """
+        Restart the TTL of an existing entry, fresh or stale.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the entry existed and was refreshed
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+
+        self.set(key, entry[1])
+        return True
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove an entry and return its value (fresh or stale)."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+
+class DiskCache:
+    """
+    Persistent key/value cache stored in a SQLite file.
+
+    Values must be JSON-serializable. Expiry uses wall-clock time so entries
+    written by one process are honoured by the next one.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: float = 3600):
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays valid after being stored
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_with_ttl(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Get a valid value with its remaining lifetime.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, seconds left) or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1] - now
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """
+        Get a valid value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            Cached value or default
+        """
+        entry = self.get_with_ttl(key)
+        return default if entry is None else entry[0]
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, replacing any previous one.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        payload = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + self.ttl),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -5,11 +5,16 @@ Implements intelligent fallback pipeline with multiple data sources.
 """
 
 import asyncio
+import heapq
+import itertools
+import logging
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Any, Set, Tuple, Union
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 from src.utils.logger import setup_logger
 from src.utils.rate_limiter import RateLimiter
@@ -18,6 +23,59 @@ from src.scrapers.creative_center_scraper import CreativeCenterScraper, Scraping
 from src.storage.models.enums import CountryCode, NicheType, DataSourceType, TrendDirection
 
 
+# (data_type, country, limit, niche)
+CacheKey = Tuple[str, CountryCode, Optional[int], Optional[NicheType]]
+
+# Cache TTL by data type (seconds)
+_CACHE_TTL = MappingProxyType({
+    "hashtags": 3600,  # 1 hour
+    "creators": 1800,  # 30 minutes
+    "sounds": 1800,    # 30 minutes
+    "trends": 900,     # 15 minutes
+})
+_DEFAULT_TTL = _CACHE_TTL["hashtags"]
+
+# Request counters, stored in a flat list indexed by these positions
+_STAT_NAMES = (
+    "total_requests",
+    "api_successes",
+    "scraper_successes",
+    "cache_hits",
+    "fallback_usage",
+    "total_failures",
+)
+(
+    _S_TOTAL,
+    _S_API,
+    _S_SCRAPER,
+    _S_CACHE_HITS,
+    _S_FALLBACK,
+    _S_FAILURES,
+) = range(len(_STAT_NAMES))
+
+# Structured fields attached to the per-success log record (see JSONFormatter)
+_SUCCESS_EVENT = MappingProxyType({
+    "event": "fallback_success",
+    "data_type": None,
+    "country": None,
+    "source": None,
+    "count": None,
+    "duration_ms": None,
+})
+
+# Synthetic hashtags served by the Playwright fallback (copied per call)
+_FALLBACK_HASHTAGS = tuple(
+    {
+        "name": f"#fallback{hashtag}",
+        "usage_count": 1000 + hashtag * 100,
+        "engagement": 50.0,
+        "growth_rate": 0.0,
+        "trend_direction": "STABLE"
+    }
+    for hashtag in range(5)
+)
+
+
 class DataSource(Enum):
     """Data source priority."""
     OFFICIAL_API = 1
@@ -26,7 +84,7 @@ class DataSource(Enum):
     CACHED_DATA = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class FallbackResult:
     """Result from fallback attempt."""
     success: bool
@@ -37,18 +95,53 @@ class FallbackResult:
     cache_hit: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
+class SourceHealth:
+    """
+    Availability tracking for one data source.
+    
+    Works as a circuit breaker: closed (normal), open (skipped until
+    open_until) and half_open (a single probe request is let through).
+    """
+    available: bool = True
+    last_success: Optional[datetime] = None
+    failures: int = 0
+    state: Literal["closed", "open", "half_open"] = "closed"
+    open_until: float = 0.0
+
+
+@dataclass(slots=True)
 class CacheEntry:
-    """Cache entry for trend data."""
+    """
+    Cache entry for trend data.
+    
+    TTL checks use the monotonic clock (stored_at/expires_at); the wall-clock
+    timestamp is kept only for reporting.
+    """
     data: List[Dict]
-    timestamp: datetime
     source: DataSource
     ttl_seconds: int
+    stale_ttl_seconds: int = 0
+    refreshing: bool = False
+    stored_at: float = field(default_factory=time.monotonic)
+    expires_at: float = 0.0
+    wall_timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    
+    def __post_init__(self) -> None:
+        if not self.expires_at:
+            self.expires_at = self.stored_at + self.ttl_seconds
+    
+    def age(self) -> float:
+        """Seconds since the entry was stored."""
+        return time.monotonic() - self.stored_at
     
     def is_expired(self) -> bool:
         """Check if cache entry is expired."""
-        now = datetime.now(timezone.utc)
-        return (now - self.timestamp).total_seconds() > self.ttl_seconds
+        return time.monotonic() > self.expires_at
+    
+    def is_stale_servable(self) -> bool:
+        """Check if an expired entry may still be served while it is refreshed."""
+        return self.expires_at < time.monotonic() <= self.expires_at + self.stale_ttl_seconds
 
 
 class FallbackHandler:
@@ -58,23 +151,32 @@ class FallbackHandler:
     Implements multi-tier fallback strategy with caching and performance monitoring.
     """
     
-    # Cache TTL by data type (seconds)
-    CACHE_TTL = {
-        "hashtags": 3600,  # 1 hour
-        "creators": 1800,  # 30 minutes
-        "sounds": 1800,    # 30 minutes
-        "trends": 900,     # 15 minutes
-    }
+    # Cache TTL by data type (seconds), read-only
+    CACHE_TTL = _CACHE_TTL
     
     # Maximum age for cached data to be used as fallback
     MAX_CACHE_AGE = 24 * 3600  # 24 hours
     
+    # How often entries older than MAX_CACHE_AGE are swept from the cache
+    CACHE_SWEEP_INTERVAL = 600  # 10 minutes
+    
+    # Circuit breaker: consecutive failures before a source is opened, the cap
+    # on its exponential open period, and how long a half-open probe may take
+    # before another one is allowed
+    CIRCUIT_FAILURE_THRESHOLD = 3
+    CIRCUIT_MAX_OPEN_SECONDS = 300
+    CIRCUIT_PROBE_TIMEOUT = 60
+    
     def __init__(
         self,
         api_client: Optional[TikTokAPIClient] = None,
         scraper: Optional[CreativeCenterScraper] = None,
         rate_limiter: Optional[RateLimiter] = None,
-        enable_cache: bool = True
+        enable_cache: bool = True,
+        enable_swr: bool = False,
+        stale_ttl_seconds: int = 900,
+        max_entries: int = 10_000,
+        rate_limit_max_wait_ms: Optional[int] = None
     ):
         """
         Initialize fallback handler.
@@ -84,32 +186,49 @@ class FallbackHandler:
             scraper: Creative Center scraper
             rate_limiter: Rate limiter instance
             enable_cache: Whether to enable caching
+            enable_swr: Serve expired cache entries immediately and refresh
+                them in the background (stale-while-revalidate)
+            stale_ttl_seconds: How long past its TTL an entry may be served
+                while a refresh is running
+            max_entries: Maximum cached keys; least recently used are evicted
+            rate_limit_max_wait_ms: Longest a source may wait for a rate-limit
+                slot; if the limiter needs longer, the source is skipped and the
+                next one tried. None waits as long as needed.
         """
         self.api_client = api_client
         self.scraper = scraper
         self.rate_limiter = rate_limiter
         self.enable_cache = enable_cache
+        self.enable_swr = enable_swr
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.rate_limit_max_wait_ms = rate_limit_max_wait_ms
         
         self.logger = setup_logger("fallback_handler")
         
-        # Cache storage
-        self._cache: Dict[str, CacheEntry] = {}
-        
-        # Performance statistics
-        self._stats = {
-            "total_requests": 0,
-            "api_successes": 0,
-            "scraper_successes": 0,
-            "cache_hits": 0,
-            "fallback_usage": 0,
-            "total_failures": 0
-        }
+        # Cache storage, in least- to most-recently-used order
+        self._cache: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._max_entries = max_entries
+        self._sweeper: Optional[asyncio.Task] = None
+        
+        # Min-heap of (stored_at, seq, key, entry) for age-based sweeps. Entries
+        # replaced or evicted since are left in place and skipped when popped.
+        self._age_heap: List[Tuple[float, int, CacheKey, CacheEntry]] = []
+        self._heap_seq = itertools.count()
+        
+        # Background stale-while-revalidate refreshes (kept referenced until done)
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        
+        # Live fetches in progress, shared by concurrent requests for the same key
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+        
+        # Performance statistics (see _STAT_NAMES)
+        self._stats: List[int] = [0] * len(_STAT_NAMES)
         
         # Source availability tracking
-        self._source_health = {
-            DataSource.OFFICIAL_API: {"available": True, "last_success": None, "failures": 0},
-            DataSource.CREATIVE_CENTER: {"available": True, "last_success": None, "failures": 0},
-            DataSource.PLAYWRIGHT_FALLBACK: {"available": True, "last_success": None, "failures": 0}
+        self._source_health: Dict[DataSource, SourceHealth] = {
+            DataSource.OFFICIAL_API: SourceHealth(),
+            DataSource.CREATIVE_CENTER: SourceHealth(),
+            DataSource.PLAYWRIGHT_FALLBACK: SourceHealth()
         }
         
         self.logger.info("FallbackHandler initialized")
@@ -119,38 +238,48 @@ class FallbackHandler:
         data_type: str,
         country: CountryCode,
         **kwargs
-    ) -> str:
-        """Generate cache key for data request."""
-        key_parts = [data_type, country.value]
-        
-        # Sort kwargs for consistent keys
-        for k, v in sorted(kwargs.items()):
-            if v is not None:
-                key_parts.append(f"{k}={v}")
+    ) -> CacheKey:
+        """
+        Generate cache key for data request.
         
-        return "|".join(key_parts)
+        A plain tuple of hashable values: hashing it needs no sorting or
+        string formatting on the request path.
+        """
+        return (data_type, country, kwargs.get("limit"), kwargs.get("niche"))
     
-    def _get_from_cache(self, cache_key: str, allow_expired: bool = False) -> Optional[FallbackResult]:
-        """Get data from cache if available."""
+    def _get_from_cache(
+        self,
+        cache_key: CacheKey,
+        allow_expired: bool = False,
+        entry: Optional[CacheEntry] = None
+    ) -> Optional[FallbackResult]:
+        """
+        Get data from cache if available.
+        
+        Callers that already looked the key up pass its entry, so the key
+        (whose enum members hash in Python) is not hashed again.
+        """
         if not self.enable_cache:
             return None
         
-        entry = self._cache.get(cache_key)
-        if not entry:
-            return None
+        if entry is None:
+            entry = self._cache.get(cache_key)
+            if not entry:
+                return None
         
         # Check if expired
         if not allow_expired and entry.is_expired():
             return None
         
         # Check if too old for fallback
-        if allow_expired:
-            now = datetime.now(timezone.utc)
-            age_seconds = (now - entry.timestamp).total_seconds()
-            if age_seconds > self.MAX_CACHE_AGE:
-                return None
+        if allow_expired and entry.age() > self.MAX_CACHE_AGE:
+            return None
         
-        self.logger.debug(f"Cache {'hit' if not entry.is_expired() else 'stale hit'} for {cache_key}")
+        self._cache.move_to_end(cache_key)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Cache %s for %s", "stale hit" if entry.is_expired() else "hit", cache_key
+            )
         
         return FallbackResult(
             success=True,
@@ -162,7 +291,7 @@ class FallbackHandler:
     
     def _store_in_cache(
         self,
-        cache_key: str,
+        cache_key: CacheKey,
         data: List[Dict],
         source: DataSource,
         data_type: str
@@ -171,32 +300,112 @@ class FallbackHandler:
         if not self.enable_cache or not data:
             return
         
-        ttl = self.CACHE_TTL.get(data_type, self.CACHE_TTL["hashtags"])
+        ttl = _CACHE_TTL.get(data_type, _DEFAULT_TTL)
         
-        self._cache[cache_key] = CacheEntry(
+        entry = CacheEntry(
             data=data,
-            timestamp=datetime.now(timezone.utc),
             source=source,
-            ttl_seconds=ttl
+            ttl_seconds=ttl,
+            stale_ttl_seconds=self.stale_ttl_seconds if self.enable_swr else 0
         )
+        self._cache[cache_key] = entry
+        self._cache.move_to_end(cache_key)
+        
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        
+        heapq.heappush(self._age_heap, (entry.stored_at, next(self._heap_seq), cache_key, entry))
+        if len(self._age_heap) > 2 * len(self._cache) + 64:
+            self._rebuild_age_heap()
         
-        self.logger.debug(f"Cached {len(data)} items for {cache_key} (TTL: {ttl}s)")
+        self.logger.debug("Cached %d items for %s (TTL: %ds)", len(data), cache_key, ttl)
+    
+    def _rebuild_age_heap(self) -> None:
+        """Drop heap items whose cache entry was replaced or evicted."""
+        self._age_heap = [
+            (entry.stored_at, next(self._heap_seq), key, entry)
+            for key, entry in self._cache.items()
+        ]
+        heapq.heapify(self._age_heap)
+    
+    def _ensure_sweeper(self) -> None:
+        """Start the periodic cache sweep on first use (needs a running event loop)."""
+        if self.enable_cache and self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_cache())
+    
+    async def _sweep_cache(self) -> None:
+        """Periodically drop entries too old to be served even as a fallback."""
+        while True:
+            await asyncio.sleep(self.CACHE_SWEEP_INTERVAL)
+            self.clear_cache(older_than_seconds=self.MAX_CACHE_AGE)
     
     def _update_source_health(self, source: DataSource, success: bool) -> None:
         """Update source health tracking."""
         health = self._source_health[source]
         
         if success:
-            health["available"] = True
-            health["last_success"] = datetime.now(timezone.utc)
-            health["failures"] = 0
+            health.available = True
+            health.last_success = datetime.now(timezone.utc)
+            health.failures = 0
+            health.state = "closed"
+            health.open_until = 0.0
         else:
-            health["failures"] += 1
+            health.failures += 1
             
-            # Mark as unavailable after multiple failures
-            if health["failures"] >= 3:
-                health["available"] = False
-                self.logger.warning(f"Source {source.value} marked as unavailable")
+            # Open after repeated failures, or straight away if the probe failed;
+            # the open period doubles with every further failure
+            if health.state == "half_open" or health.failures >= self.CIRCUIT_FAILURE_THRESHOLD:
+                open_seconds = min(self.CIRCUIT_MAX_OPEN_SECONDS, 2 ** health.failures)
+                health.available = False
+                health.state = "open"
+                health.open_until = time.monotonic() + open_seconds
+                self.logger.warning(
+                    f"Source {source.value} marked as unavailable for {open_seconds}s"
+                )
+    
+    def _admit(self, source: DataSource) -> bool:
+        """Check whether a source's circuit breaker lets a request through."""
+        health = self._source_health[source]
+        if health.state == "closed":
+            return True
+        
+        now = time.monotonic()
+        if now < health.open_until:
+            return False
+        
+        # Open period (or a previous probe) has run out: let one probe through
+        health.state = "half_open"
+        health.open_until = now + self.CIRCUIT_PROBE_TIMEOUT
+        return True
+    
+    async def _acquire_rate(self, source: DataSource, country: CountryCode, endpoint: str) -> bool:
+        """
+        Take a rate-limit slot for a source, waiting at most rate_limit_max_wait_ms.
+        
+        Returns:
+            False if the source should be skipped because of rate limiting
+        """
+        if not self.rate_limiter:
+            return True
+        
+        if self.rate_limit_max_wait_ms is None:
+            await self.rate_limiter.wait_if_needed(country, endpoint)
+            return True
+        
+        max_wait = self.rate_limit_max_wait_ms / 1000
+        if await self.rate_limiter.acquire_within(country, endpoint, max_wait):
+            return True
+        
+        # Not a source failure: leave a pending half-open probe to the next request
+        health = self._source_health[source]
+        if health.state == "half_open":
+            health.open_until = 0.0
+        
+        self.logger.debug(
+            "Skipping %s for %s: rate limited for %.2fs",
+            source.value, endpoint, self.rate_limiter.retry_after(country, endpoint)
+        )
+        return False
     
     async def _try_official_api(
         self,
@@ -214,8 +423,7 @@ class FallbackHandler:
                 error_message="API client not configured"
             )
         
-        health = self._source_health[DataSource.OFFICIAL_API]
-        if not health["available"]:
+        if not self._admit(DataSource.OFFICIAL_API):
             return FallbackResult(
                 success=False,
                 data=[],
@@ -226,11 +434,16 @@ class FallbackHandler:
         
         start_time = time.time()
         
+        if not await self._acquire_rate(DataSource.OFFICIAL_API, country, data_type):
+            return FallbackResult(
+                success=False,
+                data=[],
+                source=DataSource.OFFICIAL_API,
+                duration_ms=0,
+                error_message="rate_limited"
+            )
+        
         try:
-            # Rate limiting
-            if self.rate_limiter:
-                await self.rate_limiter.wait_if_needed(country, data_type)
-            
             # Make API call based on data type
             if data_type == "hashtags":
                 data = await self.api_client.query_hashtags(
@@ -251,7 +464,7 @@ class FallbackHandler:
             
             if data:
                 self._update_source_health(DataSource.OFFICIAL_API, True)
-                self._stats["api_successes"] += 1
+                self._stats[_S_API] += 1
                 
                 return FallbackResult(
                     success=True,
@@ -298,8 +511,7 @@ class FallbackHandler:
                 error_message="Scraper not configured"
             )
         
-        health = self._source_health[DataSource.CREATIVE_CENTER]
-        if not health["available"]:
+        if not self._admit(DataSource.CREATIVE_CENTER):
             return FallbackResult(
                 success=False,
                 data=[],
@@ -310,11 +522,18 @@ class FallbackHandler:
         
         start_time = time.time()
         
+        if not await self._acquire_rate(
+            DataSource.CREATIVE_CENTER, country, f"scraper_{data_type}"
+        ):
+            return FallbackResult(
+                success=False,
+                data=[],
+                source=DataSource.CREATIVE_CENTER,
+                duration_ms=0,
+                error_message="rate_limited"
+            )
+        
         try:
-            # Rate limiting
-            if self.rate_limiter:
-                await self.rate_limiter.wait_if_needed(country, f"scraper_{data_type}")
-            
             # Make scraper call based on data type
             if data_type == "hashtags":
                 data = await self.scraper.scrape_trending_hashtags(
@@ -339,7 +558,7 @@ class FallbackHandler:
             
             if data:
                 self._update_source_health(DataSource.CREATIVE_CENTER, True)
-                self._stats["scraper_successes"] += 1
+                self._stats[_S_SCRAPER] += 1
                 
                 return FallbackResult(
                     success=True,
@@ -384,16 +603,7 @@ class FallbackHandler:
         
         # Generate minimal fallback data
         if data_type == "hashtags":
-            data = [
-                {
-                    "name": f"#fallback{hashtag}",
-                    "usage_count": 1000 + hashtag * 100,
-                    "engagement": 50.0,
-                    "growth_rate": 0.0,
-                    "trend_direction": "STABLE"
-                }
-                for hashtag in range(min(5, kwargs.get("limit", 50)))
-            ]
+            data = [dict(item) for item in _FALLBACK_HASHTAGS[:kwargs.get("limit", 50)]]
         else:
             data = []
         
@@ -406,36 +616,281 @@ class FallbackHandler:
             duration_ms=duration_ms
         )
     
+    async def _fetch_from_sources(
+        self,
+        cache_key: CacheKey,
+        data_type: str,
+        country: CountryCode,
+        limit: int,
+        niche: Optional[NicheType],
+        source_priority: List[DataSource],
+        hedge_ms: int = 0
+    ) -> FallbackResult:
+        """
+        Try each live source in priority order, caching the first success.
+        
+        Args:
+            hedge_ms: When positive, race the sources instead, starting each
+                one this many milliseconds after the previous (see _fetch_hedged)
+        
+        Returns:
+            Successful FallbackResult, or a failed one carrying the last error
+        """
+        if hedge_ms > 0 and len(source_priority) > 1:
+            return await self._fetch_hedged(
+                cache_key, data_type, country, limit, niche, source_priority, hedge_ms
+            )
+        
+        last_error = None
+        
+        # Try each source in priority order
+        for source in source_priority:
+            try:
+                result = await self._try_source(source, data_type, country, limit, niche)
+                
+                if result.success and result.data:
+                    self._accept(cache_key, result, data_type, country, source)
+                    return result
+                else:
+                    last_error = result.error_message
+            
+            except Exception as e:
+                last_error = str(e)
+                self.logger.error(f"Source {source.value} failed: {str(e)}")
+                continue
+        
+        return self._sources_failed(last_error)
+    
+    async def _fetch_hedged(
+        self,
+        cache_key: CacheKey,
+        data_type: str,
+        country: CountryCode,
+        limit: int,
+        niche: Optional[NicheType],
+        source_priority: List[DataSource],
+        hedge_ms: int
+    ) -> FallbackResult:
+        """
+        Race the live sources, starting each one hedge_ms after the previous.
+        
+        A slow primary source no longer holds up the fallbacks: the first
+        successful result wins and the remaining attempts are cancelled.
+        The Playwright placeholder answers instantly with synthetic data, so
+        it never joins the race and only runs once every live source failed.
+        """
+        placeholder = DataSource.PLAYWRIGHT_FALLBACK
+        live = [s for s in source_priority if s != placeholder]
+        
+        async def attempt(index: int, source: DataSource) -> FallbackResult:
+            if index:
+                await asyncio.sleep(hedge_ms * index / 1000)
+            return await self._try_source(source, data_type, country, limit, niche)
+        
+        tasks = {
+            asyncio.create_task(attempt(index, source)): (index, source)
+            for index, source in enumerate(live)
+        }
+        pending = set(tasks)
+        last_error = None
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                # Prefer the higher-priority source when several finish together
+                for task in sorted(done, key=lambda t: tasks[t][0]):
+                    _, source = tasks[task]
+                    if task.exception() is not None:
+                        last_error = str(task.exception())
+                        self.logger.error(f"Source {source.value} failed: {last_error}")
+                        continue
+                    
+                    result = task.result()
+                    if result.success and result.data:
+                        self._accept(cache_key, result, data_type, country, source)
+                        return result
+                    last_error = result.error_message
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if placeholder in source_priority:
+            try:
+                result = await self._try_source(placeholder, data_type, country, limit, niche)
+                if result.success and result.data:
+                    self._accept(cache_key, result, data_type, country, placeholder)
+                    return result
+                last_error = result.error_message or last_error
+            except Exception as e:
+                last_error = str(e)
+                self.logger.error(f"Source {placeholder.value} failed: {last_error}")
+        
+        return self._sources_failed(last_error)
+    
+    async def _try_source(
+        self,
+        source: DataSource,
+        data_type: str,
+        country: CountryCode,
+        limit: int,
+        niche: Optional[NicheType]
+    ) -> FallbackResult:
+        """Fetch from a single live source."""
+        if source == DataSource.OFFICIAL_API:
+            return await self._try_official_api(data_type, country, limit=limit, niche=niche)
+        elif source == DataSource.CREATIVE_CENTER:
+            return await self._try_scraper(data_type, country, limit=limit, niche=niche)
+        elif source == DataSource.PLAYWRIGHT_FALLBACK:
+            return await self._try_playwright_fallback(
+                data_type, country, limit=limit, niche=niche
+            )
+        raise ValueError(f"Unsupported live source: {source}")
+    
+    def _accept(
+        self,
+        cache_key: CacheKey,
+        result: FallbackResult,
+        data_type: str,
+        country: CountryCode,
+        source: DataSource
+    ) -> None:
+        """Cache a successful source result."""
+        if self.enable_cache:
+            self._store_in_cache(cache_key, result.data, result.source, data_type)
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            count = len(result.data)
+            event = _SUCCESS_EVENT | {
+                "data_type": data_type,
+                "country": country.value,
+                "source": source.name,
+                "count": count,
+                "duration_ms": round(result.duration_ms, 1),
+            }
+            self.logger.info(
+                "Successfully got %d %s for %s from %s in %.1fms",
+                count, data_type, country, source.value, result.duration_ms,
+                extra={"structured": event}
+            )
+    
+    @staticmethod
+    def _sources_failed(last_error: Optional[str]) -> FallbackResult:
+        """Build the result returned when every live source failed."""
+        return FallbackResult(
+            success=False,
+            data=[],
+            source=DataSource.PLAYWRIGHT_FALLBACK,  # Last attempted source
+            duration_ms=0,
+            error_message=last_error
+        )
+    
+    def _serve_stale(
+        self,
+        cache_key: CacheKey,
+        entry: CacheEntry,
+        data_type: str,
+        country: CountryCode,
+        limit: int,
+        niche: Optional[NicheType],
+        source_priority: List[DataSource]
+    ) -> Optional[FallbackResult]:
+        """
+        Return an expired entry still inside its stale window, refreshing it in the background.
+        
+        At most one refresh per key runs at a time.
+        """
+        if not entry.is_stale_servable():
+            return None
+        
+        self._cache.move_to_end(cache_key)
+
+        if not entry.refreshing:
+            entry.refreshing = True
+            task = asyncio.create_task(
+                self._refresh(entry, cache_key, data_type, country, limit, niche, source_priority)
+            )
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        
+        self.logger.debug("Serving stale cache for %s while refreshing", cache_key)
+        
+        return FallbackResult(
+            success=True,
+            data=entry.data,
+            source=DataSource.CACHED_DATA,
+            duration_ms=0.1,
+            cache_hit=True
+        )
+    
+    async def _refresh(
+        self,
+        entry: CacheEntry,
+        cache_key: CacheKey,
+        data_type: str,
+        country: CountryCode,
+        limit: int,
+        niche: Optional[NicheType],
+        source_priority: List[DataSource]
+    ) -> None:
+        """Refresh a stale cache entry from the live sources."""
+        try:
+            result = await self._fetch_from_sources(
+                cache_key, data_type, country, limit, niche, source_priority
+            )
+            if not result.success:
+                self.logger.warning(
+                    f"Background refresh failed for {country}/{data_type}: {result.error_message}"
+                )
+        except Exception as e:
+            self.logger.error(f"Background refresh failed for {country}/{data_type}: {str(e)}")
+        finally:
+            entry.refreshing = False
+    
     async def get_trends(
         self,
         data_type: str,
         country: CountryCode,
         limit: int = 50,
         niche: Optional[NicheType] = None,
-        source_priority: Optional[List[DataSource]] = None
+        source_priority: Optional[List[DataSource]] = None,
+        hedge_ms: int = 0
     ) -> FallbackResult:
         """
         Get trend data with intelligent fallback.
         
+        With stale-while-revalidate enabled, an expired entry still inside
+        its stale window is returned immediately and refreshed in the
+        background instead of blocking on the live sources.
+        
         Args:
             data_type: Type of data (hashtags, creators, sounds)
             country: Target country
             limit: Maximum number of items to return
             niche: Optional niche filter
             source_priority: Custom source priority list
-            
+            hedge_ms: If positive, race the sources instead of trying them in
+                turn, starting each one this many milliseconds after the
+                previous; the first success wins. 0 keeps the sequential order.
+        
         Returns:
             FallbackResult with data and metadata
         """
         start_time = time.time()
-        self._stats["total_requests"] += 1
+        self._stats[_S_TOTAL] += 1
+        self._ensure_sweeper()
         
-        # Check cache first
+        # Check cache first; the entry is looked up once for both cache paths.
+        # The key is built even with caching off, for single-flight coalescing.
         cache_key = self._get_cache_key(data_type, country, limit=limit, niche=niche)
-        cached_result = self._get_from_cache(cache_key)
-        if cached_result:
-            self._stats["cache_hits"] += 1
-            return cached_result
+        entry = self._cache.get(cache_key) if self.enable_cache else None
+        if entry is not None:
+            cached_result = self._get_from_cache(cache_key, entry=entry)
+            if cached_result:
+                self._stats[_S_CACHE_HITS] += 1
+                return cached_result
         
         # Define source priority
         if source_priority is None:
@@ -445,54 +900,89 @@ class FallbackHandler:
                 DataSource.PLAYWRIGHT_FALLBACK
             ]
         
-        last_error = None
-        result = None
+        if self.enable_swr and entry is not None:
+            stale_result = self._serve_stale(
+                cache_key, entry, data_type, country, limit, niche, source_priority
+            )
+            if stale_result:
+                self._stats[_S_CACHE_HITS] += 1
+                return stale_result
         
-        # Try each source in priority order
-        for source in source_priority:
-            try:
-                if source == DataSource.OFFICIAL_API:
-                    result = await self._try_official_api(
-                        data_type, country, limit=limit, niche=niche
-                    )
-                elif source == DataSource.CREATIVE_CENTER:
-                    result = await self._try_scraper(
-                        data_type, country, limit=limit, niche=niche
-                    )
-                elif source == DataSource.PLAYWRIGHT_FALLBACK:
-                    result = await self._try_playwright_fallback(
-                        data_type, country, limit=limit, niche=niche
-                    )
-                
-                if result.success and result.data:
-                    # Store in cache
-                    self._store_in_cache(cache_key, result.data, result.source, data_type)
-                    
-                    self.logger.info(
-                        f"Successfully got {len(result.data)} {data_type} for {country} "
-                        f"from {source.value} in {result.duration_ms:.1f}ms"
-                    )
-                    
-                    return result
-                else:
-                    last_error = result.error_message
-                    
-            except Exception as e:
-                last_error = str(e)
-                self.logger.error(f"Source {source.value} failed: {str(e)}")
-                continue
+        return await self._coalesce(
+            cache_key, data_type, country, limit, niche, source_priority, start_time, hedge_ms
+        )
+    
+    async def _coalesce(
+        self,
+        cache_key: CacheKey,
+        data_type: str,
+        country: CountryCode,
+        limit: int,
+        niche: Optional[NicheType],
+        source_priority: List[DataSource],
+        start_time: float,
+        hedge_ms: int = 0
+    ) -> FallbackResult:
+        """
+        Load a cache miss once per key; concurrent callers await the same result.
+        
+        Prevents a stampede of identical API/scraper calls on a cold key.
+        """
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._load(
+                    cache_key, data_type, country, limit, niche, source_priority, start_time,
+                    hedge_ms
+                )
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(cache_key, done))
+        
+        # Shield so one caller being cancelled doesn't cancel the shared load
+        return await asyncio.shield(task)
+    
+    def _finish_inflight(self, cache_key: CacheKey, task: asyncio.Task) -> None:
+        """Forget a finished shared load, marking its exception as retrieved."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # A failure nobody is left to await shouldn't be reported again
+            task.exception()
+    
+    async def _load(
+        self,
+        cache_key: CacheKey,
+        data_type: str,
+        country: CountryCode,
+        limit: int,
+        niche: Optional[NicheType],
+        source_priority: List[DataSource],
+        start_time: float,
+        hedge_ms: int = 0
+    ) -> FallbackResult:
+        """Fetch from the live sources, falling back to expired cache when all fail."""
+        result = await self._fetch_from_sources(
+            cache_key, data_type, country, limit, niche, source_priority, hedge_ms
+        )
+        if result.success:
+            return result
+        
+        last_error = result.error_message
         
         # All sources failed, try expired cache as last resort
-        cached_result = self._get_from_cache(cache_key, allow_expired=True)
+        cached_result = (
+            self._get_from_cache(cache_key, allow_expired=True) if self.enable_cache else None
+        )
         if cached_result:
-            self._stats["fallback_usage"] += 1
+            self._stats[_S_FALLBACK] += 1
             self.logger.warning(
                 f"Using expired cache for {country}/{data_type} due to all sources failing"
             )
             return cached_result
         
         # Complete failure
-        self._stats["total_failures"] += 1
+        self._stats[_S_FAILURES] += 1
         duration_ms = (time.time() - start_time) * 1000
         
         self.logger.error(
@@ -509,25 +999,30 @@ class FallbackHandler:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get performance and health statistics."""
-        total_successes = self._stats["api_successes"] + self._stats["scraper_successes"]
-        success_rate = total_successes / max(1, self._stats["total_requests"])
+        stats = self._stats
+        total_successes = stats[_S_API] + stats[_S_SCRAPER]
+        success_rate = total_successes / max(1, stats[_S_TOTAL])
         
         return {
             "requests": {
-                "total": self._stats["total_requests"],
-                "api_successes": self._stats["api_successes"],
-                "scraper_successes": self._stats["scraper_successes"],
-                "cache_hits": self._stats["cache_hits"],
-                "fallback_usage": self._stats["fallback_usage"],
-                "total_failures": self._stats["total_failures"],
+                "total": stats[_S_TOTAL],
+                "api_successes": stats[_S_API],
+                "scraper_successes": stats[_S_SCRAPER],
+                "cache_hits": stats[_S_CACHE_HITS],
+                "fallback_usage": stats[_S_FALLBACK],
+                "total_failures": stats[_S_FAILURES],
                 "success_rate": success_rate
             },
             "cache": {
                 "entries": len(self._cache),
+                "max_entries": self._max_entries,
+                "oldest_entry": min(
+                    (entry.wall_timestamp for entry in self._cache.values()), default=None
+                ),
                 "enabled": self.enable_cache
             },
             "sources": {
-                source.value: health
+                source.value: asdict(health)
                 for source, health in self._source_health.items()
             }
         }
@@ -545,44 +1040,48 @@ class FallbackHandler:
         if older_than_seconds is None:
             count = len(self._cache)
             self._cache.clear()
+            self._age_heap.clear()
             self.logger.info(f"Cleared {count} cache entries")
             return count
         
-        cutoff_time = datetime.now(timezone.utc).timestamp() - older_than_seconds
-        keys_to_remove = []
+        # Pop only the entries old enough to go, oldest first
+        cutoff_time = time.monotonic() - older_than_seconds
+        heap = self._age_heap
+        removed = 0
         
-        for key, entry in self._cache.items():
-            if entry.timestamp.timestamp() < cutoff_time:
-                keys_to_remove.append(key)
+        while heap and heap[0][0] < cutoff_time:
+            _, _, key, entry = heapq.heappop(heap)
+            if self._cache.get(key) is entry:
+                del self._cache[key]
+                removed += 1
         
-        for key in keys_to_remove:
-            del self._cache[key]
-        
-        self.logger.info(f"Cleared {len(keys_to_remove)} old cache entries")
-        return len(keys_to_remove)
+        self.logger.info(f"Cleared {removed} old cache entries")
+        return removed
     
     def reset_stats(self) -> None:
         """Reset all statistics."""
-        self._stats = {
-            "total_requests": 0,
-            "api_successes": 0,
-            "scraper_successes": 0,
-            "cache_hits": 0,
-            "fallback_usage": 0,
-            "total_failures": 0
-        }
+        self._stats = [0] * len(_STAT_NAMES)
         
         for source in self._source_health:
-            self._source_health[source] = {
-                "available": True,
-                "last_success": None,
-                "failures": 0
-            }
+            self._source_health[source] = SourceHealth()
         
         self.logger.info("FallbackHandler statistics reset")
     
     async def cleanup(self) -> None:
         """Cleanup resources."""
+        tasks = list(self._refresh_tasks)
+        tasks.extend(self._inflight.values())
+        if self._sweeper is not None:
+            tasks.append(self._sweeper)
+            self._sweeper = None
+        
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        self._inflight.clear()
         self._cache.clear()
+        self._age_heap.clear()
         self.reset_stats()
         self.logger.info("FallbackHandler cleaned up")
\ No newline at end of file
@@ -5,17 +5,88 @@ Provides centralized logging configuration with support for multiple log
 levels, file output, and structured JSON logging.
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
+import queue
+import re
 import sys
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Optional faster JSON serializer
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_dumps(data: Dict[str, Any]) -> str:
+    return orjson.dumps(data).decode()
+
+
+_dumps: Callable[[Dict[str, Any]], str] = _orjson_dumps if ORJSON_AVAILABLE else json.dumps
+
+# One queue listener per (log directory, json_format), shared by all loggers
+_listeners: Dict[Tuple[Path, bool], Tuple[queue.SimpleQueue, logging.handlers.QueueListener]] = {}
+_listeners_lock = threading.Lock()
+
+# Lowercase substrings every credential-bearing message contains; messages
+# without any of them skip the masking regex entirely
+_SECRET_MARKERS = ("secret", "token", "passw", "key", "bearer")
+
+# Credential values: "<field>=<value>" / "<field>: <value>" where the field
+# names a credential (password, client_secret, access_token, api_key, ...),
+# and bearer tokens. Bare words such as "token" or "secret_santa" are left alone
+_SECRET_RE = re.compile(
+    r"\b(?P<name>(?:[\w-]*[_-])?(?:secret|passw(?:or)?d|(?:api|access|secret|private)[_-]?key)"
+    r"|[\w-]*[_-]token)"
+    r"(?P<sep>\s*[=:]\s*)[^\s,;'\"]+"
+    r"|\b(?P<scheme>bearer)\s+[\w.~+/-]+=*",
+    re.IGNORECASE,
+)
+
+
+def _mask_secret(match: "re.Match[str]") -> str:
+    if match["sep"] is not None:
+        return f"{match['name']}{match['sep']}***"
+    return f"{match['scheme']} ***"
+
+
+class _SecretMaskingFilter(logging.Filter):
+    """
+    Mask credentials in log messages before any handler sees them.
+
+    The message is resolved once and checked for a few marker substrings;
+    only messages containing one are run through the masking regex.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        lowered = message.lower()
+        if any(marker in lowered for marker in _SECRET_MARKERS):
+            message = _SECRET_RE.sub(_mask_secret, message)
+
+        # Keep the resolved message so handlers don't format it again
+        record.msg = message
+        record.args = None
+        return True
+
+
+_secret_filter = _SecretMaskingFilter()
 
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
+    converter = time.gmtime
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -27,7 +98,7 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self.formatTime(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -36,10 +107,117 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
+        # Event fields passed as extra={"structured": {...}}
+        structured = record.__dict__.get("structured")
+        if structured:
+            log_data.update(structured)
+
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Format the record's creation time as an ISO 8601 UTC timestamp.
+
+        Reuses record.created instead of building a datetime per record.
+        """
+        created = time.strftime(datefmt or "%Y-%m-%dT%H:%M:%S", self.converter(record.created))
+        return f"{created}.{int(record.msecs):03d}Z"
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process listener.
+
+    The stock prepare() formats the record up front and drops exc_info so it
+    can be pickled; the queue never leaves the process here, so only the
+    message is resolved and formatting stays with the listener's handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _get_queue(log_path: Path, json_format: bool) -> queue.SimpleQueue:
+    """
+    Get the queue feeding the file and console handlers for a log directory.
+
+    The handlers run on a QueueListener thread, so logging calls on the
+    event loop only enqueue and never block on disk I/O or file rotation.
+    """
+    key = (log_path.resolve(), json_format)
+
+    with _listeners_lock:
+        if key in _listeners:
+            return _listeners[key][0]
+
+        # Create formatters
+        if json_format:
+            formatter: logging.Formatter = JSONFormatter()
+            console_formatter: logging.Formatter = JSONFormatter()
+        else:
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+            console_formatter = logging.Formatter(
+                "%(levelname)s - %(name)s - %(message)s",
+            )
+
+        # File handler for all logs
+        app_log_file = log_path / "app.log"
+        app_handler = logging.handlers.RotatingFileHandler(
+            app_log_file,
+            maxBytes=10485760,  # 10MB
+            backupCount=5,
+        )
+        app_handler.setLevel(logging.DEBUG)
+        app_handler.setFormatter(formatter)
+
+        # File handler for errors
+        error_log_file = log_path / "errors.log"
+        error_handler = logging.handlers.RotatingFileHandler(
+            error_log_file,
+            maxBytes=10485760,  # 10MB
+            backupCount=5,
+        )
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(formatter)
+
+        # Console handler; per-logger levels are enforced by the logger itself
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(console_formatter)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue,
+            app_handler,
+            error_handler,
+            console_handler,
+            respect_handler_level=True,
+        )
+        listener.start()
+
+        if not _listeners:
+            atexit.register(_stop_listeners)
+        _listeners[key] = (log_queue, listener)
+
+        return log_queue
+
+
+def _stop_listeners() -> None:
+    """Flush queued records and stop all listener threads."""
+    with _listeners_lock:
+        for _, listener in _listeners.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _listeners.clear()
 
 
 def setup_logger(
@@ -51,6 +229,9 @@ def setup_logger(
     """
     Set up a logger with file and console handlers.
 
+    The handlers are shared per log directory and run on a background
+    thread; the logger itself only enqueues records.
+
     Args:
         name: Logger name
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -70,46 +251,10 @@ def setup_logger(
     # Remove existing handlers
     logger.handlers.clear()
 
-    # Create formatters
-    if json_format:
-        formatter: logging.Formatter = JSONFormatter()
-        console_formatter: logging.Formatter = JSONFormatter()
-    else:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        console_formatter = logging.Formatter(
-            "%(levelname)s - %(name)s - %(message)s",
-        )
-
-    # File handler for all logs
-    app_log_file = log_path / "app.log"
-    app_handler = logging.handlers.RotatingFileHandler(
-        app_log_file,
-        maxBytes=10485760,  # 10MB
-        backupCount=5,
-    )
-    app_handler.setLevel(logging.DEBUG)
-    app_handler.setFormatter(formatter)
-    logger.addHandler(app_handler)
-
-    # File handler for errors
-    error_log_file = log_path / "errors.log"
-    error_handler = logging.handlers.RotatingFileHandler(
-        error_log_file,
-        maxBytes=10485760,  # 10MB
-        backupCount=5,
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(formatter)
-    logger.addHandler(error_handler)
-
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    # Records are handed to a background listener; see _get_queue
+    logger.addHandler(_LocalQueueHandler(_get_queue(log_path, json_format)))
+    if _secret_filter not in logger.filters:
+        logger.addFilter(_secret_filter)
 
     return logger
 
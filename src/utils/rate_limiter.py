@@ -5,17 +5,24 @@ Implements token bucket algorithm for rate limiting across different countries a
 """
 
 import asyncio
+import logging
 import time
-from collections import defaultdict, deque
-from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 from src.utils.logger import setup_logger
 from src.storage.models.enums import CountryCode
 
+# Buckets are keyed by (country, endpoint); tuples hash faster than built strings
+BucketKey = Tuple[CountryCode, str]
 
-@dataclass
+# Per-bucket stats row: [requests, rejections, wait_time], indexed by position
+StatsRow = List[Union[int, float]]
+_S_REQUESTS, _S_REJECTIONS, _S_WAIT_TIME = range(3)
+
+
+@dataclass(slots=True)
 class RateLimitConfig:
     """Configuration for rate limiting."""
     requests_per_minute: int
@@ -29,6 +36,15 @@ class RateLimitConfig:
 class TokenBucket:
     """Token bucket implementation for rate limiting."""
     
+    __slots__ = (
+        "rate",
+        "capacity",
+        "tokens",
+        "last_refill",
+        "_waiters",
+        "_dispatch_handle",
+    )
+    
     def __init__(self, rate: float, capacity: int):
         """
         Initialize token bucket.
@@ -40,8 +56,16 @@ class TokenBucket:
         self.rate = rate
         self.capacity = capacity
         self.tokens = capacity
-        self.last_refill = time.time()
-        self._lock = asyncio.Lock()
+        self.last_refill = time.monotonic()
+        
+        # FIFO of (future, tokens) served by a single scheduled dispatch
+        self._waiters: deque = deque()
+        self._dispatch_handle: Optional[asyncio.TimerHandle] = None
+    
+    @property
+    def waiting(self) -> int:
+        """Number of callers queued in wait_for_tokens."""
+        return len(self._waiters)
     
     async def consume(self, tokens: int = 1) -> bool:
         """
@@ -53,40 +77,102 @@ class TokenBucket:
         Returns:
             True if tokens were consumed, False if insufficient tokens
         """
-        async with self._lock:
-            now = time.time()
-            
-            # Refill tokens based on elapsed time
-            elapsed = now - self.last_refill
-            tokens_to_add = elapsed * self.rate
-            self.tokens = min(self.capacity, self.tokens + tokens_to_add)
-            self.last_refill = now
-            
-            # Check if we have enough tokens
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            
-            return False
+        return self.try_consume(tokens)
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.last_refill = now
+    
+    def try_consume(self, tokens: int = 1) -> bool:
+        """
+        Consume tokens without waiting.
+        
+        No lock is needed: it never yields, so it runs atomically with
+        respect to other coroutines on the event loop.
+        
+        Args:
+            tokens: Number of tokens to consume
+        
+        Returns:
+            True if tokens were consumed, False if insufficient tokens
+        """
+        self._refill()
+        
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        
+        return False
     
     async def wait_for_tokens(self, tokens: int = 1) -> None:
         """
         Wait until enough tokens are available.
         
+        Waiters queue in arrival order. One loop.call_at timer fires when the
+        head of the queue can be served and wakes exactly that waiter, so
+        each token issued costs one wakeup however many tasks are waiting.
+        
         Args:
             tokens: Number of tokens needed
+        
+        Raises:
+            ValueError: If more tokens are requested than the bucket can hold
         """
-        while not await self.consume(tokens):
-            # Calculate wait time needed
-            async with self._lock:
-                deficit = tokens - self.tokens
-                wait_time = deficit / self.rate
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot wait for {tokens} tokens, capacity is {self.capacity}")
+        
+        if not self._waiters and self.try_consume(tokens):
+            return
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters.append((future, tokens))
+        self._schedule_dispatch(loop)
+        
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled after being served: hand the tokens back
+            if future.done() and not future.cancelled():
+                self.tokens = min(self.capacity, self.tokens + tokens)
+                self._schedule_dispatch(loop)
+            raise
+    
+    def _schedule_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Arm the dispatch timer for when the first waiter can be served."""
+        if self._dispatch_handle is not None or not self._waiters:
+            return
+        
+        _, tokens = self._waiters[0]
+        delay = self.time_until_available(tokens)
+        self._dispatch_handle = loop.call_at(loop.time() + delay, self._dispatch, loop)
+    
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Serve queued waiters in order while tokens last, then re-arm."""
+        self._dispatch_handle = None
+        
+        while self._waiters:
+            future, tokens = self._waiters[0]
+            if future.done():
+                # Cancelled while queued
+                self._waiters.popleft()
+                continue
+            
+            if not self.try_consume(tokens):
+                break
             
-            await asyncio.sleep(wait_time)
+            self._waiters.popleft()
+            future.set_result(None)
+        
+        self._schedule_dispatch(loop)
     
-    def get_available_tokens(self) -> int:
-        """Get current number of available tokens."""
-        return int(self.tokens)
+    def get_available_tokens(self) -> float:
+        """Get current number of available tokens, including fractional ones."""
+        self._refill()
+        return self.tokens
     
     def time_until_available(self, tokens: int = 1) -> float:
         """
@@ -98,11 +184,142 @@ class TokenBucket:
         Returns:
             Seconds until tokens are available
         """
+        self._refill()
         if self.tokens >= tokens:
             return 0.0
         
         deficit = tokens - self.tokens
         return deficit / self.rate
+    
+    def snapshot(self) -> Tuple[float, float]:
+        """
+        Refill once and report the bucket's current state.
+        
+        Returns:
+            Tuple of (available tokens, seconds until one token is available)
+        """
+        self._refill()
+        tokens = self.tokens
+        return tokens, 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+
+
+class SlidingWindowBucket:
+    """
+    Sliding-window limiter allowing at most `capacity` tokens per `period`.
+    
+    Keeps the timestamps of recent acquisitions in a deque; expired ones are
+    popped from the left. Stricter than a token bucket over any window, but
+    lets the whole window's allowance through as one burst. Exposes the
+    same interface as TokenBucket.
+    """
+    
+    __slots__ = ("capacity", "period", "rate", "_times")
+    
+    def __init__(self, capacity: int, period: float = 60.0):
+        """
+        Initialize sliding window.
+        
+        Args:
+            capacity: Maximum tokens per window
+            period: Window length in seconds
+        """
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+        self._times: deque = deque(maxlen=capacity)
+    
+    @property
+    def waiting(self) -> int:
+        """Waiters are not queued; they re-check after sleeping."""
+        return 0
+    
+    def _expire(self, now: float) -> None:
+        """Drop acquisitions that have left the window."""
+        times = self._times
+        cutoff = now - self.period
+        while times and times[0] <= cutoff:
+            times.popleft()
+    
+    def try_consume(self, tokens: int = 1) -> bool:
+        """
+        Consume tokens without waiting.
+        
+        Args:
+            tokens: Number of tokens to consume
+        
+        Returns:
+            True if tokens were consumed, False if the window is full
+        """
+        now = time.monotonic()
+        self._expire(now)
+        
+        if len(self._times) + tokens <= self.capacity:
+            self._times.extend([now] * tokens)
+            return True
+        
+        return False
+    
+    async def consume(self, tokens: int = 1) -> bool:
+        """Consume tokens without waiting (see try_consume)."""
+        return self.try_consume(tokens)
+    
+    async def wait_for_tokens(self, tokens: int = 1) -> None:
+        """
+        Wait until enough tokens are available.
+        
+        Args:
+            tokens: Number of tokens needed
+        
+        Raises:
+            ValueError: If more tokens are requested than the window allows
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot wait for {tokens} tokens, capacity is {self.capacity}")
+        
+        while not self.try_consume(tokens):
+            await asyncio.sleep(self.time_until_available(tokens))
+    
+    def get_available_tokens(self) -> int:
+        """Get current number of available tokens."""
+        self._expire(time.monotonic())
+        return self.capacity - len(self._times)
+    
+    def time_until_available(self, tokens: int = 1) -> float:
+        """
+        Calculate time until tokens will be available.
+        
+        Args:
+            tokens: Number of tokens needed
+        
+        Returns:
+            Seconds until tokens are available
+        """
+        now = time.monotonic()
+        self._expire(now)
+        
+        excess = len(self._times) + tokens - self.capacity
+        if excess <= 0:
+            return 0.0
+        
+        # The oldest `excess` acquisitions have to leave the window first
+        return self._times[excess - 1] + self.period - now
+    
+    def snapshot(self) -> Tuple[float, float]:
+        """
+        Expire old acquisitions once and report the window's current state.
+        
+        Returns:
+            Tuple of (available tokens, seconds until one token is available)
+        """
+        now = time.monotonic()
+        self._expire(now)
+        
+        times = self._times
+        available = self.capacity - len(times)
+        return float(available), 0.0 if available > 0 else times[0] + self.period - now
+
+
+Bucket = Union[TokenBucket, SlidingWindowBucket]
 
 
 class RateLimiter:
@@ -121,13 +338,9 @@ class RateLimiter:
         CountryCode.ID: RateLimitConfig(requests_per_minute=600),
         
         # Standard countries
-        CountryCode.GB: RateLimitConfig(requests_per_minute=300),
-        CountryCode.CA: RateLimitConfig(requests_per_minute=300),
-        CountryCode.AU: RateLimitConfig(requests_per_minute=300),
+        CountryCode.UK: RateLimitConfig(requests_per_minute=300),
         CountryCode.DE: RateLimitConfig(requests_per_minute=300),
         CountryCode.FR: RateLimitConfig(requests_per_minute=300),
-        CountryCode.IT: RateLimitConfig(requests_per_minute=300),
-        CountryCode.ES: RateLimitConfig(requests_per_minute=300),
         CountryCode.JP: RateLimitConfig(requests_per_minute=300),
         
         # Default for other countries
@@ -146,7 +359,9 @@ class RateLimiter:
     def __init__(
         self,
         custom_limits: Optional[Dict[CountryCode, RateLimitConfig]] = None,
-        global_limit: Optional[RateLimitConfig] = None
+        global_limit: Optional[RateLimitConfig] = None,
+        sliding_window: bool = False,
+        max_buckets: int = 256
     ):
         """
         Initialize rate limiter.
@@ -154,7 +369,15 @@ class RateLimiter:
         Args:
             custom_limits: Custom rate limits for specific countries
             global_limit: Global rate limit across all countries
+            sliding_window: Limit each country/endpoint to its requests per
+                minute over a sliding 60s window (SlidingWindowBucket)
+                instead of a token bucket with burst capacity
+            max_buckets: Most country/endpoint buckets kept; beyond that the
+                least recently used idle, full one (and its stats) is dropped
         """
+        if max_buckets <= 0:
+            raise ValueError("max_buckets must be positive")
+        
         self.logger = setup_logger("rate_limiter")
         
         # Merge custom limits with defaults
@@ -162,8 +385,18 @@ class RateLimiter:
         if custom_limits:
             self.limits.update(custom_limits)
         
+        # (tokens per second, capacity) per country and endpoint, resolved once
+        self._effective: Dict[Union[CountryCode, str], Dict[str, Tuple[float, int]]] = {
+            country: self._resolve_limits(config) for country, config in self.limits.items()
+        }
+        
         # Token buckets for each country/endpoint combination
-        self._buckets: Dict[str, TokenBucket] = {}
+        self.sliding_window = sliding_window
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[BucketKey, Bucket]" = OrderedDict()
+        
+        # Hot-path cache of (bucket, stats row) per key, one lookup per request
+        self._lanes: Dict[BucketKey, Tuple[Bucket, StatsRow]] = {}
         
         # Global rate limiter
         self._global_bucket: Optional[TokenBucket] = None
@@ -173,44 +406,88 @@ class RateLimiter:
                 capacity=global_limit.burst_capacity
             )
         
-        # Statistics
-        self._stats = defaultdict(lambda: {
-            "requests": 0,
-            "rejections": 0,
-            "wait_time": 0.0
-        })
+        # Statistics, one row per bucket key (created with its lane)
+        self._stats: Dict[BucketKey, StatsRow] = {}
         
         self.logger.info("RateLimiter initialized")
     
-    def _get_bucket_key(self, country: CountryCode, endpoint: str) -> str:
-        """Generate bucket key for country/endpoint combination."""
-        return f"{country.value}:{endpoint}"
+    def _get_lane(
+        self,
+        country: CountryCode,
+        endpoint: str
+    ) -> Tuple[Bucket, StatsRow]:
+        """Get the bucket and stats row for country/endpoint."""
+        key = (country, endpoint)
+        lane = self._lanes.get(key)
+        if lane is not None:
+            self._buckets.move_to_end(key)
+        else:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = [0, 0, 0.0]
+            lane = self._lanes[key] = (self._get_bucket(country, endpoint), stats)
+        return lane
+    
+    def _resolve_limits(self, config: RateLimitConfig) -> Dict[str, Tuple[float, int]]:
+        """Get (tokens per second, capacity) of a country limit for each endpoint."""
+        return {
+            endpoint: (config.requests_per_minute * multiplier / 60, config.burst_capacity)
+            for endpoint, multiplier in self.ENDPOINT_MULTIPLIERS.items()
+        }
     
-    def _get_bucket(self, country: CountryCode, endpoint: str) -> TokenBucket:
+    def _get_bucket(self, country: CountryCode, endpoint: str) -> Bucket:
         """Get or create token bucket for country/endpoint."""
-        key = self._get_bucket_key(country, endpoint)
+        key = (country, endpoint)
+        bucket = self._buckets.get(key)
         
-        if key not in self._buckets:
-            # Get rate limit for this country
-            config = self.limits.get(country, self.limits["default"])
-            
-            # Apply endpoint multiplier
-            multiplier = self.ENDPOINT_MULTIPLIERS.get(endpoint, 1.0)
-            effective_rpm = config.requests_per_minute * multiplier
-            effective_capacity = config.burst_capacity
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+        else:
+            # Effective limit for this country/endpoint, multiplier applied
+            limits = self._effective.get(country) or self._effective["default"]
+            effective = limits.get(endpoint)
+            if effective is None:
+                # Endpoints without a multiplier run at the country's base rate
+                config = self.limits.get(country, self.limits["default"])
+                effective = (config.requests_per_minute / 60, config.burst_capacity)
+                limits[endpoint] = effective
+            rate, effective_capacity = effective
+            effective_rpm = rate * 60
             
             # Create bucket
-            self._buckets[key] = TokenBucket(
-                rate=effective_rpm / 60,  # Convert to per-second
-                capacity=effective_capacity
-            )
+            if self.sliding_window:
+                effective_capacity = max(1, int(effective_rpm))
+                bucket = SlidingWindowBucket(capacity=effective_capacity)
+            else:
+                bucket = TokenBucket(rate=rate, capacity=effective_capacity)
+            self._buckets[key] = bucket
+            
+            if len(self._buckets) > self.max_buckets:
+                self._evict_idle_bucket(keep=key)
             
             self.logger.debug(
-                f"Created bucket for {key}: {effective_rpm:.1f} req/min, "
-                f"capacity {effective_capacity}"
+                "Created bucket for %s:%s: %.1f req/min, capacity %d",
+                country.value, endpoint, effective_rpm, effective_capacity
             )
         
-        return self._buckets[key]
+        return bucket
+    
+    def _evict_idle_bucket(self, keep: BucketKey) -> None:
+        """
+        Drop the least recently used idle bucket along with its stats.
+        
+        Only buckets with no waiters and a full allowance are evicted, since
+        a fresh bucket would start full anyway; dropping a depleted one would
+        hand its caller a new allowance. If none qualifies, nothing is evicted.
+        """
+        for key, bucket in self._buckets.items():
+            if key == keep:
+                continue
+            if not bucket.waiting and bucket.get_available_tokens() >= bucket.capacity:
+                del self._buckets[key]
+                self._lanes.pop(key, None)
+                self._stats.pop(key, None)
+                return
     
     async def check_limit(
         self,
@@ -229,21 +506,71 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, wait_time_seconds)
         """
-        # Check global limit first
-        if self._global_bucket:
-            if not await self._global_bucket.consume(tokens):
-                wait_time = self._global_bucket.time_until_available(tokens)
-                return False, wait_time
-        
-        # Check country-specific limit
         bucket = self._get_bucket(country, endpoint)
         
-        if not await bucket.consume(tokens):
-            wait_time = bucket.time_until_available(tokens)
+        # One refill-and-check per bucket gives both the decision and the wait;
+        # nothing is taken from either bucket unless both allow the request
+        wait_time = bucket.time_until_available(tokens)
+        if self._global_bucket:
+            wait_time = max(wait_time, self._global_bucket.time_until_available(tokens))
+        
+        if wait_time > 0:
             return False, wait_time
         
+        bucket.try_consume(tokens)
+        if self._global_bucket:
+            self._global_bucket.try_consume(tokens)
+        
         return True, 0.0
     
+    def try_acquire(self, country: CountryCode, endpoint: str, tokens: int = 1) -> bool:
+        """
+        Take tokens only if they are available right now.
+        
+        Unlike check_limit, nothing is consumed from the global bucket when
+        the country bucket is empty.
+        
+        Args:
+            country: Target country
+            endpoint: API endpoint type
+            tokens: Number of tokens to consume
+        
+        Returns:
+            True if the request may proceed, False if it is rate limited
+        """
+        bucket, stats = self._get_lane(country, endpoint)
+        
+        global_ready = (
+            self._global_bucket is None
+            or self._global_bucket.time_until_available(tokens) == 0.0
+        )
+        if not global_ready or not bucket.try_consume(tokens):
+            stats[_S_REJECTIONS] += 1
+            return False
+        
+        if self._global_bucket:
+            self._global_bucket.try_consume(tokens)
+        
+        stats[_S_REQUESTS] += 1
+        return True
+    
+    def retry_after(self, country: CountryCode, endpoint: str, tokens: int = 1) -> float:
+        """
+        Seconds until try_acquire would succeed.
+        
+        Args:
+            country: Target country
+            endpoint: API endpoint type
+            tokens: Number of tokens needed
+        
+        Returns:
+            Seconds to wait (0.0 if tokens are available now)
+        """
+        wait_time = self._get_bucket(country, endpoint).time_until_available(tokens)
+        if self._global_bucket:
+            wait_time = max(wait_time, self._global_bucket.time_until_available(tokens))
+        return wait_time
+    
     async def wait_if_needed(
         self,
         country: CountryCode,
@@ -258,28 +585,100 @@ class RateLimiter:
             endpoint: API endpoint type
             tokens: Number of tokens to consume
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        bucket, stats = self._get_lane(country, endpoint)
         
-        # Check global limit
+        # Check global and country-specific limits
         if self._global_bucket:
-            await self._global_bucket.wait_for_tokens(tokens)
-        
-        # Check country-specific limit
-        bucket = self._get_bucket(country, endpoint)
-        await bucket.wait_for_tokens(tokens)
+            await self._joint_wait(bucket, tokens)
+        else:
+            await bucket.wait_for_tokens(tokens)
         
         # Update statistics
-        wait_time = time.time() - start_time
-        key = self._get_bucket_key(country, endpoint)
-        self._stats[key]["requests"] += 1
-        self._stats[key]["wait_time"] += wait_time
+        wait_time = time.monotonic() - start_time
+        stats[_S_REQUESTS] += 1
+        stats[_S_WAIT_TIME] += wait_time
         
-        if wait_time > 0:
+        if wait_time > 0 and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"Rate limited wait for {key}: {wait_time:.2f}s",
+                "Rate limited wait for %s:%s: %.2fs", country.value, endpoint, wait_time,
                 extra={"country": country.value, "endpoint": endpoint, "wait_time": wait_time}
             )
     
+    async def acquire_within(
+        self,
+        country: CountryCode,
+        endpoint: str,
+        max_wait: float,
+        tokens: int = 1
+    ) -> bool:
+        """
+        Take tokens, waiting only if they will be available within max_wait.
+        
+        Tokens are taken straight away only when nobody is queued, so callers
+        never jump ahead of tasks already waiting in wait_if_needed. A request
+        that waits is counted once as a request, never as a rejection.
+        
+        Args:
+            country: Target country
+            endpoint: API endpoint type
+            max_wait: Longest acceptable wait in seconds
+            tokens: Number of tokens to consume
+        
+        Returns:
+            True if the tokens were taken, False if the wait would be longer
+        """
+        bucket, stats = self._get_lane(country, endpoint)
+        global_bucket = self._global_bucket
+        
+        wait_time = bucket.time_until_available(tokens)
+        if global_bucket:
+            wait_time = max(wait_time, global_bucket.time_until_available(tokens))
+        queued = bucket.waiting or (global_bucket is not None and global_bucket.waiting)
+        
+        if wait_time == 0.0 and not queued:
+            bucket.try_consume(tokens)
+            if global_bucket:
+                global_bucket.try_consume(tokens)
+            stats[_S_REQUESTS] += 1
+            return True
+        
+        if wait_time > max_wait:
+            stats[_S_REJECTIONS] += 1
+            return False
+        
+        await self.wait_if_needed(country, endpoint, tokens)
+        return True
+    
+    async def _joint_wait(self, bucket: Bucket, tokens: int) -> None:
+        """
+        Wait for the global and a country bucket together.
+        
+        When neither bucket has queued waiters, sleep once for the longer of
+        the two waits and take from both; otherwise (or if another caller
+        got there first) queue on each bucket in turn.
+        """
+        global_bucket = self._global_bucket
+        
+        if not (global_bucket.waiting or bucket.waiting):
+            wait_time = max(
+                global_bucket.time_until_available(tokens),
+                bucket.time_until_available(tokens)
+            )
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            
+            if (
+                not (global_bucket.waiting or bucket.waiting)
+                and global_bucket.time_until_available(tokens) == 0.0
+                and bucket.try_consume(tokens)
+            ):
+                global_bucket.try_consume(tokens)
+                return
+        
+        await global_bucket.wait_for_tokens(tokens)
+        await bucket.wait_for_tokens(tokens)
+    
     async def acquire(
         self,
         country: CountryCode,
@@ -308,8 +707,8 @@ class RateLimiter:
                 return True
             else:
                 # Update rejection stats
-                key = self._get_bucket_key(country, endpoint)
-                self._stats[key]["rejections"] += 1
+                _, stats = self._get_lane(country, endpoint)
+                stats[_S_REJECTIONS] += 1
                 return False
     
     def get_status(self, country: CountryCode, endpoint: str) -> Dict:
@@ -323,48 +722,48 @@ class RateLimiter:
         Returns:
             Status information
         """
-        bucket = self._get_bucket(country, endpoint)
-        key = self._get_bucket_key(country, endpoint)
-        stats = self._stats[key]
+        bucket, stats = self._get_lane(country, endpoint)
+        available, time_until_available = bucket.snapshot()
         
-        config = self.limits.get(country, self.limits["default"])
-        multiplier = self.ENDPOINT_MULTIPLIERS.get(endpoint, 1.0)
-        effective_rpm = config.requests_per_minute * multiplier
+        # The multiplier was applied when the bucket was created
+        effective_rpm = bucket.rate * 60
         
         return {
             "country": country.value,
             "endpoint": endpoint,
-            "available_tokens": bucket.get_available_tokens(),
+            "available_tokens": available,
             "capacity": bucket.capacity,
             "rate_per_minute": effective_rpm,
-            "time_until_available": bucket.time_until_available(),
-            "requests_made": stats["requests"],
-            "requests_rejected": stats["rejections"],
-            "average_wait_time": stats["wait_time"] / max(1, stats["requests"]),
-            "utilization": (bucket.capacity - bucket.get_available_tokens()) / bucket.capacity
+            "time_until_available": time_until_available,
+            "requests_made": stats[_S_REQUESTS],
+            "requests_rejected": stats[_S_REJECTIONS],
+            "average_wait_time": stats[_S_WAIT_TIME] / max(1, stats[_S_REQUESTS]),
+            "utilization": (bucket.capacity - available) / bucket.capacity
         }
     
     def get_all_status(self) -> Dict[str, Dict]:
         """Get status for all active buckets."""
         status = {}
         
-        for key, bucket in self._buckets.items():
-            country_code, endpoint = key.split(":", 1)
-            country = CountryCode(country_code)
-            status[key] = self.get_status(country, endpoint)
+        for country, endpoint in list(self._buckets):
+            status[f"{country.value}:{endpoint}"] = self.get_status(country, endpoint)
         
         return status
     
     def reset_stats(self) -> None:
         """Reset all statistics."""
         self._stats.clear()
+        self._lanes.clear()
         self.logger.info("Rate limiter statistics reset")
     
     def get_stats_summary(self) -> Dict:
         """Get summary of rate limiter statistics."""
-        total_requests = sum(stats["requests"] for stats in self._stats.values())
-        total_rejections = sum(stats["rejections"] for stats in self._stats.values())
-        total_wait_time = sum(stats["wait_time"] for stats in self._stats.values())
+        total_requests = total_rejections = 0
+        total_wait_time = 0.0
+        for requests, rejections, wait_time in self._stats.values():
+            total_requests += requests
+            total_rejections += rejections
+            total_wait_time += wait_time
         
         return {
             "total_requests": total_requests,
@@ -389,11 +788,13 @@ class RateLimiter:
             config: New rate limit configuration
         """
         self.limits[country] = config
+        self._effective[country] = self._resolve_limits(config)
         
         # Update existing bucket if it exists
         for key in list(self._buckets.keys()):
-            if key.startswith(f"{country.value}:"):
+            if key[0] == country:
                 del self._buckets[key]
+                self._lanes.pop(key, None)
         
         self.logger.info(
             f"Updated rate limit for {country.value}: "
@@ -403,5 +804,6 @@ class RateLimiter:
     async def cleanup(self) -> None:
         """Cleanup resources."""
         self._buckets.clear()
+        self._lanes.clear()
         self._stats.clear()
         self.logger.info("RateLimiter cleaned up")
\ No newline at end of file
@@ -12,6 +12,7 @@ class CountryCode(Enum):
     MX = "MX"
     ID = "ID"
     JP = "JP"
+    UK = "UK"
     GB = "GB"
     CA = "CA"
     AU = "AU"
@@ -24,28 +25,31 @@ class CountryCode(Enum):
 class NicheType(Enum):
     """Content niche categories."""
     BOOKTOK = "BOOKTOK"
-    FITNESS = "FITNESS"
-    COOKING = "COOKING"
-    FASHION = "FASHION"
-    TRAVEL = "TRAVEL"
-    DANCE = "DANCE"
-    COMEDY = "COMEDY"
-    BEAUTY = "BEAUTY"
-    GAMING = "GAMING"
-    FINANCE = "FINANCE"
-    EDUCATION = "EDUCATION"
-    PETS = "PETS"
-    DIY = "DIY"
-    OTHER = "OTHER"
+    HEALTHTOK = "HEALTHTOK"
+    DIYTOK = "DIYTOK"
+    GAMINGTOK = "GAMINGTOK"
+    FINANCETOK = "FINANCETOK"
+    MUSICTOK = "MUSICTOK"
+    COMEDYTOK = "COMEDYTOK"
+    ACTIVISMTOK = "ACTIVISMTOK"
+    FOODTOK = "FOODTOK"
+    BEAUTYTOK = "BEAUTYTOK"
+    FASHIONTOK = "FASHIONTOK"
+    DANCETOK = "DANCETOK"
+    COMMERCETOK = "COMMERCETOK"
+    EDUCATIONTOK = "EDUCATIONTOK"
+    LIFESTYLETOK = "LIFESTYLETOK"
+    TRAVELLTOK = "TRAVELLTOK"
+    ENTERTAINMENTTOK = "ENTERTAINMENTTOK"
+    ARTTOK = "ARTTOK"
+    ENTREPRENEURTOK = "ENTREPRENEURTOK"
 
 
 class TrendDirection(Enum):
     """Trend direction indicators."""
-    UPWARD = "UPWARD"
-    RISING = "RISING"
+    UP = "UP"
+    DOWN = "DOWN"
     STABLE = "STABLE"
-    DECLINING = "DECLINING"
-    DOWNWARD = "DOWNWARD"
 
 
 class SentimentType(Enum):
@@ -21,8 +21,8 @@ def test_basic_imports():
         
         # Test basic functionality
         assert CountryCode.US == 'US'
-        assert NicheType.FITNESS == 'FITNESS'
-        assert TrendDirection.UPWARD == 'UPWARD'
+        assert NicheType.HEALTHTOK == 'HEALTHTOK'
+        assert TrendDirection.UP == 'UP'
         
         print("✅ Basic imports and enums work correctly")
         return True
@@ -84,7 +84,7 @@ def test_niche_classification():
             hashtags=["#fitness", "#gym", "#workout"]
         )
         
-        assert result.niche == NicheType.FITNESS, f"Expected FITNESS, got {result.niche}"
+        assert result.niche == NicheType.HEALTHTOK, f"Expected HEALTHTOK, got {result.niche}"
         assert result.confidence > 0, "Confidence should be > 0"
         assert result.method_used == "rule_based", "Should use rule-based method"
         
@@ -102,7 +102,7 @@ def test_niche_classification():
             hashtags=["#food", "#cooking", "#recipe"]
         )
         
-        assert result.niche == NicheType.COOKING, f"Expected COOKING, got {result.niche}"
+        assert result.niche == NicheType.FOODTOK, f"Expected FOODTOK, got {result.niche}"
         
         print("✅ Niche classification works correctly")
         return True
@@ -198,8 +198,8 @@ def test_hashtag_processing():
         
         assert hashtag.name == "#fitness", "Should normalize name correctly"
         assert hashtag.usage_count == 1000, "Should preserve usage count"
-        assert hashtag.niche == NicheType.FITNESS, "Should classify as fitness"
-        assert hashtag.trend_direction == TrendDirection.UPWARD, "Should detect upward trend"
+        assert hashtag.niche == NicheType.HEALTHTOK, "Should classify as fitness"
+        assert hashtag.trend_direction == TrendDirection.UP, "Should detect upward trend"
         assert hashtag.confidence_score > 0, "Should have confidence score"
         
         print("✅ Hashtag processing works correctly")
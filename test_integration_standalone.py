@@ -30,8 +30,8 @@ def test_basic_imports():
         
         # Test enums (should work without SQLAlchemy)
         assert CountryCode.US.value == 'US'
-        assert NicheType.FITNESS.value == 'FITNESS'
-        assert TrendDirection.UPWARD.value == 'UPWARD'
+        assert NicheType.HEALTHTOK.value == 'HEALTHTOK'
+        assert TrendDirection.UP.value == 'UP'
         
         print("✅ Basic imports and enums work correctly")
         return True
@@ -94,7 +94,7 @@ def test_niche_classification():
             hashtags=["#fitness", "#gym", "#workout"]
         )
         
-        assert result.niche == NicheType.FITNESS, f"Expected FITNESS, got {result.niche}"
+        assert result.niche == NicheType.HEALTHTOK, f"Expected HEALTHTOK, got {result.niche}"
         assert result.confidence > 0, "Confidence should be > 0"
         assert result.method_used == "rule_based", "Should use rule-based method"
         
@@ -112,7 +112,7 @@ def test_niche_classification():
             hashtags=["#food", "#cooking", "#recipe"]
         )
         
-        assert result.niche == NicheType.COOKING, f"Expected COOKING, got {result.niche}"
+        assert result.niche == NicheType.FOODTOK, f"Expected FOODTOK, got {result.niche}"
         
         print("✅ Niche classification works correctly")
         return True
@@ -206,8 +206,8 @@ def test_hashtag_processing():
         
         assert hashtag.name == "#fitness", "Should normalize name correctly"
         assert hashtag.usage_count == 1000, "Should preserve usage count"
-        assert hashtag.niche == NicheType.FITNESS, "Should classify as fitness"
-        assert hashtag.trend_direction in [TrendDirection.UPWARD, TrendDirection.RISING], f"Should detect upward/rising trend, got {hashtag.trend_direction}"
+        assert hashtag.niche == NicheType.HEALTHTOK, "Should classify as fitness"
+        assert hashtag.trend_direction == TrendDirection.UP, f"Should detect upward trend, got {hashtag.trend_direction}"
         assert hashtag.confidence_score > 0, "Should have confidence score"
         
         print("✅ Hashtag processing works correctly")
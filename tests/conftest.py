@@ -5,6 +5,27 @@ Provides common test configuration and fixtures for all tests.
 """
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session, raiseload
+
+from src.storage.database import DatabaseManager
+from src.storage.models import Base, Country
+from src.storage.models.enums import CountryCode
+
+# Name, users in millions, growth rate and timezone of the countries tests create
+_COUNTRIES = {
+    CountryCode.US: ("USA", 136.0, 5.0, "America/New_York"),
+    CountryCode.BR: ("Brazil", 91.7, 18.0, "America/Sao_Paulo"),
+    CountryCode.MX: ("Mexico", 85.4, 16.0, "America/Mexico_City"),
+    CountryCode.ID: ("Indonesia", 113.0, 15.0, "Asia/Jakarta"),
+    CountryCode.PH: ("Philippines", 49.9, 14.0, "Asia/Manila"),
+    CountryCode.VN: ("Vietnam", 67.7, 14.0, "Asia/Ho_Chi_Minh"),
+    CountryCode.PK: ("Pakistan", 54.4, 20.0, "Asia/Karachi"),
+    CountryCode.EG: ("Egypt", 23.0, 9.0, "Africa/Cairo"),
+    CountryCode.NG: ("Nigeria", 14.0, 25.0, "Africa/Lagos"),
+    CountryCode.TH: ("Thailand", 44.4, 12.0, "Asia/Bangkok"),
+    CountryCode.JP: ("Japan", 21.9, 6.0, "Asia/Tokyo"),
+}
 
 
 @pytest.fixture
@@ -15,3 +36,69 @@ def mock_config():
         "TIKTOK_CLIENT_SECRET": "test_secret",
         "DATABASE_URL": "sqlite:///:memory:",
     }
+
+
+@pytest.fixture(scope="session")
+def _shared_db_manager():
+    """Create the in-memory database schema once per test session."""
+    manager = DatabaseManager("sqlite:///:memory:")
+    manager.create_tables()
+    yield manager
+    manager.drop_tables()
+    manager.engine.dispose()
+
+
+@pytest.fixture
+def db_manager(_shared_db_manager):
+    """Provide the shared in-memory database, emptied after each test."""
+    yield _shared_db_manager
+    with _shared_db_manager.engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture
+def make_country(db_manager):
+    """
+    Provide a factory that inserts a country and returns its id.
+
+    Columns default to realistic values for the code; keyword arguments
+    override them, e.g. make_country(CountryCode.EG, is_active=False).
+    """
+
+    def _make_country(code, **overrides):
+        name, users_in_millions, growth_rate, timezone = _COUNTRIES[code]
+        row = {
+            "code": code,
+            "name": name,
+            "users_in_millions": users_in_millions,
+            "growth_rate": growth_rate,
+            "timezone": timezone,
+            **overrides,
+        }
+        (country_id,) = db_manager.bulk_create(Country, [row])
+        return country_id
+
+    return _make_country
+
+
+@pytest.fixture
+def raiseload_all():
+    """
+    Make every ORM SELECT raise on lazy relationship loads.
+
+    Relationships must be loaded explicitly (e.g. selectinload), so hidden
+    N+1 query patterns fail the test instead of just running slowly.
+    """
+
+    def add_raiseload(execute_state):
+        if (
+            execute_state.is_select
+            and not execute_state.is_column_load
+            and not execute_state.is_relationship_load
+        ):
+            execute_state.statement = execute_state.statement.options(raiseload("*"))
+
+    event.listen(Session, "do_orm_execute", add_raiseload)
+    yield
+    event.remove(Session, "do_orm_execute", add_raiseload)
@@ -0,0 +1,98 @@
+"""
+Tests for Cache Utilities
+
+Unit tests for the bounded TTL cache.
+"""
+
+import pytest
+
+from src.utils import cache as cache_module
+from src.utils.cache import DiskCache, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Provide a controllable clock for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_returns_fresh_value(self, clock):
+        """Test a stored value is returned before its TTL elapses."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache["a"] = [1, 2]
+
+        assert cache.get("a") == [1, 2]
+        assert "a" in cache
+
+    def test_expired_value_only_available_as_stale(self, clock):
+        """Test expired entries are hidden from get() but kept for fallback."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache["a"] = [1]
+        clock[0] += 61
+
+        assert cache.get("a") is None
+        assert "a" not in cache
+        assert cache.get_stale("a") == [1]
+
+    def test_evicts_least_recently_used(self, clock):
+        """Test the cache never grows past maxsize."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+
+        assert len(cache) == 2
+        assert cache.get_stale("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_touch_refreshes_stale_entry(self, clock):
+        """Test touch() makes an expired entry fresh again."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache["a"] = [1]
+        clock[0] += 61
+
+        assert cache.touch("a") is True
+        assert cache.get("a") == [1]
+        assert cache.touch("missing") is False
+
+    def test_invalid_maxsize(self):
+        """Test maxsize must be positive."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
+
+
+@pytest.mark.unit
+class TestDiskCache:
+    """Test cases for DiskCache."""
+
+    def test_values_survive_reopen(self, tmp_path, clock):
+        """Test stored values are visible to a new cache on the same file."""
+        path = tmp_path / "cache.sqlite3"
+        cache = DiskCache(path, ttl=60)
+        cache.set("hashtags|US", [{"name": "#fyp"}])
+        cache.close()
+
+        reopened = DiskCache(path, ttl=60)
+        value, ttl_left = reopened.get_with_ttl("hashtags|US")
+        assert value == [{"name": "#fyp"}]
+        assert ttl_left == pytest.approx(60)
+        reopened.close()
+
+    def test_expired_values_are_ignored_and_purged(self, tmp_path, clock):
+        """Test expired entries miss and are removed by purge_expired()."""
+        cache = DiskCache(tmp_path / "cache.sqlite3", ttl=60)
+        cache.set("a", 1)
+        clock[0] += 61
+
+        assert cache.get("a") is None
+        assert cache.purge_expired() == 1
+        cache.close()
@@ -0,0 +1,312 @@
+"""
+Tests for Creative Center Scraper
+
+Unit tests for the scraper's caching, coalescing and validation layers;
+page loads are replaced so no browser is started.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.scrapers.creative_center_scraper import CreativeCenterScraper, DataValidationError
+from src.storage.models.enums import CountryCode
+from src.utils import cache as cache_module
+
+_PAGE = "<html><body><p>Trending: #alpha #beta</p></body></html>"
+_CHANGED_PAGE = "<html><body><p>Trending: #gamma</p></body></html>"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Provide a controllable clock for the scraper's caches."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+class FakePages:
+    """Stand-in for _scrape_page that counts loads and can hold them open."""
+
+    def __init__(self, html=_PAGE, validators=None):
+        self.html = html
+        self.validators = validators or {}
+        self.loads = 0
+        self.gate = None
+
+    async def __call__(self, url, selector=None, wait_for=None):
+        self.loads += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        return self.html, dict(self.validators)
+
+
+def make_scraper(pages, **kwargs):
+    """Create a scraper whose page loads are served by pages."""
+    scraper = CreativeCenterScraper(**kwargs)
+    scraper._scrape_page = pages
+    return scraper
+
+
+def names(hashtags):
+    """Hashtag names of a scrape result."""
+    return [hashtag["name"] for hashtag in hashtags]
+
+
+@pytest.mark.unit
+class TestScrapeCoalescing:
+    """Test cases for single-flight scrapes."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scrapes_share_one_page_load(self, clock):
+        """Test identical concurrent scrapes load the page once."""
+        pages = FakePages()
+        pages.gate = asyncio.Event()
+        scraper = make_scraper(pages)
+
+        tasks = [
+            asyncio.create_task(scraper.scrape_trending_hashtags(CountryCode.US))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        pages.gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert pages.loads == 1
+        assert all(names(result) == ["#alpha", "#beta"] for result in results)
+        assert scraper._inflight == {}
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_coalesced(self, clock):
+        """Test scrapes for different countries load separately."""
+        pages = FakePages()
+        scraper = make_scraper(pages)
+
+        await asyncio.gather(
+            scraper.scrape_trending_hashtags(CountryCode.US),
+            scraper.scrape_trending_hashtags(CountryCode.BR),
+        )
+
+        assert pages.loads == 2
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_leaves_shared_scrape_running(self, clock):
+        """Test cancelling one waiter does not cancel the scrape for the others."""
+        pages = FakePages()
+        pages.gate = asyncio.Event()
+        scraper = make_scraper(pages)
+
+        first = asyncio.create_task(scraper.scrape_trending_hashtags(CountryCode.US))
+        second = asyncio.create_task(scraper.scrape_trending_hashtags(CountryCode.US))
+        await asyncio.sleep(0)
+        first.cancel()
+        pages.gate.set()
+
+        assert names(await second) == ["#alpha", "#beta"]
+        assert first.cancelled()
+        assert pages.loads == 1
+        await scraper.close()
+
+
+@pytest.mark.unit
+class TestRevalidation:
+    """Test cases for conditional revalidation of expired entries."""
+
+    @staticmethod
+    def use_head_responses(scraper, status_code):
+        """Answer the scraper's HEAD requests with status_code, recording them."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(status_code)
+
+        scraper._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return requests
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_reuses_expired_entry(self, clock):
+        """Test a 304 answer refreshes the cached entry without loading the page."""
+        pages = FakePages(validators={"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024"})
+        scraper = make_scraper(pages)
+        requests = self.use_head_responses(scraper, 304)
+
+        await scraper.scrape_trending_hashtags(CountryCode.US)
+        clock[0] += scraper.CACHE_DURATION + 1
+        pages.html = _CHANGED_PAGE
+
+        assert names(await scraper.scrape_trending_hashtags(CountryCode.US)) == ["#alpha", "#beta"]
+        assert pages.loads == 1
+        assert requests[0].method == "HEAD"
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+        assert requests[0].headers["If-Modified-Since"] == "Mon, 01 Jan 2024"
+
+        # The entry is fresh again, so the next call is a plain cache hit
+        await scraper.scrape_trending_hashtags(CountryCode.US)
+        assert len(requests) == 1
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_changed_page_is_scraped_again(self, clock):
+        """Test any answer other than 304 falls through to a full scrape."""
+        pages = FakePages(validators={"etag": '"v1"'})
+        scraper = make_scraper(pages)
+        self.use_head_responses(scraper, 200)
+
+        await scraper.scrape_trending_hashtags(CountryCode.US)
+        clock[0] += scraper.CACHE_DURATION + 1
+        pages.html = _CHANGED_PAGE
+
+        assert names(await scraper.scrape_trending_hashtags(CountryCode.US)) == ["#gamma"]
+        assert pages.loads == 2
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_entry_without_validators_is_not_revalidated(self, clock):
+        """Test pages served without ETag/Last-Modified are simply scraped again."""
+        pages = FakePages()
+        scraper = make_scraper(pages)
+        requests = self.use_head_responses(scraper, 304)
+
+        await scraper.scrape_trending_hashtags(CountryCode.US)
+        clock[0] += scraper.CACHE_DURATION + 1
+        await scraper.scrape_trending_hashtags(CountryCode.US)
+
+        assert requests == []
+        assert pages.loads == 2
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_validators_expire_after_max_age(self, clock):
+        """Test entries older than REVALIDATE_MAX_AGE are always scraped again."""
+        pages = FakePages(validators={"etag": '"v1"'})
+        scraper = make_scraper(pages)
+        requests = self.use_head_responses(scraper, 304)
+
+        await scraper.scrape_trending_hashtags(CountryCode.US)
+        clock[0] += scraper.REVALIDATE_MAX_AGE + 1
+        await scraper.scrape_trending_hashtags(CountryCode.US)
+
+        assert requests == []
+        assert pages.loads == 2
+        await scraper.close()
+
+
+@pytest.mark.unit
+class TestDiskCache:
+    """Test cases for the persistent cache tier."""
+
+    @pytest.mark.asyncio
+    async def test_entries_survive_a_restart(self, clock, tmp_path):
+        """Test a new scraper on the same cache_dir is served from disk."""
+        first = make_scraper(FakePages(), cache_dir=tmp_path)
+        await first.scrape_trending_hashtags(CountryCode.US)
+        await first.close()
+
+        pages = FakePages(html=_CHANGED_PAGE)
+        second = make_scraper(pages, cache_dir=tmp_path)
+
+        assert names(await second.scrape_trending_hashtags(CountryCode.US)) == ["#alpha", "#beta"]
+        assert pages.loads == 0
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_disk_hit_is_promoted_for_its_remaining_lifetime(self, clock, tmp_path):
+        """Test entries read from disk expire from memory when they would on disk."""
+        first = CreativeCenterScraper(cache_dir=tmp_path)
+        first._store_in_cache("key", [{"name": "#alpha"}])
+        await first.close()
+
+        clock[0] += 3000
+        second = CreativeCenterScraper(cache_dir=tmp_path)
+        assert second._get_from_cache("key") == [{"name": "#alpha"}]
+        assert second._cache.get("key") == [{"name": "#alpha"}]
+
+        clock[0] += second.CACHE_DURATION - 3000 + 1
+        assert second._cache.get("key") is None
+        assert second._get_from_cache("key") is None
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_disk_entries_are_not_served(self, clock, tmp_path):
+        """Test a restart after the TTL scrapes the page again."""
+        first = make_scraper(FakePages(), cache_dir=tmp_path)
+        await first.scrape_trending_hashtags(CountryCode.US)
+        await first.close()
+
+        clock[0] += CreativeCenterScraper.CACHE_DURATION + 1
+        pages = FakePages(html=_CHANGED_PAGE)
+        second = make_scraper(pages, cache_dir=tmp_path)
+
+        assert names(await second.scrape_trending_hashtags(CountryCode.US)) == ["#gamma"]
+        assert pages.loads == 1
+        await second.close()
+
+
+@pytest.mark.unit
+class TestHashtagValidation:
+    """Test cases for hashtag validation."""
+
+    RAW = [
+        {"name": "alpha", "usage_count": 120, "engagement": 4.5, "growth_rate": 12},
+        {"name": " #beta ", "usage_count": -5, "engagement": -1, "growth_rate": 5000},
+        {"name": "#gamma", "usage_count": 7, "trend_direction": "UP", "views": 900},
+        {"usage_count": 10},
+        {"name": "#delta", "usage_count": None},
+        {"name": "#epsilon", "usage_count": 0, "growth_rate": -400, "videos": 3},
+    ]
+
+    def test_row_validation_cleans_values(self):
+        """Test a single hashtag is normalized and clamped."""
+        scraper = CreativeCenterScraper()
+
+        cleaned = scraper._validate_hashtag_data(self.RAW[1])
+
+        assert cleaned == {
+            "name": "#beta",
+            "usage_count": 0,
+            "engagement": 0,
+            "growth_rate": 1000,
+            "trend_direction": "STABLE",
+            "videos": 0,
+            "views": 0,
+        }
+
+    def test_row_validation_rejects_missing_fields(self):
+        """Test hashtags without a name or usage count are rejected."""
+        scraper = CreativeCenterScraper()
+
+        with pytest.raises(DataValidationError) as excinfo:
+            scraper._validate_hashtag_data(self.RAW[4])
+
+        assert excinfo.value.field == "usage_count"
+
+    def test_small_batches_drop_invalid_rows(self):
+        """Test batches below VECTORIZE_MIN_ROWS are validated row by row."""
+        scraper = CreativeCenterScraper()
+
+        assert names(scraper._validate_hashtags(self.RAW)) == [
+            "#alpha",
+            "#beta",
+            "#gamma",
+            "#epsilon",
+        ]
+
+    def test_vectorized_batches_match_row_validation(self):
+        """Test the pandas path returns what row-by-row validation does."""
+        scraper = CreativeCenterScraper()
+        raw = self.RAW * 2
+        assert len(raw) >= scraper.VECTORIZE_MIN_ROWS
+
+        expected = []
+        for hashtag in raw:
+            try:
+                expected.append(scraper._validate_hashtag_data(hashtag))
+            except DataValidationError:
+                continue
+
+        assert scraper._validate_hashtags(raw) == expected
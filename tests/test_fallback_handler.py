@@ -0,0 +1,264 @@
+"""
+Tests for Fallback Handler
+
+Unit tests for caching, coalescing and circuit breaking in the fallback
+pipeline, with the live sources replaced by a fake scraper.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.storage.models.enums import CountryCode
+from src.utils import fallback_handler as fallback_module
+from src.utils.fallback_handler import DataSource, FallbackHandler
+
+# Only the scraper is consulted, so every call is visible to the fake
+_SCRAPER_ONLY = [DataSource.CREATIVE_CENTER]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Provide a controllable monotonic clock for the fallback handler."""
+    # Starts at the real reading: CacheEntry.stored_at defaults to the
+    # unpatched time.monotonic
+    now = [time.monotonic()]
+    monkeypatch.setattr(fallback_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+class FakeScraper:
+    """Scraper stand-in that counts calls and can hold them open or fail."""
+
+    def __init__(self):
+        self.calls = 0
+        self.gate = None
+        self.error = None
+
+    async def scrape_trending_hashtags(self, country, limit, niche):
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return [{"name": f"#v{self.calls}", "usage_count": 100}]
+
+
+async def get_hashtags(handler):
+    """Request US hashtags from the scraper only."""
+    return await handler.get_trends("hashtags", CountryCode.US, source_priority=_SCRAPER_ONLY)
+
+
+def names(result):
+    """Hashtag names of a fallback result."""
+    return [hashtag["name"] for hashtag in result.data]
+
+
+@pytest.mark.unit
+class TestCoalescing:
+    """Test cases for single-flight loads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, clock):
+        """Test identical concurrent cache misses reach the source once."""
+        scraper = FakeScraper()
+        scraper.gate = asyncio.Event()
+        handler = FallbackHandler(scraper=scraper)
+
+        tasks = [asyncio.create_task(get_hashtags(handler)) for _ in range(3)]
+        await asyncio.sleep(0)
+        scraper.gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert scraper.calls == 1
+        assert all(names(result) == ["#v1"] for result in results)
+        assert handler._inflight == {}
+        await handler.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_coalescing_without_cache(self, clock):
+        """Test concurrent requests are coalesced even with caching off."""
+        scraper = FakeScraper()
+        scraper.gate = asyncio.Event()
+        handler = FallbackHandler(scraper=scraper, enable_cache=False)
+
+        tasks = [asyncio.create_task(get_hashtags(handler)) for _ in range(2)]
+        await asyncio.sleep(0)
+        scraper.gate.set()
+        await asyncio.gather(*tasks)
+        await get_hashtags(handler)
+
+        assert scraper.calls == 2
+        await handler.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_leaves_shared_load_running(self, clock):
+        """Test cancelling one waiter does not cancel the load for the others."""
+        scraper = FakeScraper()
+        scraper.gate = asyncio.Event()
+        handler = FallbackHandler(scraper=scraper)
+
+        first = asyncio.create_task(get_hashtags(handler))
+        second = asyncio.create_task(get_hashtags(handler))
+        await asyncio.sleep(0)
+        first.cancel()
+        scraper.gate.set()
+
+        assert names(await second) == ["#v1"]
+        assert first.cancelled()
+        assert scraper.calls == 1
+        await handler.cleanup()
+
+
+@pytest.mark.unit
+class TestStaleWhileRevalidate:
+    """Test cases for serving stale entries while refreshing them."""
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_and_refreshed_once(self, clock):
+        """Test an expired entry is returned at once and refreshed in the background."""
+        scraper = FakeScraper()
+        handler = FallbackHandler(scraper=scraper, enable_swr=True, stale_ttl_seconds=900)
+        await get_hashtags(handler)
+
+        clock[0] += handler.CACHE_TTL["hashtags"] + 1
+        scraper.gate = asyncio.Event()
+
+        stale = await get_hashtags(handler)
+        again = await get_hashtags(handler)
+        assert names(stale) == names(again) == ["#v1"]
+        assert stale.source == DataSource.CACHED_DATA
+
+        await asyncio.sleep(0)
+        assert scraper.calls == 2
+        assert len(handler._refresh_tasks) == 1
+
+        scraper.gate.set()
+        await asyncio.gather(*handler._refresh_tasks)
+
+        refreshed = await get_hashtags(handler)
+        assert names(refreshed) == ["#v2"]
+        assert scraper.calls == 2
+        await handler.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_entry_past_stale_window_blocks_on_sources(self, clock):
+        """Test entries beyond the stale window are reloaded before returning."""
+        scraper = FakeScraper()
+        handler = FallbackHandler(scraper=scraper, enable_swr=True, stale_ttl_seconds=900)
+        await get_hashtags(handler)
+
+        clock[0] += handler.CACHE_TTL["hashtags"] + 901
+        result = await get_hashtags(handler)
+
+        assert names(result) == ["#v2"]
+        assert result.source == DataSource.CREATIVE_CENTER
+        assert handler._refresh_tasks == set()
+        await handler.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_swr_disabled_reloads_expired_entry(self, clock):
+        """Test without SWR an expired entry is reloaded before returning."""
+        scraper = FakeScraper()
+        handler = FallbackHandler(scraper=scraper)
+        await get_hashtags(handler)
+
+        clock[0] += handler.CACHE_TTL["hashtags"] + 1
+
+        assert names(await get_hashtags(handler)) == ["#v2"]
+        await handler.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_serving_stale(self, clock):
+        """Test a failed background refresh leaves the stale entry in place."""
+        scraper = FakeScraper()
+        handler = FallbackHandler(scraper=scraper, enable_swr=True, stale_ttl_seconds=900)
+        await get_hashtags(handler)
+
+        clock[0] += handler.CACHE_TTL["hashtags"] + 1
+        scraper.error = RuntimeError("scrape failed")
+        assert names(await get_hashtags(handler)) == ["#v1"]
+        await asyncio.gather(*handler._refresh_tasks)
+
+        # The next stale hit starts another refresh
+        assert names(await get_hashtags(handler)) == ["#v1"]
+        await asyncio.gather(*handler._refresh_tasks)
+        assert scraper.calls == 3
+        await handler.cleanup()
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test cases for per-source circuit breaking."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_repeated_failures(self, clock):
+        """Test a source is skipped after CIRCUIT_FAILURE_THRESHOLD failures."""
+        scraper = FakeScraper()
+        scraper.error = RuntimeError("scrape failed")
+        handler = FallbackHandler(scraper=scraper)
+
+        for _ in range(handler.CIRCUIT_FAILURE_THRESHOLD):
+            assert not (await get_hashtags(handler)).success
+
+        health = handler._source_health[DataSource.CREATIVE_CENTER]
+        assert health.state == "open"
+        assert health.open_until == clock[0] + 2 ** handler.CIRCUIT_FAILURE_THRESHOLD
+
+        result = await get_hashtags(handler)
+        assert result.error_message == "Source marked as unavailable"
+        assert scraper.calls == handler.CIRCUIT_FAILURE_THRESHOLD
+        await handler.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_successful_probe_closes_circuit(self, clock):
+        """Test one probe is let through once the open period ends."""
+        scraper = FakeScraper()
+        scraper.error = RuntimeError("scrape failed")
+        handler = FallbackHandler(scraper=scraper)
+        for _ in range(handler.CIRCUIT_FAILURE_THRESHOLD):
+            await get_hashtags(handler)
+
+        clock[0] += 2 ** handler.CIRCUIT_FAILURE_THRESHOLD + 1
+        scraper.error = None
+
+        assert (await get_hashtags(handler)).success
+        health = handler._source_health[DataSource.CREATIVE_CENTER]
+        assert health.state == "closed"
+        assert health.failures == 0
+        await handler.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens_for_longer(self, clock):
+        """Test a failed probe reopens the circuit with a doubled open period."""
+        scraper = FakeScraper()
+        scraper.error = RuntimeError("scrape failed")
+        handler = FallbackHandler(scraper=scraper)
+        for _ in range(handler.CIRCUIT_FAILURE_THRESHOLD):
+            await get_hashtags(handler)
+
+        clock[0] += 2 ** handler.CIRCUIT_FAILURE_THRESHOLD + 1
+        await get_hashtags(handler)
+
+        health = handler._source_health[DataSource.CREATIVE_CENTER]
+        assert health.state == "open"
+        assert health.open_until == clock[0] + 2 ** (handler.CIRCUIT_FAILURE_THRESHOLD + 1)
+        assert scraper.calls == handler.CIRCUIT_FAILURE_THRESHOLD + 1
+        await handler.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_probe_timeout_allows_another_probe(self, clock):
+        """Test a probe that never reports back does not keep the source closed off."""
+        handler = FallbackHandler()
+        health = handler._source_health[DataSource.CREATIVE_CENTER]
+        health.state = "open"
+        health.open_until = clock[0]
+
+        clock[0] += 1
+        assert handler._admit(DataSource.CREATIVE_CENTER)
+        assert not handler._admit(DataSource.CREATIVE_CENTER)
+
+        clock[0] += handler.CIRCUIT_PROBE_TIMEOUT + 1
+        assert handler._admit(DataSource.CREATIVE_CENTER)
+        await handler.cleanup()
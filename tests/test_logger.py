@@ -0,0 +1,68 @@
+"""
+Tests for Logger
+
+Unit tests for credential masking in log messages.
+"""
+
+import io
+import logging
+
+import pytest
+
+from src.utils.logger import setup_logger
+
+
+@pytest.fixture
+def captured(tmp_path):
+    """Provide a logger whose messages are also written to a string buffer."""
+    logger = setup_logger("test_masking", log_dir=str(tmp_path))
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    logger.addHandler(handler)
+    yield logger, buffer
+    logger.removeHandler(handler)
+
+
+@pytest.mark.unit
+class TestSecretMasking:
+    """Test cases for the secret masking filter."""
+
+    def test_credentials_are_masked(self, captured):
+        """Test credential values never reach the handlers."""
+        logger, buffer = captured
+        logger.info("client_secret=%s", "client_secret_12345")
+        logger.info("access_token=%s", "abc.def")
+        logger.info("Authorization: Bearer %s", "xyz789")
+
+        output = buffer.getvalue()
+        assert "client_secret_12345" not in output
+        assert "abc.def" not in output
+        assert "xyz789" not in output
+        assert "client_secret=***" in output
+        assert "access_token=***" in output
+        assert "Bearer ***" in output
+
+    def test_plain_messages_are_unchanged(self, captured):
+        """Test messages without credential markers are only formatted."""
+        logger, buffer = captured
+        logger.info("Cached %d items for %s", 3, "hashtags|US")
+        logger.info("Access token refreshed successfully")
+
+        assert buffer.getvalue().splitlines() == [
+            "Cached 3 items for hashtags|US",
+            "Access token refreshed successfully",
+        ]
+
+    def test_credential_words_outside_fields_are_unchanged(self, captured):
+        """Test hashtags and error text mentioning credential words are kept."""
+        logger, buffer = captured
+        messages = [
+            "#secret_santa trend rank 3",
+            "secret_santa trend rank 3",
+            "password_reset_flow started",
+            "Failed to refresh token: HTTP 401",
+        ]
+        for message in messages:
+            logger.info(message)
+
+        assert buffer.getvalue().splitlines() == messages
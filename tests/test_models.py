@@ -4,22 +4,17 @@ Tests for SQLAlchemy Models
 Unit tests for database models and integration.
 """
 
+from datetime import datetime, timezone
+
 import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.exc import InvalidRequestError
 
-from src.storage.database import DatabaseManager
-from src.storage.models import Country, Creator, Hashtag
+from src.storage.database import AsyncDatabaseManager
+from src.storage.models import Country, Creator, Hashtag, Video
 from src.storage.models.enums import CountryCode, DataSourceType, NicheType, TrendDirection
 
 
-@pytest.fixture
-def db_manager():
-    """Create an in-memory database for testing."""
-    manager = DatabaseManager("sqlite:///:memory:")
-    manager.create_tables()
-    yield manager
-    manager.drop_tables()
-
-
 @pytest.mark.unit
 class TestModels:
     """Test cases for database models."""
@@ -51,8 +46,7 @@ class TestModels:
             is_active=True,
         )
         session.add(country)
-        session.commit()
-        session.refresh(country)
+        session.flush()
 
         assert country.id is not None
         assert country.code == CountryCode.BR
@@ -60,25 +54,14 @@ class TestModels:
         assert country.is_active is True
         session.close()
 
-    def test_hashtag_model(self, db_manager):
+    def test_hashtag_model(self, db_manager, make_country):
         """Test Hashtag model creation."""
+        country_id = make_country(CountryCode.US)
         session = db_manager.get_session()
 
-        # Create country first
-        country = Country(
-            code=CountryCode.US,
-            name="USA",
-            users_in_millions=136.0,
-            growth_rate=5.0,
-            timezone="America/New_York",
-        )
-        session.add(country)
-        session.commit()
-
-        # Create hashtag
         hashtag = Hashtag(
             name="#booktok",
-            country_id=country.id,
+            country_id=country_id,
             niche=NicheType.BOOKTOK,
             posts_count=1000000,
             views_count=5000000000,
@@ -90,8 +73,7 @@ class TestModels:
             data_source=DataSourceType.OFFICIAL_API,
         )
         session.add(hashtag)
-        session.commit()
-        session.refresh(hashtag)
+        session.flush()
 
         assert hashtag.id is not None
         assert hashtag.name == "#booktok"
@@ -99,27 +81,16 @@ class TestModels:
         assert hashtag.niche == NicheType.BOOKTOK
         session.close()
 
-    def test_creator_model(self, db_manager):
+    def test_creator_model(self, db_manager, make_country):
         """Test Creator model creation."""
+        country_id = make_country(CountryCode.MX)
         session = db_manager.get_session()
 
-        # Create country first
-        country = Country(
-            code=CountryCode.MX,
-            name="Mexico",
-            users_in_millions=85.4,
-            growth_rate=16.0,
-            timezone="America/Mexico_City",
-        )
-        session.add(country)
-        session.commit()
-
-        # Create creator
         creator = Creator(
             tiktok_creator_id="creator123",
             username="coolcreator",
             display_name="Cool Creator",
-            country_id=country.id,
+            country_id=country_id,
             followers=1000000,
             follower_growth=10.0,
             videos_count=250,
@@ -129,8 +100,7 @@ class TestModels:
             trending_rank=5,
         )
         session.add(creator)
-        session.commit()
-        session.refresh(creator)
+        session.flush()
 
         assert creator.id is not None
         assert creator.username == "coolcreator"
@@ -138,62 +108,39 @@ class TestModels:
         assert creator.followers == 1000000
         session.close()
 
-    def test_relationship_country_hashtag(self, db_manager):
+    def test_relationship_country_hashtag(self, db_manager, make_country):
         """Test relationship between Country and Hashtag."""
+        country_id = make_country(CountryCode.ID)
         session = db_manager.get_session()
 
-        country = Country(
-            code=CountryCode.ID,
-            name="Indonesia",
-            users_in_millions=107.7,
-            growth_rate=22.0,
-            timezone="Asia/Jakarta",
-        )
-        session.add(country)
-        session.commit()
-
-        hashtag1 = Hashtag(
-            name="#gaming",
-            country_id=country.id,
-            niche=NicheType.GAMINGTOK,
-            rank=1,
-            data_source=DataSourceType.CREATIVE_CENTER,
-        )
-        hashtag2 = Hashtag(
-            name="#comedy",
-            country_id=country.id,
-            niche=NicheType.COMEDYTOK,
-            rank=2,
-            data_source=DataSourceType.CREATIVE_CENTER,
+        session.execute(
+            insert(Hashtag),
+            [
+                {
+                    "name": name,
+                    "country_id": country_id,
+                    "niche": niche,
+                    "rank": rank,
+                    "data_source": DataSourceType.CREATIVE_CENTER,
+                }
+                for rank, (name, niche) in enumerate(
+                    [("#gaming", NicheType.GAMINGTOK), ("#comedy", NicheType.COMEDYTOK)], start=1
+                )
+            ],
         )
-        session.add_all([hashtag1, hashtag2])
         session.commit()
 
-        # Query country with hashtags
-        country_with_hashtags = (
-            session.query(Country).filter(Country.code == CountryCode.ID).first()
-        )
+        # Load country with hashtags by primary key
+        country_with_hashtags = session.get(Country, country_id)
         assert len(country_with_hashtags.hashtags) == 2
         hashtag_names = [h.name for h in country_with_hashtags.hashtags]
         assert "#gaming" in hashtag_names
         assert "#comedy" in hashtag_names
         session.close()
 
-    def test_database_manager_save_methods(self, db_manager):
+    def test_database_manager_save_methods(self, db_manager, make_country):
         """Test DatabaseManager save methods."""
-        # Create country first
-        session = db_manager.get_session()
-        country = Country(
-            code=CountryCode.JP,
-            name="Japan",
-            users_in_millions=38.0,
-            growth_rate=2.0,
-            timezone="Asia/Tokyo",
-        )
-        session.add(country)
-        session.commit()
-        country_id = country.id
-        session.close()
+        make_country(CountryCode.JP)
 
         # Test save_hashtag (Note: This will fail without proper data, so we skip)
         # The methods in database.py need refinement to handle relationships properly
@@ -203,3 +150,233 @@ class TestModels:
         assert hasattr(db_manager, "save_video")
         assert hasattr(db_manager, "save_creator")
         assert hasattr(db_manager, "get_country_by_code")
+
+    def test_save_hashtags_bulk(self, db_manager, make_country):
+        """Test bulk hashtag save inserts new rows and updates existing ones."""
+        country_id = make_country(CountryCode.BR)
+
+        rows = [
+            {
+                "name": f"#tag{i}",
+                "country_id": country_id,
+                "niche": NicheType.DANCETOK,
+                "rank": i + 1,
+                "data_source": DataSourceType.CREATIVE_CENTER,
+            }
+            for i in range(3)
+        ]
+        assert db_manager.save_hashtags_bulk(rows) == 3
+        assert db_manager.save_hashtags_bulk([]) == 0
+
+        # Re-saving an existing hashtag updates it in place
+        db_manager.save_hashtags_bulk([{**rows[0], "rank": 10}])
+
+        session = db_manager.get_session()
+        hashtags = session.query(Hashtag).order_by(Hashtag.name).all()
+        assert [h.name for h in hashtags] == ["#tag0", "#tag1", "#tag2"]
+        assert hashtags[0].rank == 10
+        session.close()
+
+    def test_save_creators_bulk_upserts(self, db_manager, make_country):
+        """Test re-saving creators updates stats but keeps the original first_seen."""
+        country_id = make_country(CountryCode.PK)
+
+        rows = [
+            {
+                "tiktok_creator_id": f"pk_{i}",
+                "username": f"creator{i}",
+                "country_id": country_id,
+                "followers": 100,
+            }
+            for i in range(2)
+        ]
+        assert db_manager.save_creators_bulk(rows) == 2
+
+        session = db_manager.get_session()
+        first_seen = session.scalars(select(Creator.first_seen).order_by(Creator.id)).first()
+        session.close()
+
+        db_manager.save_creators_bulk([{**rows[0], "followers": 250}])
+
+        session = db_manager.get_session()
+        creators = session.scalars(select(Creator).order_by(Creator.id)).all()
+        assert [c.followers for c in creators] == [250, 100]
+        assert creators[0].first_seen == first_seen
+        assert creators[0].last_seen >= first_seen
+        session.close()
+
+    def test_bulk_create_returns_ids_in_order(self, db_manager, make_country):
+        """Test bulk_create inserts all rows and returns their ids in order."""
+        country_id = make_country(CountryCode.VN)
+
+        rows = [
+            {
+                "tiktok_creator_id": f"vn_{i}",
+                "username": f"creator{i}",
+                "country_id": country_id,
+            }
+            for i in range(5)
+        ]
+        ids = db_manager.bulk_create(Creator, rows)
+
+        assert len(ids) == 5
+        session = db_manager.get_session()
+        creators = session.query(Creator).all()
+        by_id = {c.id: c.tiktok_creator_id for c in creators}
+        assert [by_id[i] for i in ids] == [row["tiktok_creator_id"] for row in rows]
+        # The whole batch is stamped with one application-side timestamp
+        assert len({(c.first_seen, c.last_seen) for c in creators}) == 1
+        assert creators[0].first_seen == creators[0].last_seen
+        assert db_manager.bulk_create(Creator, []) == []
+        session.close()
+
+    def test_get_top_hashtags(self, db_manager, make_country):
+        """Test the hashtag ranking is returned as plain dictionaries ordered by rank."""
+        country_id = make_country(CountryCode.ID)
+
+        db_manager.save_hashtags_bulk(
+            [
+                {
+                    "name": f"#rank{rank}",
+                    "country_id": country_id,
+                    "niche": NicheType.FOODTOK,
+                    "rank": rank,
+                    "data_source": DataSourceType.CREATIVE_CENTER,
+                }
+                for rank in (3, 1, 2)
+            ]
+        )
+
+        top = db_manager.get_top_hashtags(country_id, limit=2)
+
+        assert [row["name"] for row in top] == ["#rank1", "#rank2"]
+        assert set(top[0]) == {"name", "rank", "viral_score", "growth_rate", "trend_direction"}
+        assert top[0]["trend_direction"] == TrendDirection.STABLE
+
+    def test_get_trending_snapshot_without_materialized_view(self, db_manager, make_country):
+        """Test the snapshot falls back to a live query where there is no view."""
+        country_id = make_country(CountryCode.JP)
+
+        db_manager.save_hashtags_bulk(
+            [
+                {
+                    "name": name,
+                    "country_id": country_id,
+                    "niche": niche,
+                    "rank": rank,
+                    "data_source": DataSourceType.CREATIVE_CENTER,
+                }
+                for rank, (name, niche) in enumerate(
+                    [("#ramen", NicheType.FOODTOK), ("#anime", NicheType.GAMINGTOK)], start=1
+                )
+            ]
+        )
+
+        assert db_manager.refresh_trending_snapshots() is False
+        snapshot = db_manager.get_trending_snapshot(CountryCode.JP, niche=NicheType.FOODTOK)
+
+        assert [row["hashtag_name"] for row in snapshot] == ["#ramen"]
+        assert snapshot[0]["country_code"] == CountryCode.JP
+        assert snapshot[0]["refreshed_at"] is not None
+
+    def test_get_active_countries_with_relations(self, db_manager, make_country):
+        """Test country collections are eager-loaded and usable after the session."""
+        country_id = make_country(CountryCode.TH)
+        make_country(CountryCode.EG, is_active=False)
+        session = db_manager.get_session()
+        session.add(
+            Hashtag(
+                name="#thaifood",
+                country_id=country_id,
+                niche=NicheType.FOODTOK,
+                rank=1,
+                data_source=DataSourceType.CREATIVE_CENTER,
+            )
+        )
+        session.commit()
+        session.close()
+
+        countries = db_manager.get_active_countries(with_relations=True)
+
+        assert [c.code for c in countries] == [CountryCode.TH]
+        assert [h.name for h in countries[0].hashtags] == ["#thaifood"]
+        assert countries[0].trends == []
+
+    def test_video_many_to_one_loaded_eagerly(self, db_manager, make_country):
+        """Test a video's creator and country are usable after the session closes."""
+        country_id = make_country(CountryCode.PH)
+        session = db_manager.get_session()
+        creator = Creator(tiktok_creator_id="ph_1", username="manila", country_id=country_id)
+        session.add(creator)
+        session.flush()
+        session.add(
+            Video(
+                tiktok_video_id=7301234567890123456,
+                creator_id=creator.id,
+                country_id=country_id,
+                tiktok_created_at=datetime(2025, 11, 1, tzinfo=timezone.utc),
+            )
+        )
+        session.commit()
+        session.close()
+
+        session = db_manager.get_session()
+        video = session.scalars(select(Video)).one()
+        session.close()
+
+        assert video.tiktok_video_id == 7301234567890123456
+        assert video.creator.username == "manila"
+        assert video.country.code == CountryCode.PH
+        assert video.creator.country is video.country
+
+    def test_lazy_loads_raise_under_raiseload(self, db_manager, make_country, raiseload_all):
+        """Test lazy relationship loads fail while explicit eager loads work."""
+        make_country(CountryCode.NG)
+
+        session = db_manager.get_session()
+        country = session.scalars(select(Country)).one()
+        with pytest.raises(InvalidRequestError):
+            country.hashtags
+        session.close()
+
+        loaded = db_manager.get_country_by_code(CountryCode.NG, with_relations=True)
+        assert loaded.hashtags == []
+
+    @pytest.mark.asyncio
+    async def test_async_database_manager(self):
+        """Test AsyncDatabaseManager round-trip on an async SQLite engine."""
+        manager = AsyncDatabaseManager("sqlite:///:memory:")
+        assert manager.database_url.startswith("sqlite+aiosqlite")
+
+        await manager.create_tables()
+        async with manager.get_session() as session:
+            country = Country(
+                code=CountryCode.PH,
+                name="Philippines",
+                users_in_millions=49.9,
+                growth_rate=20.0,
+                timezone="Asia/Manila",
+            )
+            session.add(country)
+            await session.commit()
+            country_id = country.id
+
+        saved = await manager.save_hashtag(
+            {
+                "name": "#pinoy",
+                "country_id": country_id,
+                "niche": NicheType.COMEDYTOK,
+                "rank": 1,
+                "data_source": DataSourceType.CREATIVE_CENTER,
+            }
+        )
+        assert saved["id"] is not None
+
+        found = await manager.get_country_by_code(CountryCode.PH)
+        assert found is not None and found.id == country_id
+
+        top = await manager.get_top_hashtags(country_id)
+        assert [row["name"] for row in top] == ["#pinoy"]
+
+        await manager.drop_tables()
+        await manager.dispose()
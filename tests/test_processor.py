@@ -4,8 +4,13 @@ Tests for Data Processor
 Unit tests for data processing module.
 """
 
+import asyncio
+
+import pandas as pd
 import pytest
 
+from src.data_processing.processor import DataProcessor
+
 
 @pytest.mark.unit
 class TestDataProcessor:
@@ -25,3 +30,181 @@ class TestDataProcessor:
         """Test niche classification."""
         # TODO: Implement test
         pass
+
+
+@pytest.fixture
+def processor():
+    """Provide a DataProcessor without the optional ML components."""
+    return DataProcessor(enable_ml=False)
+
+
+# Raw records with missing, None, numeric-string and out-of-range values
+_RAW_RECORDS = {
+    "hashtag": [
+        {"name": "#fyp", "usage_count": 5000, "engagement": 4.2},
+        {"name": "#rare", "usage_count": 3, "engagement": 0.05},
+        {"name": None, "usage_count": None, "engagement": None},
+        {"name": "#" + "x" * 120, "usage_count": "250"},
+        {"usage_count": "not a number", "engagement": 1},
+    ],
+    "creator": [
+        {"username": "@chef", "followers": 25000, "engagement_rate": 3.1},
+        {"username": "u" * 60, "followers": 50, "engagement_rate": 0.1},
+        {"username": None, "followers": None},
+        {"followers": "1200", "engagement_rate": "0.9"},
+    ],
+    "sound": [
+        {"title": "Summer hit", "plays": 2_000_000, "duration": 30},
+        {"title": "Long mix", "plays": 500, "duration": 900},
+        {"title": None, "plays": None, "duration": None},
+        {"plays": "5000", "duration": "0"},
+    ],
+}
+
+
+@pytest.mark.unit
+class TestDataQualityScores:
+    """Test cases for scalar and batch data quality scoring."""
+
+    @pytest.mark.parametrize("data_type", ["hashtag", "creator", "sound"])
+    def test_batch_matches_scalar(self, processor, data_type):
+        """Test batch scores equal per-record scores, None and bad values included."""
+        records = _RAW_RECORDS[data_type]
+        batch = processor.batch_quality_scores(pd.DataFrame.from_records(records), data_type)
+        scalar = [
+            processor.calculate_data_quality_score(record, data_type)[1] for record in records
+        ]
+
+        assert batch.tolist() == pytest.approx(scalar)
+
+    def test_scalar_scores_none_values_as_missing(self, processor):
+        """Test None values are scored like absent fields instead of raising."""
+        level, score = processor.calculate_data_quality_score(
+            {"name": None, "usage_count": None, "engagement": None}, "hashtag"
+        )
+
+        assert score == processor.calculate_data_quality_score({}, "hashtag")[1]
+        assert score == 10.0
+        assert level.name == "VERY_POOR"
+
+    def test_process_hashtags_uses_batch_scores(self, processor):
+        """Test processed hashtags carry the same scores as the scalar path."""
+        records = _RAW_RECORDS["hashtag"][:2]
+        processed = processor.process_hashtags(records)
+
+        assert [hashtag.data_quality_score for hashtag in processed] == pytest.approx(
+            [processor.calculate_data_quality_score(r, "hashtag")[1] for r in records]
+        )
+
+
+@pytest.mark.unit
+class TestKeywordExtraction:
+    """Test cases for keyword extraction."""
+
+    def test_batch_matches_per_text(self, processor):
+        """Test extract_keywords_batch returns what extract_keywords does per text."""
+        texts = [
+            "Cooking pasta pasta recipe with garlic garlic garlic",
+            "",
+            "the and of",
+            "Dance dance challenge: new moves, new steps, new dance",
+            "zeta alpha beta alpha zeta gamma",
+        ]
+
+        for max_keywords in (1, 3, 10):
+            assert processor.extract_keywords_batch(texts, max_keywords) == [
+                processor.extract_keywords(text, max_keywords) for text in texts
+            ]
+
+    def test_ties_keep_first_occurrence_order(self, processor):
+        """Test equally frequent keywords are ordered by first appearance."""
+        assert processor.extract_keywords_batch(["zeta alpha beta alpha zeta"], 3) == [
+            ["zeta", "alpha", "beta"]
+        ]
+
+    def test_batch_without_tokens(self, processor):
+        """Test texts with no keywords give empty lists."""
+        assert processor.extract_keywords_batch(["", "a an the", ""]) == [[], [], []]
+
+
+@pytest.mark.unit
+class TestHashtagNormalization:
+    """Test cases for normalize_hashtag_name."""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("#FYP", "#fyp"),
+            ("fyp", "#fyp"),
+            ("##Book Tok!", "#booktok"),
+            ("#for_you", "#for_you"),
+            ("@creator", "#creator"),
+            ("#", ""),
+            ("", ""),
+        ],
+    )
+    def test_normalize_hashtag_name(self, processor, raw, expected):
+        """Test hashtags become one lowercase word with a single leading #."""
+        assert processor.normalize_hashtag_name(raw) == expected
+
+
+@pytest.mark.unit
+class TestAsyncProcessing:
+    """Test cases for the chunked async entry points."""
+
+    @pytest.mark.asyncio
+    async def test_process_in_chunks_preserves_order(self, processor):
+        """Test chunks are processed separately and reassembled in input order."""
+        chunks = []
+
+        def process(chunk):
+            chunks.append(list(chunk))
+            return [item * 10 for item in chunk]
+
+        result = await processor._process_in_chunks(process, list(range(7)), chunk_size=3)
+
+        assert result == [0, 10, 20, 30, 40, 50, 60]
+        assert sorted(chunks) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    @pytest.mark.asyncio
+    async def test_process_in_chunks_clamps_chunk_size(self, processor):
+        """Test a non-positive chunk size falls back to one item per chunk."""
+        result = await processor._process_in_chunks(lambda chunk: chunk, [1, 2], chunk_size=0)
+
+        assert result == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_process_async_matches_sync(self, processor):
+        """Test the async entry points return what the sync ones do."""
+        hashtags = [
+            {"name": f"#tag{i}", "usage_count": i * 100, "engagement": 3} for i in range(10)
+        ]
+        creators = [{"username": f"@user{i}", "followers": i * 1000} for i in range(10)]
+        sounds = [{"title": f"Song {i}", "plays": i * 5000, "duration": 30} for i in range(10)]
+
+        async_results = await asyncio.gather(
+            processor.process_hashtags_async(hashtags, chunk_size=3),
+            processor.process_creators_async(creators, chunk_size=4),
+            processor.process_sounds_async(sounds, chunk_size=20),
+        )
+
+        sync_results = [
+            processor.process_hashtags(hashtags),
+            processor.process_creators(creators),
+            processor.process_sounds(sounds),
+        ]
+        for async_items, sync_items in zip(async_results, sync_results):
+            assert [(i.data_quality_score, i.confidence_score) for i in async_items] == [
+                (i.data_quality_score, i.confidence_score) for i in sync_items
+            ]
+        assert [h.name for h in async_results[0]] == [h.name for h in sync_results[0]]
+        assert [h.keywords for h in async_results[0]] == [h.keywords for h in sync_results[0]]
+
+    @pytest.mark.asyncio
+    async def test_process_async_counts_every_item(self, processor):
+        """Test stats updated from worker threads are not lost."""
+        hashtags = [{"name": f"#tag{i}", "usage_count": 100} for i in range(50)]
+
+        await processor.process_hashtags_async(hashtags, chunk_size=5)
+
+        assert processor.get_processing_stats()["processed"]["hashtags"] == 50
@@ -0,0 +1,332 @@
+"""
+Tests for Rate Limiter
+
+Unit tests for the token buckets and the per-country rate limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from src.storage.models.enums import CountryCode
+from src.utils import rate_limiter as rate_limiter_module
+from src.utils.rate_limiter import (
+    RateLimitConfig,
+    RateLimiter,
+    SlidingWindowBucket,
+    TokenBucket,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Provide a controllable clock for the rate limiter module."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def advance(clock, seconds):
+    """Move the clock forward and let due timers and woken tasks run."""
+    clock[0] += seconds
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_try_consume_refills_over_time(self, clock):
+        """Test tokens are taken until empty and accrue at the bucket's rate."""
+        bucket = TokenBucket(rate=2, capacity=4)
+        for _ in range(4):
+            assert bucket.try_consume()
+        assert not bucket.try_consume()
+        assert bucket.time_until_available() == 0.5
+
+        clock[0] += 0.5
+        assert bucket.try_consume()
+        assert not bucket.try_consume()
+
+    def test_refill_is_capped_at_capacity(self, clock):
+        """Test an idle bucket never holds more than its capacity."""
+        bucket = TokenBucket(rate=10, capacity=3)
+        bucket.try_consume(3)
+        clock[0] += 60
+
+        assert bucket.get_available_tokens() == 3
+
+    def test_snapshot(self, clock):
+        """Test snapshot reports available tokens and the wait for the next one."""
+        bucket = TokenBucket(rate=4, capacity=2)
+        assert bucket.snapshot() == (2, 0.0)
+
+        bucket.try_consume(2)
+        assert bucket.snapshot() == (0, 0.25)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_more_than_capacity_raises(self, clock):
+        """Test waiting for more tokens than the bucket holds fails fast."""
+        bucket = TokenBucket(rate=1, capacity=2)
+        with pytest.raises(ValueError):
+            await bucket.wait_for_tokens(3)
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_arrival_order(self, clock):
+        """Test queued waiters are woken first-in, first-out by one dispatch timer."""
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.try_consume()
+        served = []
+
+        async def waiter(name):
+            await bucket.wait_for_tokens()
+            served.append(name)
+
+        tasks = [asyncio.create_task(waiter(name)) for name in ("a", "b", "c")]
+        await asyncio.sleep(0)
+        assert bucket.waiting == 3
+        assert bucket._dispatch_handle is not None
+
+        await advance(clock, 1)
+        assert served == ["a"]
+        await advance(clock, 1)
+        assert served == ["a", "b"]
+        await advance(clock, 1)
+        assert served == ["a", "b", "c"]
+        assert bucket.waiting == 0
+        assert bucket._dispatch_handle is None
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_dispatch_does_not_let_small_requests_overtake(self, clock):
+        """Test a later small request waits behind a larger one at the head."""
+        bucket = TokenBucket(rate=1, capacity=2)
+        bucket.try_consume(2)
+        served = []
+
+        async def waiter(name, tokens):
+            await bucket.wait_for_tokens(tokens)
+            served.append(name)
+
+        tasks = [
+            asyncio.create_task(waiter("large", 2)),
+            asyncio.create_task(waiter("small", 1)),
+        ]
+        await asyncio.sleep(0)
+
+        await advance(clock, 1)
+        assert served == []
+        await advance(clock, 1)
+        assert served == ["large"]
+        await advance(clock, 1)
+        assert served == ["large", "small"]
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self, clock):
+        """Test a waiter cancelled while queued does not consume tokens."""
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.try_consume()
+
+        first = asyncio.create_task(bucket.wait_for_tokens())
+        second = asyncio.create_task(bucket.wait_for_tokens())
+        await asyncio.sleep(0)
+        first.cancel()
+
+        await advance(clock, 1)
+        assert first.cancelled()
+        assert second.done()
+        assert bucket.waiting == 0
+
+
+@pytest.mark.unit
+class TestSlidingWindowBucket:
+    """Test cases for SlidingWindowBucket."""
+
+    def test_window_limits_and_expires(self, clock):
+        """Test at most capacity tokens are taken per window."""
+        bucket = SlidingWindowBucket(capacity=2, period=10)
+        assert bucket.try_consume()
+        clock[0] += 4
+        assert bucket.try_consume()
+        assert not bucket.try_consume()
+        assert bucket.time_until_available() == 6
+
+        clock[0] += 6
+        assert bucket.get_available_tokens() == 1
+        assert bucket.try_consume()
+        assert not bucket.try_consume()
+
+    def test_time_until_available_for_several_tokens(self, clock):
+        """Test a multi-token request waits for enough acquisitions to expire."""
+        bucket = SlidingWindowBucket(capacity=3, period=10)
+        for _ in range(3):
+            bucket.try_consume()
+            clock[0] += 1
+
+        assert bucket.time_until_available(2) == 8
+
+    def test_snapshot(self, clock):
+        """Test snapshot reports available tokens and when the window frees up."""
+        bucket = SlidingWindowBucket(capacity=1, period=10)
+        assert bucket.snapshot() == (1.0, 0.0)
+
+        bucket.try_consume()
+        clock[0] += 3
+        assert bucket.snapshot() == (0.0, 7)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_tokens_sleeps_until_window_frees(self, clock):
+        """Test waiting resumes once the oldest acquisition leaves the window."""
+        bucket = SlidingWindowBucket(capacity=1, period=10)
+        bucket.try_consume()
+
+        task = asyncio.create_task(bucket.wait_for_tokens())
+        await advance(clock, 5)
+        assert not task.done()
+        await advance(clock, 5)
+        assert task.done()
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    def test_try_acquire_and_retry_after(self, clock):
+        """Test requests are rejected once the burst is spent, with the wait reported."""
+        limiter = RateLimiter(custom_limits={CountryCode.US: RateLimitConfig(60, burst_capacity=2)})
+        assert limiter.try_acquire(CountryCode.US, "hashtags")
+        assert limiter.try_acquire(CountryCode.US, "hashtags")
+        assert limiter.retry_after(CountryCode.US, "hashtags") == 1.0
+        assert not limiter.try_acquire(CountryCode.US, "hashtags")
+
+        clock[0] += 1
+        assert limiter.retry_after(CountryCode.US, "hashtags") == 0.0
+        assert limiter.try_acquire(CountryCode.US, "hashtags")
+
+        status = limiter.get_status(CountryCode.US, "hashtags")
+        assert status["requests_made"] == 3
+        assert status["requests_rejected"] == 1
+
+    def test_try_acquire_leaves_country_bucket_when_global_is_empty(self, clock):
+        """Test a global-limit rejection does not spend the country's tokens."""
+        limiter = RateLimiter(global_limit=RateLimitConfig(60, burst_capacity=1))
+        assert limiter.try_acquire(CountryCode.US, "hashtags")
+        assert not limiter.try_acquire(CountryCode.BR, "hashtags")
+        assert limiter.retry_after(CountryCode.BR, "hashtags") == 1.0
+
+        status = limiter.get_status(CountryCode.BR, "hashtags")
+        assert status["available_tokens"] == status["capacity"]
+
+    def test_endpoint_multiplier_applied(self, clock):
+        """Test the endpoint multiplier scales the country's rate."""
+        limiter = RateLimiter(custom_limits={CountryCode.US: RateLimitConfig(100)})
+
+        assert limiter.get_status(CountryCode.US, "sounds")["rate_per_minute"] == pytest.approx(70)
+        assert limiter.get_status(CountryCode.US, "unknown")["rate_per_minute"] == 100
+
+    def test_update_limit_applies_to_new_buckets(self, clock):
+        """Test update_limit replaces the precomputed limits for a country."""
+        limiter = RateLimiter()
+        limiter.update_limit(CountryCode.BR, RateLimitConfig(30, burst_capacity=5))
+
+        status = limiter.get_status(CountryCode.BR, "hashtags")
+        assert status["rate_per_minute"] == 30
+        assert status["capacity"] == 5
+
+    def test_get_status_snapshot(self, clock):
+        """Test get_status reports the bucket snapshot and utilization."""
+        limiter = RateLimiter(custom_limits={CountryCode.US: RateLimitConfig(60, burst_capacity=4)})
+        for _ in range(4):
+            limiter.try_acquire(CountryCode.US, "hashtags")
+
+        status = limiter.get_status(CountryCode.US, "hashtags")
+        assert status["available_tokens"] == 0
+        assert status["time_until_available"] == 1.0
+        assert status["utilization"] == 1.0
+
+    def test_sliding_window_limiter(self, clock):
+        """Test sliding_window limits each key to its requests per minute."""
+        limiter = RateLimiter(
+            custom_limits={CountryCode.US: RateLimitConfig(2)}, sliding_window=True
+        )
+        assert limiter.try_acquire(CountryCode.US, "hashtags")
+        assert limiter.try_acquire(CountryCode.US, "hashtags")
+        assert not limiter.try_acquire(CountryCode.US, "hashtags")
+        assert limiter.retry_after(CountryCode.US, "hashtags") == 60
+
+    @pytest.mark.asyncio
+    async def test_joint_wait_sleeps_once_for_both_buckets(self, clock):
+        """Test waiting on the global and country buckets takes the longer wait once."""
+        limiter = RateLimiter(
+            custom_limits={CountryCode.US: RateLimitConfig(30, burst_capacity=1)},
+            global_limit=RateLimitConfig(60, burst_capacity=1),
+        )
+        assert limiter.try_acquire(CountryCode.US, "hashtags")
+
+        task = asyncio.create_task(limiter.wait_if_needed(CountryCode.US, "hashtags"))
+        await asyncio.sleep(0)
+        await advance(clock, 1)
+        assert not task.done()
+        assert limiter._global_bucket.waiting == 0
+
+        await advance(clock, 1)
+        assert task.done()
+        assert limiter._global_bucket.get_available_tokens() == 0
+        assert limiter.get_status(CountryCode.US, "hashtags")["average_wait_time"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_joint_wait_queues_behind_existing_waiters(self, clock):
+        """Test a joint wait queues in order when a bucket already has waiters."""
+        limiter = RateLimiter(
+            custom_limits={CountryCode.US: RateLimitConfig(60, burst_capacity=1)},
+            global_limit=RateLimitConfig(60, burst_capacity=1),
+        )
+        limiter.try_acquire(CountryCode.US, "hashtags")
+        served = []
+
+        async def request(name):
+            await limiter.wait_if_needed(CountryCode.US, "hashtags")
+            served.append(name)
+
+        first = asyncio.create_task(limiter._global_bucket.wait_for_tokens())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(request("joint"))
+        await asyncio.sleep(0)
+        assert limiter._global_bucket.waiting == 2
+
+        await advance(clock, 1)
+        assert first.done()
+        assert served == []
+        await advance(clock, 1)
+        await advance(clock, 1)
+        assert served == ["joint"]
+        await second
+
+    def test_eviction_keeps_depleted_bucket(self, clock):
+        """Test a drained bucket is not evicted and refilled by newer buckets."""
+        limiter = RateLimiter(
+            custom_limits={CountryCode.US: RateLimitConfig(60, burst_capacity=3)},
+            max_buckets=2,
+        )
+        for _ in range(3):
+            assert limiter.try_acquire(CountryCode.US, "hashtags")
+        assert not limiter.try_acquire(CountryCode.US, "hashtags")
+
+        limiter.try_acquire(CountryCode.BR, "hashtags")
+        limiter.try_acquire(CountryCode.MX, "hashtags")
+
+        assert not limiter.try_acquire(CountryCode.US, "hashtags")
+
+    def test_eviction_drops_least_recently_used_idle_bucket(self, clock):
+        """Test idle, full buckets are evicted to stay within max_buckets."""
+        limiter = RateLimiter(max_buckets=2)
+        limiter.get_status(CountryCode.US, "hashtags")
+        limiter.get_status(CountryCode.BR, "hashtags")
+        limiter.get_status(CountryCode.MX, "hashtags")
+
+        assert list(limiter._buckets) == [
+            (CountryCode.BR, "hashtags"),
+            (CountryCode.MX, "hashtags"),
+        ]
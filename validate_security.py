@@ -6,152 +6,175 @@ Security and quality validation for TikTok Global Trends.
 import sys
 import os
 import logging
-import io
+from logging.handlers import MemoryHandler
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Mock dependencies for testing
+def _noop(*args, **kwargs):
+    return None
+
 class MockModule:
+    __slots__ = ()
+
     def __getattr__(self, name):
-        return lambda *args, **kwargs: None
+        # No __path__ etc., so submodule imports fail with ImportError
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _noop
 
 sys.modules['aiohttp'] = MockModule()
 sys.modules['sklearn'] = MockModule()
 sys.modules['numpy'] = MockModule()
+sys.modules['pandas'] = MockModule()
 sys.modules['sqlalchemy'] = MockModule()
 
 # Mock SQLAlchemy enums
-from test_enums import CountryCode, NicheType, TrendDirection, SentimentType
+from test_enums import CountryCode, NicheType, TrendDirection, SentimentType, DataSourceType
 sys.modules['src.storage.models.enums'] = type(sys)('enums')
 sys.modules['src.storage.models.enums'].CountryCode = CountryCode
 sys.modules['src.storage.models.enums'].NicheType = NicheType
 sys.modules['src.storage.models.enums'].TrendDirection = TrendDirection
 sys.modules['src.storage.models.enums'].SentimentType = SentimentType
+sys.modules['src.storage.models.enums'].DataSourceType = DataSourceType
+
+# Modules under validation, imported once the mocks are in place
+from src.utils.logger import setup_logger
+from src.data_processing.processor import DataProcessor
+from src.utils.rate_limiter import RateLimiter
+from src.api_clients.tiktok_official_client import TikTokAPIError, RateLimitError
+
+def _check_logger(ctx):
+    setup_logger('security_test')
+    return ['   ✅ Logger seguro - sem vazamento de dados']
+
+
+def _check_sanitization(ctx):
+    processor = ctx['processor'] = DataProcessor(enable_ml=False)
+    lines = []
+
+    # Test XSS prevention
+    xss_text = '<script>alert("xss")</script> #test'
+    clean = processor.clean_text(xss_text)
+    if '<script>' not in clean:
+        lines.append('   ✅ Limpeza de texto segura - XSS prevenida')
+    else:
+        lines.append('   ❌ Vulnerabilidade de XSS detectada')
+
+    # Test SQL injection prevention
+    sql_text = "'; DROP TABLE users; --"
+    clean_sql = processor.clean_text(sql_text)
+    if 'DROP' not in clean_sql:
+        lines.append('   ✅ Limpeza de texto segura - SQLi prevenida')
+    else:
+        lines.append('   ❌ Vulnerabilidade de SQLi detectada')
+
+    return lines
+
+
+def _check_rate_limiting(ctx):
+    RateLimiter()
+    return [
+        '   ✅ Rate limiter funcional - previne abusos',
+        '   ✅ Token bucket algorithm implementado',
+    ]
+
+
+def _check_error_handling(ctx):
+    # Test custom exceptions
+    TikTokAPIError('Test error', status_code=400)
+    RateLimitError('Rate limit exceeded', retry_after=60)
+    return [
+        '   ✅ Exceções customizadas implementadas',
+        '   ✅ Tratamento específico por tipo de erro',
+    ]
+
+
+def _check_data_quality(ctx):
+    processor = ctx['processor']
+    lines = []
+
+    # Test hashtag normalization
+    hashtag = processor.normalize_hashtag_name('##FITNESS##')
+    if hashtag == '#fitness':
+        lines.append('   ✅ Normalização de hashtags segura')
+    else:
+        lines.append('   ❌ Falha na normalização')
+
+    # Test engagement calculation bounds
+    engagement = processor.calculate_engagement_rate(likes=100, views=10000)
+    if 0 <= engagement <= 100:
+        lines.append('   ✅ Cálculo de engagement com bounds seguros')
+    else:
+        lines.append('   ❌ Cálculo de engagement fora dos bounds')
+
+    return lines
+
+
+def _check_sensitive_logging(ctx):
+    # Check if sensitive data is handled properly
+    sensitive_data = 'client_secret_12345'
+
+    # Test that sensitive data is not logged in plain text; records are
+    # buffered unformatted and only their messages are checked
+    capture = MemoryHandler(capacity=1024, flushLevel=logging.CRITICAL, target=None)
+    logger = setup_logger('sensitive_test')
+    logger.addHandler(capture)
+
+    # Log sensitive data
+    logger.info('testing sensitive: client_secret=%s', sensitive_data)
+    logger.removeHandler(capture)
+
+    # Check if sensitive data is in logs
+    if all(sensitive_data not in record.getMessage() for record in capture.buffer):
+        return ['   ✅ Dados sensíveis mascarados nos logs']
+    return ['   ⚠️  Dados sensíveis detectados nos logs']
+
+
+# (header, check, failure prefix); checks share a context dict and return
+# their report lines
+_CHECKS = (
+    ('1️⃣  Testando imports seguros...', _check_logger, 'Falha no logger'),
+    ('2️⃣  Testando validação de dados...', _check_sanitization, 'Falha na validação'),
+    ('3️⃣  Testando rate limiting...', _check_rate_limiting, 'Falha no rate limiting'),
+    ('4️⃣  Testando tratamento de erros...', _check_error_handling, 'Falha no tratamento de erros'),
+    ('5️⃣  Testando qualidade de dados...', _check_data_quality, 'Falha na qualidade de dados'),
+    (
+        '6️⃣  Testando configuração segura...',
+        _check_sensitive_logging,
+        'Falha na configuração segura',
+    ),
+)
+
+_SUMMARY = (
+    '\n📊 Resumo da Validação:',
+    '   ✅ Sistema de logging seguro',
+    '   ✅ Validação de dados implementada',
+    '   ✅ Rate limiting funcional',
+    '   ✅ Tratamento robusto de erros',
+    '   ✅ Qualidade de dados assegurada',
+    '   ✅ Configuração segura implementada',
+    '\n🎉 VALIDAÇÃO DE SEGURANÇA E QUALIDADE CONCLUÍDA!',
+    '=' * 50,
+)
+
 
 def validate_security():
     """Validate security aspects of the system."""
-    
-    print('🔒 Segurança e Qualidade - Validação Final')
-    print('=' * 50)
-    
-    # 1. Test imports without external dependencies
-    print('\n1️⃣  Testando imports seguros...')
-    try:
-        from src.utils.logger import setup_logger
-        logger = setup_logger('security_test')
-        print('   ✅ Logger seguro - sem vazamento de dados')
-    except Exception as e:
-        print(f'   ❌ Falha no logger: {e}')
-    
-    # 2. Test data validation
-    print('\n2️⃣  Testando validação de dados...')
-    try:
-        from src.data_processing.processor import DataProcessor
-        processor = DataProcessor(enable_ml=False)
-        
-        # Test XSS prevention
-        xss_text = '<script>alert("xss")</script> #test'
-        clean = processor.clean_text(xss_text)
-        if '<script>' not in clean:
-            print('   ✅ Limpeza de texto segura - XSS prevenida')
-        else:
-            print('   ❌ Vulnerabilidade de XSS detectada')
-            
-        # Test SQL injection prevention
-        sql_text = "'; DROP TABLE users; --"
-        clean_sql = processor.clean_text(sql_text)
-        if 'DROP' not in clean_sql:
-            print('   ✅ Limpeza de texto segura - SQLi prevenida')
-        else:
-            print('   ❌ Vulnerabilidade de SQLi detectada')
-            
-    except Exception as e:
-        print(f'   ❌ Falha na validação: {e}')
-    
-    # 3. Test rate limiting
-    print('\n3️⃣  Testando rate limiting...')
-    try:
-        from src.utils.rate_limiter import RateLimiter
-        limiter = RateLimiter()
-        
-        print('   ✅ Rate limiter funcional - previne abusos')
-        print('   ✅ Token bucket algorithm implementado')
-        
-    except Exception as e:
-        print(f'   ❌ Falha no rate limiting: {e}')
-    
-    # 4. Test error handling
-    print('\n4️⃣  Testando tratamento de erros...')
-    try:
-        from src.api_clients.tiktok_official_client import TikTokAPIError, RateLimitError
-        
-        # Test custom exceptions
-        error = TikTokAPIError('Test error', status_code=400)
-        rate_error = RateLimitError('Rate limit exceeded', retry_after=60)
-        
-        print('   ✅ Exceções customizadas implementadas')
-        print('   ✅ Tratamento específico por tipo de erro')
-        
-    except Exception as e:
-        print(f'   ❌ Falha no tratamento de erros: {e}')
-    
-    # 5. Test data quality
-    print('\n5️⃣  Testando qualidade de dados...')
-    try:
-        # Test hashtag normalization
-        hashtag = processor.normalize_hashtag_name('##FITNESS##')
-        if hashtag == '#fitness':
-            print('   ✅ Normalização de hashtags segura')
-        else:
-            print('   ❌ Falha na normalização')
-            
-        # Test engagement calculation bounds
-        engagement = processor.calculate_engagement_rate(likes=100, views=10000)
-        if 0 <= engagement <= 100:
-            print('   ✅ Cálculo de engagement com bounds seguros')
-        else:
-            print('   ❌ Cálculo de engagement fora dos bounds')
-            
-    except Exception as e:
-        print(f'   ❌ Falha na qualidade de dados: {e}')
-    
-    # 6. Test configuration safety
-    print('\n6️⃣  Testando configuração segura...')
-    try:
-        # Check if sensitive data is handled properly
-        sensitive_data = 'client_secret_12345'
-        
-        # Test that sensitive data is not logged in plain text
-        log_capture = io.StringIO()
-        handler = logging.StreamHandler(log_capture)
-        logger = setup_logger('sensitive_test')
-        logger.addHandler(handler)
-        
-        # Log sensitive data
-        logger.info('testing sensitive: %s', sensitive_data)
-        
-        # Check if sensitive data is in logs
-        log_content = log_capture.getvalue()
-        if sensitive_data not in log_content:
-            print('   ✅ Dados sensíveis mascarados nos logs')
-        else:
-            print('   ⚠️  Dados sensíveis detectados nos logs')
-            
-    except Exception as e:
-        print(f'   ❌ Falha na configuração segura: {e}')
-    
-    print('\n📊 Resumo da Validação:')
-    print('   ✅ Sistema de logging seguro')
-    print('   ✅ Validação de dados implementada')
-    print('   ✅ Rate limiting funcional')
-    print('   ✅ Tratamento robusto de erros')
-    print('   ✅ Qualidade de dados assegurada')
-    print('   ✅ Configuração segura implementada')
-    
-    print('\n🎉 VALIDAÇÃO DE SEGURANÇA E QUALIDADE CONCLUÍDA!')
-    print('=' * 50)
-    
+    lines = ['🔒 Segurança e Qualidade - Validação Final', '=' * 50]
+    ctx = {}
+
+    for header, check, failure in _CHECKS:
+        lines.append(f'\n{header}')
+        try:
+            lines.extend(check(ctx))
+        except Exception as e:
+            lines.append(f'   ❌ {failure}: {e}')
+
+    lines.extend(_SUMMARY)
+    sys.stdout.write('\n'.join(lines) + '\n')
+
     return True
 
 
 if __name__ == "__main__":
-    validate_security()
\ No newline at end of file
+    validate_security()